@@ -1,18 +1,15 @@
 """Entry point for the project."""
 
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from typeguard import typechecked
 
 from hledger_plot.arg_parser import create_arg_parser, verify_args
-from hledger_plot.create_plots.manage_plotting import manage_plotting
-from hledger_plot.create_plots.scrambler import (
-    get_rand_categories,
-)
 from hledger_plot.HledgerCategories import HledgerCategories
-from hledger_plot.journal_parsing.get_top_level_domains import (
-    get_top_level_account_categories,
-)
+
+if TYPE_CHECKING:
+    # Imported on demand, because the scrambler imports pandas.
+    from hledger_plot.create_plots.scrambler import Pseudonymizer
 
 
 @typechecked
@@ -27,31 +24,50 @@ def main() -> None:
     hledgerCategories: HledgerCategories = HledgerCategories.from_args(
         args=args
     )
-    random_wordlist_filepath: str = "random_categories.txt"
-    random_words = get_rand_categories(
-        random_wordlist_filepath=random_wordlist_filepath
+
+    # The plotting modules import pandas and plotly, so they are only
+    # imported once there is something to plot. This keeps --help and invalid
+    # args fast.
+    from hledger_plot.batch import (
+        get_batch_journal_filepaths,
+        print_batch_summary,
+        process_journal_batch,
     )
+    from hledger_plot.create_plots.manage_plotting import process_journal
+
+    pseudonymizer: Optional[Pseudonymizer] = None
+    if args.randomize:
+        from hledger_plot.create_plots.scrambler import create_pseudonymizer
+
+        pseudonymizer = create_pseudonymizer(args=args)
 
     if args.journal_filepath:
-        top_level_account_categories: List[str] = (
-            get_top_level_account_categories(
-                journal_filepath=args.journal_filepath
-            )
-        )
-        print(
-            "The top_level_account_categories found in your journals"
-            f" are:\n{top_level_account_categories}"
-        )
-        manage_plotting(
+        process_journal(
             args=args,
             journal_filepath=args.journal_filepath,
-            top_level_account_categories=top_level_account_categories,
             hledgerCategories=hledgerCategories,
-            random_words=random_words,
+            pseudonymizer=pseudonymizer,
             separator=separator,
         )
+        if pseudonymizer is not None:
+            pseudonymizer.store()
         exit()
+    elif args.journal_glob or args.journal_manifest:
+        journal_filepaths: List[str] = get_batch_journal_filepaths(
+            journal_glob=args.journal_glob,
+            journal_manifest=args.journal_manifest,
+        )
+        journal_errors: Dict[str, Optional[str]] = process_journal_batch(
+            args=args,
+            journal_filepaths=journal_filepaths,
+            hledgerCategories=hledgerCategories,
+            pseudonymizer=pseudonymizer,
+            separator=separator,
+        )
+        print_batch_summary(journal_errors=journal_errors)
+        exit(1 if any(journal_errors.values()) else 0)
     else:
         raise ValueError(
-            "Did not receive --journal-filepath, so won't do anything."
+            "Did not receive --journal-filepath, --journal-glob or"
+            " --journal-manifest, so won't do anything."
         )
@@ -0,0 +1,104 @@
+"""Aggregates values over the hledger account tree."""
+
+import pandas as pd
+from pandas.core.series import Series
+from typeguard import typechecked
+
+
+@typechecked
+def get_subtree_sums(*, accounts: Series, values: Series) -> Series:
+    """Returns, for each account, the sum of its own value and the values of
+    all its descendant accounts.
+
+    Every account is expanded once into its chain of ancestors, e.g.
+    assets:bank:savings into assets:bank:savings, assets:bank and assets, after
+    which one group-by sums the values per ancestor. This is linear in the
+    number of accounts times the account depth. A value only reaches the
+    ancestors above a missing intermediate account if that account is in
+    accounts, like adding each account to its parent bottom-up would.
+
+    Args:
+        accounts: Full account names, like assets:bank:savings, without
+        duplicates.
+        values: The value of each account, with the same index as accounts.
+
+    Returns:
+        The subtree sums, with the same index as accounts.
+    """
+    if (accounts == "").any():
+        raise ValueError("Empty categories not supported.")
+
+    segments: Series = accounts.str.split(":")
+    depths: Series = segments.str.len()
+    ancestors = [pd.DataFrame({"ancestor": accounts, "value": values})]
+    # Whether the chain from the account up to the current ancestor is intact.
+    is_connected: Series = depths > 1
+    for distance in range(1, int(depths.max()) if len(depths) else 0):
+        is_connected &= depths > distance
+        if not is_connected.any():
+            break
+        ancestor: Series = (
+            segments[is_connected]
+            .str[:-distance]
+            .str.join(":")
+            .reindex(accounts.index)
+        )
+        is_connected &= ancestor.isin(accounts)
+        ancestors.append(
+            pd.DataFrame(
+                {
+                    "ancestor": ancestor[is_connected],
+                    "value": values[is_connected],
+                }
+            )
+        )
+
+    subtree_sums: Series = (
+        pd.concat(ancestors).groupby("ancestor", sort=False)["value"].sum()
+    )
+    return accounts.map(subtree_sums)
+
+
+@typechecked
+def get_tree_balances(*, account_balances: Series) -> Series:
+    """Returns the inclusive balance of every account and all its ancestors,
+    like the --tree --no-elide balance report of hledger.
+
+    Args:
+        account_balances: The balance of each account that has postings,
+        indexed by the full account name.
+
+    Returns:
+        The sum of the balances of each account and its subaccounts, indexed
+        by the account and all its ancestors, sorted by account segments.
+    """
+    accounts: Series = pd.Series(account_balances.index, dtype=object)
+    segments: Series = accounts.str.split(":")
+    depths: Series = segments.str.len()
+    ancestor_balances = []
+    for level in range(1, int(depths.max()) + 1 if len(depths) else 1):
+        is_deep_enough: Series = depths >= level
+        ancestor_balances.append(
+            pd.DataFrame(
+                {
+                    "account": segments[is_deep_enough]
+                    .str[:level]
+                    .str.join(":")
+                    .to_numpy(),
+                    "balance": account_balances.to_numpy()[
+                        is_deep_enough.to_numpy()
+                    ],
+                }
+            )
+        )
+    if not ancestor_balances:
+        return pd.Series(dtype=float)
+
+    tree_balances: Series = (
+        pd.concat(ancestor_balances)
+        .groupby("account", sort=False)["balance"]
+        .sum()
+    )
+    return tree_balances[
+        sorted(tree_balances.index, key=lambda account: account.split(":"))
+    ]
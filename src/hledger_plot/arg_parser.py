@@ -3,10 +3,17 @@
 import argparse
 import re
 from argparse import ArgumentParser
-from typing import Any
+from typing import Any, List
 
 from typeguard import typechecked
 
+# The static image formats that Kaleido can export.
+export_formats: List[str] = ["png", "jpeg", "webp", "svg", "pdf"]
+
+# The names of the strategies in create_plots.sankey_layout.sankey_layouts.
+# They are listed here, such that parsing the args does not import numpy.
+sankey_layout_names: List[str] = ["layered", "plotly"]
+
 
 @typechecked
 def create_arg_parser() -> argparse.ArgumentParser:
@@ -79,6 +86,33 @@ def create_arg_parser() -> argparse.ArgumentParser:
         type=str,
         help="Specify the path to the input journal file.",
     )
+    parser.add_argument(
+        "--journal-glob",
+        type=str,
+        required=False,
+        help=(
+            "Batch mode: plot every journal file that matches this glob"
+            " pattern, e.g. 'households/**/*.journal'."
+        ),
+    )
+    parser.add_argument(
+        "--journal-manifest",
+        type=str,
+        required=False,
+        help=(
+            "Batch mode: plot every journal file listed in this text file, one"
+            " path per line. Relative paths are relative to the manifest."
+        ),
+    )
+    parser.add_argument(
+        "--batch-workers",
+        type=int,
+        required=False,
+        help=(
+            "(Default/empty=nr. of CPUs). Maximum number of journals that are"
+            " processed concurrently in batch mode."
+        ),
+    )
     # Where to find the relevant data if no input file is given.
     parser.add_argument(
         "-a",
@@ -111,6 +145,23 @@ def create_arg_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Export Sankey diagram to file.",
     )
+    parser.add_argument(
+        "--export-formats",
+        type=str,
+        nargs="+",
+        choices=export_formats,
+        default=["png"],
+        help="Image formats in which the plots are exported.",
+    )
+    parser.add_argument(
+        "--export-workers",
+        type=int,
+        required=False,
+        help=(
+            "(Default/empty=nr. of CPUs, at most one per 4 images). Maximum"
+            " number of processes that export the plots concurrently."
+        ),
+    )
     parser.add_argument(
         "-s",
         "--show-plots",
@@ -133,6 +184,158 @@ def create_arg_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Obvuscates data for demo purposes using randomization.",
     )
+    parser.add_argument(
+        "--random-seed",
+        type=int,
+        required=False,
+        help=(
+            "Seed of the --randomize randomization, such that the same seed"
+            " gives the same obfuscated plots."
+        ),
+    )
+    parser.add_argument(
+        "--randomize-key",
+        type=str,
+        required=False,
+        help=(
+            "Secret key from which --randomize derives the pseudonyms of the"
+            " accounts, such that the same key gives the same pseudonyms."
+        ),
+    )
+    parser.add_argument(
+        "--randomize-map-filepath",
+        type=str,
+        required=False,
+        help=(
+            "JSON file in which the --randomize pseudonyms are kept, such"
+            " that accounts keep their pseudonym across runs. Batch runs only"
+            " read it. Requires --randomize-key."
+        ),
+    )
+
+    parser.add_argument(
+        "--max-depth",
+        type=int,
+        required=False,
+        help=(
+            "Only plot the accounts up to this depth, e.g. 2 shows"
+            " expenses:food but not expenses:food:groceries."
+        ),
+    )
+    parser.add_argument(
+        "--sankey-layout",
+        type=str,
+        choices=sankey_layout_names,
+        default="layered",
+        help=(
+            "How the Sankey nodes are positioned: layered computes the"
+            " positions up front, plotly lets the browser arrange them."
+        ),
+    )
+
+    parser.add_argument(
+        "--sankey-min-percentage",
+        type=float,
+        default=0,
+        help=(
+            "Collapse Sankey flows smaller than this percentage of the flows"
+            " of their parent account into <parent>:other."
+        ),
+    )
+    parser.add_argument(
+        "--sankey-min-value",
+        type=float,
+        default=0,
+        help="Collapse Sankey flows smaller than this into <parent>:other.",
+    )
+    parser.add_argument(
+        "--sankey-top-n",
+        type=int,
+        required=False,
+        help=(
+            "Only show the N largest Sankey flows per parent account, and"
+            " collapse the others into <parent>:other."
+        ),
+    )
+
+    parser.add_argument(
+        "--hledger-output-format",
+        type=str,
+        choices=["json", "csv"],
+        default="json",
+        help=(
+            "The output format in which the balances are read from hledger."
+            " json gives exact amounts, csv is for old hledger versions."
+        ),
+    )
+    parser.add_argument(
+        "--balance-backend",
+        type=str,
+        choices=["hledger", "python"],
+        default="hledger",
+        help=(
+            "How the balances are computed. python sums the postings of the"
+            " journal in-process, such that hledger is not needed, but only"
+            " converts amounts with @ or @@ prices to the display currency."
+        ),
+    )
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=1,
+        help=(
+            "(Default=1). With --balance-backend python, the included journal"
+            " files that include nothing themselves are parsed in this many"
+            " processes. 0 means the nr. of CPUs."
+        ),
+    )
+    parser.add_argument(
+        "--parse-index-dir",
+        type=str,
+        required=False,
+        help=(
+            "(Default/empty=no index). With --balance-backend python, the"
+            " parsed journal files are indexed in this directory, such that"
+            " the next run only parses what was appended to them."
+        ),
+    )
+    parser.add_argument(
+        "--exclude-opening-balances",
+        action="store_true",
+        help=(
+            "Leave out the transactions whose description contains"
+            " 'opening', such that the balances are the changes within the"
+            " journal."
+        ),
+    )
+
+    # Cache arguments.
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always call hledger, instead of reusing its cached output.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        required=False,
+        help=(
+            "(Default/empty=~/.cache/hledger_plot). Directory in which the"
+            " hledger output is cached."
+        ),
+    )
+    parser.add_argument(
+        "--cache-max-size-mb",
+        type=float,
+        default=256,
+        help="Maximum size of the hledger output cache in MB.",
+    )
+    parser.add_argument(
+        "--cache-max-age-days",
+        type=float,
+        default=30,
+        help="Cached hledger output older than this is discarded.",
+    )
 
     parser.add_argument(
         "-v",
@@ -174,6 +377,42 @@ def verify_args(*, parser: ArgumentParser) -> Any:
                 "You gave a journal filepath and account_holder/bankPlesase do"
                 " 1 thing at a time."
             )
+    if args.journal_glob or args.journal_manifest:
+        if (
+            sum(
+                bool(journal_arg)
+                for journal_arg in [
+                    args.journal_filepath,
+                    args.journal_glob,
+                    args.journal_manifest,
+                ]
+            )
+            > 1
+        ):
+            raise ValueError(
+                "Please specify only one of --journal-filepath, --journal-glob"
+                " and --journal-manifest."
+            )
+        if args.show_plots:
+            raise ValueError(
+                "Batch mode exports the plots, it cannot --show-plots."
+            )
+    if args.batch_workers is not None and args.batch_workers < 1:
+        raise ValueError("The --batch-workers should be at least 1.")
+    if args.export_workers is not None and args.export_workers < 1:
+        raise ValueError("The --export-workers should be at least 1.")
+    if args.max_depth is not None and args.max_depth < 1:
+        raise ValueError("The --max-depth should be at least 1.")
+    if args.parse_workers < 0:
+        raise ValueError("The --parse-workers should be at least 0.")
+    if args.sankey_top_n is not None and args.sankey_top_n < 1:
+        raise ValueError("The --sankey-top-n should be at least 1.")
+    if args.randomize_map_filepath and args.randomize_key is None:
+        # The map file keeps the pseudonyms, and a key derived from the
+        # --random-seed would let anyone with the seed trace them back.
+        raise ValueError(
+            "The --randomize-map-filepath requires a secret --randomize-key."
+        )
 
     return args
 
@@ -0,0 +1,193 @@
+"""Caches the hledger balance report output on disk.
+
+The cache key contains the hledger command line, the hledger executable, and
+the size, modification time and content hash of the journal and every file it
+includes. An entry is therefore only reused if none of the journal files
+changed since hledger computed it.
+"""
+
+import hashlib
+import os
+import shutil
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from typeguard import typechecked
+
+from hledger_plot.journal_parsing.include_tree import (
+    get_include_tree_filepaths,
+)
+
+# The hledger output formats that are cached, each entry is named after the
+# format of its output, e.g. <cache_key>.json.
+cache_output_formats: Tuple[str, ...] = ("json", "csv")
+
+
+@typechecked
+def get_default_cache_dir() -> str:
+    return os.path.join(
+        os.environ.get(
+            "XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")
+        ),
+        "hledger_plot",
+    )
+
+
+@typechecked
+def get_cache_key(*, command: List[str], journal_filepath: str) -> str:
+    """Returns the content-addressed cache key of a hledger command.
+
+    Args:
+        command: The hledger command line.
+        journal_filepath: The journal that the command reads.
+
+    Returns:
+        A hex digest that changes if the command, the hledger executable or
+        any file of the include tree of the journal changes.
+    """
+    key_hash = hashlib.sha256()
+    key_hash.update("\0".join(command).encode("utf-8"))
+
+    hledger_path: Optional[str] = shutil.which(command[0])
+    if hledger_path is not None:
+        hledger_stat = os.stat(hledger_path)
+        key_hash.update(
+            f"\0{hledger_path}\0{hledger_stat.st_size}"
+            f"\0{hledger_stat.st_mtime_ns}".encode("utf-8")
+        )
+
+    for filepath in get_include_tree_filepaths(
+        journal_filepath=journal_filepath
+    ):
+        file_stat = os.stat(filepath)
+        key_hash.update(
+            f"\0{os.path.abspath(filepath)}\0{file_stat.st_size}"
+            f"\0{file_stat.st_mtime_ns}\0".encode("utf-8")
+        )
+        key_hash.update(get_file_hash(filepath=filepath).encode("utf-8"))
+    return key_hash.hexdigest()
+
+
+@typechecked
+def get_file_hash(*, filepath: str) -> str:
+    file_hash = hashlib.sha256()
+    with open(filepath, "rb") as some_file:
+        for chunk in iter(lambda: some_file.read(1024 * 1024), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+@typechecked
+def load_cached_output(
+    *,
+    cache_dir: str,
+    cache_key: str,
+    output_format: str,
+    max_age_seconds: float,
+) -> Optional[str]:
+    """Returns the cached hledger output, or None if there is no fresh cache
+    entry for the cache_key."""
+    cache_filepath: str = get_cache_filepath(
+        cache_dir=cache_dir, cache_key=cache_key, output_format=output_format
+    )
+    if not os.path.isfile(cache_filepath):
+        return None
+    if time.time() - os.path.getmtime(cache_filepath) > max_age_seconds:
+        remove_cache_file(cache_filepath=cache_filepath)
+        return None
+
+    with open(cache_filepath, encoding="utf-8") as cache_file:
+        output: str = cache_file.read()
+    # Mark the entry as recently used, such that eviction removes it last.
+    os.utime(cache_filepath)
+    return output
+
+
+@typechecked
+def store_cached_output(
+    *,
+    cache_dir: str,
+    cache_key: str,
+    output_format: str,
+    output: str,
+    max_size_bytes: int,
+    max_age_seconds: float,
+) -> None:
+    os.makedirs(cache_dir, exist_ok=True)
+    cache_filepath: str = get_cache_filepath(
+        cache_dir=cache_dir, cache_key=cache_key, output_format=output_format
+    )
+    # Write to a temporary file first, such that concurrent runs never read a
+    # partially written entry.
+    tmp_filepath: str = (
+        f"{cache_filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    try:
+        with open(tmp_filepath, "w", encoding="utf-8") as cache_file:
+            cache_file.write(output)
+        os.replace(tmp_filepath, cache_filepath)
+    except OSError:
+        # E.g. a full disk, do not leave the partial entry behind.
+        remove_cache_file(cache_filepath=tmp_filepath)
+        raise
+
+    evict_cache_entries(
+        cache_dir=cache_dir,
+        max_size_bytes=max_size_bytes,
+        max_age_seconds=max_age_seconds,
+    )
+
+
+@typechecked
+def evict_cache_entries(
+    *, cache_dir: str, max_size_bytes: int, max_age_seconds: float
+) -> None:
+    """Removes the cache entries that are older than max_age_seconds, and then
+    the least recently used entries until the cache fits in max_size_bytes."""
+    now: float = time.time()
+    entries: List[Tuple[float, int, str]] = []
+    for filename in os.listdir(cache_dir):
+        if not filename.endswith(
+            tuple(f".{output_format}" for output_format in cache_output_formats)
+        ):
+            continue
+        cache_filepath: str = os.path.join(cache_dir, filename)
+        try:
+            cache_stat = os.stat(cache_filepath)
+        except FileNotFoundError:
+            # Another run evicted it in the meantime.
+            continue
+        if now - cache_stat.st_mtime > max_age_seconds:
+            remove_cache_file(cache_filepath=cache_filepath)
+        else:
+            entries.append(
+                (cache_stat.st_mtime, cache_stat.st_size, cache_filepath)
+            )
+
+    total_size: int = sum(size for _, size, _ in entries)
+    for _, size, cache_filepath in sorted(entries):
+        if total_size <= max_size_bytes:
+            break
+        remove_cache_file(cache_filepath=cache_filepath)
+        total_size -= size
+
+
+@typechecked
+def remove_cache_file(*, cache_filepath: str) -> None:
+    try:
+        os.remove(cache_filepath)
+    except FileNotFoundError:
+        pass
+
+
+@typechecked
+def get_cache_filepath(
+    *, cache_dir: str, cache_key: str, output_format: str
+) -> str:
+    if output_format not in cache_output_formats:
+        raise ValueError(
+            f"Unexpected hledger output format:{output_format}, expected one"
+            f" of:{cache_output_formats}"
+        )
+    return os.path.join(cache_dir, f"{cache_key}.{output_format}")
@@ -0,0 +1,182 @@
+"""Plots many journals in one run, with a pool of worker processes.
+
+The setup that all journals share (the parsed CLI arguments, the account
+categories, the pseudonymizer and the static image renderer) is done once per
+worker, instead of once per journal. A failing journal is reported in the
+summary at the end, and does not stop the other journals.
+"""
+
+import glob
+import os
+import traceback
+from argparse import Namespace
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional, Tuple
+
+from typeguard import typechecked
+
+from hledger_plot.create_plots.export_figures import start_renderer
+from hledger_plot.create_plots.manage_plotting import process_journal
+from hledger_plot.create_plots.scrambler import Pseudonymizer
+from hledger_plot.HledgerCategories import HledgerCategories
+
+# The shared setup of a batch worker process, set by init_batch_worker.
+worker_setup: Dict[str, Any] = {}
+
+
+@typechecked
+def get_batch_journal_filepaths(
+    *, journal_glob: Optional[str], journal_manifest: Optional[str]
+) -> List[str]:
+    """Returns the journal files of a batch.
+
+    Args:
+        journal_glob: A glob pattern that matches the journal files, ** also
+        matches subdirectories.
+        journal_manifest: A text file with one journal path per line. Empty
+        lines and lines that start with # are skipped.
+
+    Returns:
+        The paths of the journal files, without duplicates.
+
+    Raises:
+        ValueError: If the batch has no journal files, e.g. because of a typo
+        in the glob pattern.
+    """
+    journal_filepaths: List[str] = []
+    if journal_glob:
+        journal_filepaths.extend(
+            sorted(glob.glob(journal_glob, recursive=True))
+        )
+    if journal_manifest:
+        manifest_dir: str = os.path.dirname(journal_manifest)
+        with open(journal_manifest, encoding="utf-8") as manifest_file:
+            for line in manifest_file:
+                journal_path: str = line.strip()
+                if journal_path and not journal_path.startswith("#"):
+                    journal_filepaths.append(
+                        os.path.join(
+                            manifest_dir, os.path.expanduser(journal_path)
+                        )
+                    )
+    if not journal_filepaths:
+        raise ValueError(
+            f"Found no journal files for --journal-glob={journal_glob} and"
+            f" --journal-manifest={journal_manifest}."
+        )
+    return list(dict.fromkeys(journal_filepaths))
+
+
+@typechecked
+def process_journal_batch(
+    *,
+    args: Namespace,
+    journal_filepaths: List[str],
+    hledgerCategories: HledgerCategories,
+    pseudonymizer: Optional[Pseudonymizer],
+    separator: str,
+) -> Dict[str, Optional[str]]:
+    """Plots every journal of the batch, in a pool of worker processes.
+
+    The batch workers already run in parallel, so each worker parses its
+    journal and exports its plots in-process, with a single renderer.
+
+    A worker process that crashes breaks the pool, which fails every journal
+    that had not finished yet. Those journals are retried one at a time, each
+    in a pool of its own, such that only the journals that crash a worker
+    themselves are reported as failed.
+
+    Returns:
+        Maps every journal filepath to its error message, or None if it
+        succeeded, in the order of journal_filepaths.
+    """
+    worker_args: Namespace = Namespace(**vars(args))
+    worker_args.export_workers = 1
+    worker_args.parse_workers = 1
+    initargs: Tuple[Any, ...] = (
+        worker_args,
+        hledgerCategories,
+        pseudonymizer,
+        separator,
+    )
+
+    journal_errors: Dict[str, Optional[str]] = {}
+    crashed_filepaths: List[str] = []
+    with ProcessPoolExecutor(
+        max_workers=args.batch_workers,
+        initializer=init_batch_worker,
+        initargs=initargs,
+    ) as executor:
+        futures: Dict[str, Future[Tuple[str, Optional[str]]]] = {
+            journal_filepath: executor.submit(
+                process_batch_journal, journal_filepath
+            )
+            for journal_filepath in journal_filepaths
+        }
+        for journal_filepath, future in futures.items():
+            try:
+                journal_errors[journal_filepath] = future.result()[1]
+            except BrokenProcessPool:
+                crashed_filepaths.append(journal_filepath)
+
+    for journal_filepath in crashed_filepaths:
+        with ProcessPoolExecutor(
+            max_workers=1, initializer=init_batch_worker, initargs=initargs
+        ) as executor:
+            try:
+                journal_errors[journal_filepath] = executor.submit(
+                    process_batch_journal, journal_filepath
+                ).result()[1]
+            except BrokenProcessPool as error:
+                journal_errors[journal_filepath] = (
+                    f"{type(error).__name__}: {error}"
+                )
+    return {
+        journal_filepath: journal_errors[journal_filepath]
+        for journal_filepath in journal_filepaths
+    }
+
+
+def init_batch_worker(
+    args: Namespace,
+    hledgerCategories: HledgerCategories,
+    pseudonymizer: Optional[Pseudonymizer],
+    separator: str,
+) -> None:
+    worker_setup.update(
+        args=args,
+        hledgerCategories=hledgerCategories,
+        pseudonymizer=pseudonymizer,
+        separator=separator,
+    )
+    if args.export_sankey or args.export_treemap:
+        start_renderer()
+
+
+def process_batch_journal(journal_filepath: str) -> Tuple[str, Optional[str]]:
+    """Plots a single journal of a batch, in a worker process, and returns
+    its error message, if any."""
+    try:
+        process_journal(journal_filepath=journal_filepath, **worker_setup)
+    except Exception as error:  # Isolate the failures per journal.
+        if worker_setup["args"].verbose:
+            traceback.print_exc()
+        return journal_filepath, f"{type(error).__name__}: {error}"
+    return journal_filepath, None
+
+
+@typechecked
+def print_batch_summary(*, journal_errors: Dict[str, Optional[str]]) -> None:
+    failed_journals: Dict[str, str] = {
+        journal_filepath: error
+        for journal_filepath, error in journal_errors.items()
+        if error is not None
+    }
+    print(
+        f"\nProcessed {len(journal_errors)} journals:"
+        f" {len(journal_errors) - len(failed_journals)} succeeded,"
+        f" {len(failed_journals)} failed."
+    )
+    for journal_filepath, error in failed_journals.items():
+        print(f"FAILED: {journal_filepath}\n    {error}")
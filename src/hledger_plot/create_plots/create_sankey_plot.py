@@ -1,6 +1,9 @@
+import random
+import re
 from argparse import Namespace
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from pandas.core.frame import DataFrame
@@ -9,109 +12,56 @@ from pandas.core.frame import DataFrame
 from plotly.graph_objs._figure import Figure
 from typeguard import typechecked
 
-from hledger_plot.create_plots.scrambler import scramble_sankey_data
-from hledger_plot.HledgerCategories import get_parent
-
-
-class ColumnNode:
-    def __init__(self, index: int, name: str, value: float):
-        self.index = index
-        self.name = name
-        self.value = value
-
-
-class Position:
-    def __init__(self, index: int, name: str, x: float, y: float):
-        self.index = index
-        self.name = name
-        self.x = x
-        self.y = y
+from hledger_plot.create_plots.sankey_layout import (
+    NodePositions,
+    sankey_layouts,
+)
+from hledger_plot.create_plots.scrambler import (
+    Pseudonymizer,
+    scramble_sankey_data,
+)
 
 
 @typechecked
-def store_down_transactions(
+def get_parent_accounts(
     *,
-    args: Namespace,
-    balance: float,
-    full_transaction_category: str,
-    parent_account: str,
-) -> Tuple[str, str]:
-    if balance >= 0:
-        if args.verbose:
-            print(
-                f"DOWN: {balance} -"
-                f" S=parent_account={parent_account},T=f"
-                f"ull_transaction_category={full_transaction_category}"
-            )
-
-        source, target = parent_account, full_transaction_category
-    else:
-        if args.verbose:
-            print(
-                f"DOWN: {balance} -"
-                " S=full_transaction_category="
-                f"{full_transaction_category},T=parent_account="
-                f"{parent_account}"
-            )
-        source, target = full_transaction_category, parent_account
-    return source, target
-
+    accounts: pd.Series,
+    top_level_account_categories: List[str],
+    separator: str,
+) -> pd.Series:
+    """Returns the parent account of each account.
 
-@typechecked
-def store_up_transactions(
-    *,
-    args: Namespace,
-    balance: float,
-    full_transaction_category: str,
-    parent_account: str,
-) -> Tuple[str, str]:
-    if balance < 0:
-        source, target = full_transaction_category, parent_account
-        if args.verbose:
-            print(
-                f"UP: {balance} -"
-                " S=full_transaction_category="
-                f"{full_transaction_category},T=parent_account={parent_account}"
-            )
-    else:
-        source, target = parent_account, full_transaction_category
-        if args.verbose:
-            print(
-                f"UP: {balance} -"
-                f" S=parent_account={parent_account},T="
-                f"full_transaction_category={full_transaction_category}"
-            )
-    return source, target
+    Top-level accounts need to be connected to the special bucket that divides
+    input from output. The name for this bucket is randomly chosen to be:
+    separator.
+    """
+    parent_accounts: pd.Series = accounts.str.rpartition(":")[0]
+    is_top_level: pd.Series = accounts.isin(top_level_account_categories)
+    parent_accounts[is_top_level] = separator
+
+    # The parent accounts must have a known balance in the report.
+    is_missing: pd.Series = ~is_top_level & ~parent_accounts.isin(accounts)
+    if is_missing.any():
+        account: str = accounts[is_missing].iloc[0]
+        raise Exception(
+            f"for account {account}, parent account"
+            f" {parent_accounts[is_missing].iloc[0]} not found - have you"
+            " forgotten --no-elide?"
+        )
+    return parent_accounts
 
 
 @typechecked
-def get_parent_account(
-    *,
-    df: DataFrame,
-    top_level_account_categories: List[str],
-    full_transaction_category: str,
-    separator: str,
-) -> str:
-    # A set of all accounts mentioned in the report, to check that parent
-    # accounts have known balance.
-    accounts = set(df[0].values)
-
-    # Top-level accounts need to be connected to the special bucket that
-    # divides input from output. The name for this bucket is randomly
-    # chosen to be: separator.
-
-    if full_transaction_category in top_level_account_categories:
-        parent_account = separator
-    else:
-        parent_account = get_parent(
-            transaction_category=full_transaction_category
-        )
-        if parent_account not in accounts:
-            raise Exception(
-                f"for account {full_transaction_category}, parent account"
-                f" {parent_account} not found - have you forgotten --no-elide?"
-            )
-    return parent_account
+def contains_any(
+    *, accounts: pd.Series, top_level_categories: List[str]
+) -> pd.Series:
+    """Returns whether each account contains any of the top level categories
+    as a substring."""
+    if not top_level_categories:
+        return pd.Series(False, index=accounts.index)
+    return accounts.str.contains(
+        "|".join(map(re.escape, top_level_categories)), regex=True
+    )
 
 
 @typechecked
@@ -122,198 +72,210 @@ def to_sankey_df(
     top_level_account_categories: List[str],
     desired_left_top_level_categories: List[str],
     desired_right_top_level_categories: List[str],
-    random_words: List[str],
+    pseudonymizer: Optional[Pseudonymizer],
     separator: str,
 ) -> pd.DataFrame:
 
     # TODO: assert full_transaction category does not contain duplicate values
     # like: assets:windows:assets:moon
-
-    # Create a DataFrame to store the sankey data
-    sankey_df: pd.DataFrame = pd.DataFrame(
-        columns=["source", "target", "value"]
+    accounts: pd.Series = df[0].astype(str).reset_index(drop=True)
+    balances: pd.Series = df[1].astype(float).reset_index(drop=True)
+    parent_accounts: pd.Series = get_parent_accounts(
+        accounts=accounts,
+        top_level_account_categories=top_level_account_categories,
+        separator=separator,
     )
 
-    # Convert report to the sankey dataframe
-    for _, row in df.iterrows():
-        full_transaction_category: str = row[0]
-        balance: float = row[1]
-        parent_account: str = get_parent_account(
-            df=df,
-            top_level_account_categories=top_level_account_categories,
-            full_transaction_category=full_transaction_category,
-            separator=separator,
-        )
+    # If no desired categories are found, do not add anything to the
+    # sankey_df.
+    is_left: pd.Series = contains_any(
+        accounts=accounts,
+        top_level_categories=desired_left_top_level_categories,
+    )
+    is_right: pd.Series = ~is_left & contains_any(
+        accounts=accounts,
+        top_level_categories=desired_right_top_level_categories,
+    )
+    is_desired: pd.Series = is_left | is_right
 
-        # If no desired categories are found, do not add anything to the
-        # sankey_df.
-        if any(
-            top_level_category in full_transaction_category
-            for top_level_category in desired_left_top_level_categories
-            + desired_right_top_level_categories
+    # A negative balance flows from the account into its parent, a positive
+    # balance from the parent into the account, on both sides.
+    is_negative: pd.Series = balances[is_desired] < 0
+    accounts = accounts[is_desired]
+    parent_accounts = parent_accounts[is_desired]
+    sankey_df: pd.DataFrame = pd.DataFrame(
+        {
+            "source": accounts.where(is_negative, parent_accounts),
+            "target": parent_accounts.where(is_negative, accounts),
+            "value": balances[is_desired].abs(),
+        }
+    ).reset_index(drop=True)
+
+    if args.verbose:
+        for direction, balance, source, target in zip(
+            is_left[is_desired].map({True: "UP", False: "DOWN"}),
+            balances[is_desired],
+            sankey_df["source"],
+            sankey_df["target"],
         ):
-            if any(
-                top_level_category in full_transaction_category
-                for top_level_category in desired_left_top_level_categories
-            ):
-                source, target = store_up_transactions(
-                    args=args,
-                    balance=balance,
-                    full_transaction_category=full_transaction_category,
-                    parent_account=parent_account,
-                )
-            elif any(
-                top_level_category in full_transaction_category
-                for top_level_category in desired_right_top_level_categories
-            ):
-                source, target = store_down_transactions(
-                    args=args,
-                    balance=balance,
-                    full_transaction_category=full_transaction_category,
-                    parent_account=parent_account,
-                )
-            else:
-                # Skip unwanted categories.
-                pass
-            sankey_df.loc[len(sankey_df)] = {
-                "source": source,
-                "target": target,
-                "value": abs(balance),
-            }
-    sankey_df.to_csv("sankey.csv", index=False)
+            print(f"{direction}: {balance} - S={source},T={target}")
+
+    sankey_df = prune_sankey_flows(
+        sankey_df=sankey_df,
+        separator=separator,
+        min_percentage=args.sankey_min_percentage,
+        min_value=args.sankey_min_value,
+        top_n=args.sankey_top_n,
+    )
+
+    # The workers of a batch share the working directory, so they would
+    # overwrite each other's sankey.csv.
+    if not (args.journal_glob or args.journal_manifest):
+        sankey_df.to_csv("sankey.csv", index=False)
 
     if args.randomize:
         scrambled_df, _ = scramble_sankey_data(
             sankey_df=sankey_df,
-            random_words=random_words,
+            pseudonymizer=pseudonymizer,
             top_level_categories=top_level_account_categories,
             separator=separator,
             text_column_headers=["source", "target"],
             numeric_column_headers=["value"],
+            rng=random.Random(args.random_seed),  # nosec
         )
         return scrambled_df
     return sankey_df
 
 
 @typechecked
-def create_column_nodes(
+def prune_sankey_flows(
     *,
-    nodes: List[str],
-    node_columns: Dict[str, int],
-    node_values: Dict[int, float],
-    max_column: int,
-) -> Dict[int, List[ColumnNode]]:
-    """Creates a dictionary mapping column indices to lists of nodes.
-
-    Args:
-        nodes: A list of node names.
-        node_columns: A dictionary mapping node names to their corresponding
-        column indices.
-        node_values: A list of node values.
-        max_column: The maximum column index.
-
-    Returns:
-        A dictionary where keys are column indices and values are lists of
-        dictionaries,
-        each representing a node with its index, name, and value.
-    """
-    column_nodes: Dict[int, List[ColumnNode]] = {
-        i: [] for i in range(max_column + 1)
-    }
-    for i, node in enumerate(nodes):
-        coumn_node: ColumnNode = ColumnNode(
-            index=i, name=node, value=node_values[i]
-        )
-        new_index: int = node_columns[node]
-        column_nodes[new_index].append(coumn_node)
-    return column_nodes
-
-
-@typechecked
-def calculate_positions(
-    column_nodes: Dict[int, List[ColumnNode]],
-    max_column: int,
-) -> List[Position]:
-    """Calculates the x and y positions for each node based on its column and
-    value.
+    sankey_df: pd.DataFrame,
+    separator: str,
+    min_percentage: float = 0,
+    min_value: float = 0,
+    top_n: Optional[int] = None,
+) -> pd.DataFrame:
+    """Collapses the small flows between a parent account and its children
+    into a single flow to a synthetic <parent>:other account.
+
+    A flow is collapsed if it is smaller than min_percentage of the flows of
+    its parent in the same direction, smaller than min_value, or not among the
+    top_n largest of those flows. The subtrees below collapsed accounts are
+    removed. The value of the other flow is the sum of the collapsed flows,
+    so the totals of the parent account do not change. If a parent has
+    collapsed flows in both directions, the incoming ones go to
+    <parent>:other-in. If the journal has an account with that name, a number
+    is appended, e.g. <parent>:other-2. The flows between the separator and
+    the top level accounts are never collapsed.
 
     Args:
-        column_nodes: A dictionary mapping column indices to lists of nodes.
-        max_column: The maximum column index.
+        sankey_df: The source, target and value of each flow.
+        separator: The node that divides the left from the right accounts.
+        min_percentage: Minimum percentage of the flows of the parent.
+        min_value: Minimum flow value.
+        top_n: Maximum number of flows per parent and direction.
 
     Returns:
-        A list of dictionaries, each containing the index, name, x-coordinate,
-        and y-coordinate of a node.
+        The pruned flows.
     """
-    positions: List[Position] = []
-    for column, nodes_in_column in column_nodes.items():
-        total_value: float = 0
-        for columnNode in nodes_in_column:
-            total_value += columnNode.value
-        # total_value: int = sum(node["value"] for node in nodes_in_column)
-        if total_value == 0:  # Handle nodes with no value.
-
-            positions.append(
-                Position(
-                    index=nodes_in_column[0].index,
-                    name=nodes_in_column[0].name,
-                    x=0,
-                    y=0.5,
-                )
-            )
-            continue
-        y_offset: int = 0
-        for node in nodes_in_column:
-            y_position = y_offset + (node.value / (2 * total_value))
-            positions.append(
-                Position(
-                    index=node.index,
-                    name=node.name,
-                    x=column / max_column,
-                    y=y_position,
-                )
-            )
-            y_offset += int(float(node.value) / total_value)
-    return positions
+    if min_percentage <= 0 and min_value <= 0 and top_n is None:
+        return sankey_df
 
-
-@typechecked
-def compute_node_positions(
-    *,
-    nodes: List[str],
-    sources: List[int],
-    targets: List[int],
-    values: List[float],
-) -> List[Position]:
-    node_columns: Dict[str, int] = {}
-    node_values: Dict[int, float] = {i: 0 for i in range(len(nodes))}
-
-    for i, (source, target) in enumerate(zip(sources, targets)):
-        node_columns[nodes[source]] = node_columns.get(nodes[source], 0)
-        node_columns[nodes[target]] = max(
-            node_columns.get(nodes[target], 0), node_columns[nodes[source]] + 1
+    # A flow goes either from a parent to a child account or back.
+    is_outgoing: pd.Series = (sankey_df["source"] == separator) | (
+        sankey_df["target"].str.rpartition(":")[0] == sankey_df["source"]
+    )
+    flows: pd.DataFrame = pd.DataFrame(
+        {
+            "parent": sankey_df["source"].where(
+                is_outgoing, sankey_df["target"]
+            ),
+            "child": sankey_df["target"].where(
+                is_outgoing, sankey_df["source"]
+            ),
+            "is_outgoing": is_outgoing,
+            "value": sankey_df["value"].astype(float),
+        }
+    )
+    sibling_flows = flows.groupby(["parent", "is_outgoing"], sort=False)[
+        "value"
+    ]
+
+    is_collapsed: pd.Series = flows["value"] < min_value
+    is_collapsed |= flows[
+        "value"
+    ] * 100 < min_percentage * sibling_flows.transform("sum")
+    if top_n is not None:
+        is_collapsed |= (
+            sibling_flows.rank(method="first", ascending=False) > top_n
         )
-        node_values[target] += values[i]
-
-    # Handle cases where the widest node may not be at the start column.
-    max_column = max(node_columns.values())
-
-    column_nodes: Dict[int, List[ColumnNode]] = create_column_nodes(
-        nodes=nodes,
-        node_columns=node_columns,
-        node_values=node_values,
-        max_column=max_column,
+    is_collapsed &= flows["parent"] != separator
+    # Collapsing a single flow would only rename it.
+    is_collapsed &= (
+        is_collapsed.groupby([flows["parent"], flows["is_outgoing"]])
+        .transform("sum")
+        .gt(1)
     )
+    if not is_collapsed.any():
+        return sankey_df
+
+    # Remove the collapsed flows, and all flows below them.
+    collapsed_accounts: pd.Series = flows.loc[is_collapsed, "child"]
+    segments: pd.Series = flows["child"].str.split(":")
+    is_removed: pd.Series = is_collapsed.copy()
+    for depth in range(1, int(segments.str.len().max())):
+        is_removed |= (
+            segments.str[:depth].str.join(":").isin(collapsed_accounts)
+        )
 
-    return calculate_positions(
-        column_nodes=column_nodes,
-        max_column=max_column,
+    other_flows: pd.DataFrame = (
+        flows[
+            is_collapsed & ~flows["parent"].isin(flows.loc[is_removed, "child"])
+        ]
+        .groupby(["parent", "is_outgoing"], sort=False)["value"]
+        .sum()
+        .reset_index()
+    )
+    has_both_directions: pd.Series = other_flows["parent"].duplicated(
+        keep=False
+    )
+    other_accounts: pd.Series = other_flows["parent"] + ":other"
+    other_accounts[has_both_directions & ~other_flows["is_outgoing"]] += "-in"
+    # Do not merge the collapsed flows into a real account with that name.
+    accounts: pd.Index = pd.Index(sankey_df["source"]).union(
+        sankey_df["target"]
+    )
+    other_names: pd.Series = other_accounts.copy()
+    is_taken: pd.Series = other_accounts.isin(accounts)
+    suffix: int = 1
+    while is_taken.any():
+        suffix += 1
+        renamed: pd.Series = other_names[is_taken] + f"-{suffix}"
+        other_accounts[is_taken] = renamed
+        is_taken[is_taken] = renamed.isin(accounts)
+    return pd.concat(
+        [
+            sankey_df[~is_removed],
+            pd.DataFrame(
+                {
+                    "source": other_flows["parent"].where(
+                        other_flows["is_outgoing"], other_accounts
+                    ),
+                    "target": other_accounts.where(
+                        other_flows["is_outgoing"], other_flows["parent"]
+                    ),
+                    "value": other_flows["value"],
+                }
+            ),
+        ],
+        ignore_index=True,
     )
 
 
 @typechecked
 def pysankey_plot_with_manual_pos(
-    sankey_df: pd.DataFrame, title: str
+    sankey_df: pd.DataFrame, title: str, layout: str = "layered"
 ) -> Figure:
 
     # Define nodes and links.
@@ -321,45 +283,57 @@ def pysankey_plot_with_manual_pos(
     # relate accounts stay close together in the initial layout.
     sankey_df.sort_values(by=["target", "source"], inplace=True)
 
-    # Get unique sources and targets for node names
-    nodes = pd.concat([sankey_df["source"], sankey_df["target"]]).unique()
-    sources: List[int] = []
-    targets: List[int] = []
-    values: List[float] = []
-    for i, x in enumerate(sankey_df["source"]):
-        sources.append(list(nodes).index(x))
-    for i, x in enumerate(sankey_df["target"]):
-        targets.append(list(nodes).index(x))
-    for i, x in enumerate(sankey_df["value"]):
-        values.append(x)
-
-    node_positions = compute_node_positions(
-        nodes=nodes.tolist(), sources=sources, targets=targets, values=values
-    )
+    nodes, sources, targets = encode_sankey_nodes(sankey_df=sankey_df)
+    values: np.ndarray = sankey_df["value"].to_numpy(dtype=float)
 
-    # Extract x and y coordinates
-    # [pos["x"] for pos in node_positions]
-    y_coords = [pos.y for pos in node_positions]
+    node_positions: NodePositions = sankey_layouts[layout](
+        nr_of_nodes=len(nodes),
+        sources=sources,
+        targets=targets,
+        values=values,
+    )
+    node: Dict[str, Any] = dict(
+        pad=15,
+        thickness=20,
+        line=dict(color="black", width=0.5),
+        label=nodes.tolist(),
+    )
+    arrangement: str = "snap"
+    if node_positions is not None:
+        node["x"], node["y"] = node_positions
+        # Skip the iterative node relaxation of plotly in the browser.
+        arrangement = "fixed"
 
     # Create Sankey diagram
     fig: Figure = go.Figure(
         data=[
             go.Sankey(
-                node=dict(
-                    pad=15,
-                    thickness=20,
-                    line=dict(color="black", width=0.5),
-                    label=nodes,
-                    # x=x_coords,
-                    y=y_coords,
-                ),
+                arrangement=arrangement,
+                node=node,
                 link=dict(
-                    source=sources,
-                    target=targets,
-                    value=values,
+                    source=sources.tolist(),
+                    target=targets.tolist(),
+                    value=values.tolist(),
                 ),
             ),
         ],
         layout={"title": title, "meta": "sankey"},
     )
     return fig
+
+
+@typechecked
+def encode_sankey_nodes(
+    *, sankey_df: DataFrame
+) -> Tuple[pd.Index, np.ndarray, np.ndarray]:
+    """Encodes the nodes of the Sankey links as integers, in order of first
+    occurrence.
+
+    Returns:
+        The node names, and the source and target node code of each link.
+    """
+    node_codes, nodes = pd.factorize(
+        pd.concat([sankey_df["source"], sankey_df["target"]])
+    )
+    sources, targets = np.split(node_codes, [len(sankey_df)])
+    return nodes, sources, targets
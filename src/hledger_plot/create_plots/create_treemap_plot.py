@@ -1,12 +1,17 @@
+import random
 from argparse import Namespace
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import plotly.express as px
 from pandas.core.frame import DataFrame
 from plotly.graph_objs._figure import Figure
 from typeguard import typechecked
 
-from hledger_plot.create_plots.scrambler import scramble_sankey_data
+from hledger_plot.account_tree import get_subtree_sums
+from hledger_plot.create_plots.scrambler import (
+    Pseudonymizer,
+    scramble_sankey_data,
+)
 from hledger_plot.HledgerCategories import get_parent
 
 
@@ -35,7 +40,7 @@ def combined_treemap_plot(
     balances_df: DataFrame,
     account_categories: List[str],
     title: str,
-    random_words: List[str],
+    pseudonymizer: Optional[Pseudonymizer],
     separator: str,
 ) -> Figure:
     # Filter the DataFrame for the specified categories
@@ -56,11 +61,12 @@ def combined_treemap_plot(
     if args.randomize:
         scramble_sankey_data(
             sankey_df=filtered_df,
-            random_words=random_words,
+            pseudonymizer=pseudonymizer,
             top_level_categories=account_categories,
             separator=separator,
             text_column_headers=[0],
             numeric_column_headers=[1],
+            rng=random.Random(args.random_seed),  # nosec
         )
 
         if len(set(filtered_df[0])) != len(filtered_df[0]):
@@ -84,62 +90,11 @@ def combined_treemap_plot(
     return fig
 
 
-@typechecked
-def get_max_level_to_min_level(
-    ordered_children: Dict[int, List[str]],
-) -> List[int]:
-    return sorted(ordered_children.keys())
-
-
 @typechecked
 def set_parent_to_child_sum(*, df: DataFrame) -> None:
-    ordered_entries: Dict[int, List[str]] = get_level_dict(df=df)
-    levels: List[int] = get_max_level_to_min_level(
-        ordered_children=ordered_entries
-    )
-    for level in reversed(levels):
-        for ordered_entry in ordered_entries[level]:
-            if level > 0:
-
-                # get parent, make its value its current value plus this value.
-                add_to_value_of_category(
-                    df=df,
-                    entry_name=get_parent(ordered_entry),
-                    amount=get_values_of_children(
-                        df=df, child_name=ordered_entry
-                    ),
-                )
-
-
-@typechecked
-def add_to_value_of_category(
-    *, df: DataFrame, entry_name: str, amount: float
-) -> None:
-    """Adds the specified amount to the value of the given entry in the
-    DataFrame.
-
-    Args:
-        df: The DataFrame containing the data.
-        entry_name: The name of the entry to modify.
-        amount: The amount to add to the entry's value.
-
-    Raises:
-        ValueError: If the entry_name is not found in the DataFrame.
-    """
-
-    try:
-        df.loc[df[0] == entry_name, 1] += amount
-    except KeyError:
-        raise ValueError(f"Did not find entry_name:{entry_name}")
-
-
-@typechecked
-def get_values_of_children(*, df: DataFrame, child_name: str) -> float:
-    some = df.loc[df[0] == child_name, 1]
-    if len(some) != 1:
-        raise ValueError("returning something other than a single number.")
-    some_float: float = float(some.iloc[0])
-    return some_float
+    """Sets the value of each account to its own value plus the values of all
+    its descendant accounts."""
+    df[1] = get_subtree_sums(accounts=df[0], values=df[1])
 
 
 @typechecked
@@ -155,19 +110,3 @@ def get_parent_level_dict(df: DataFrame) -> Dict[int, List[str]]:
     for key, value in children.items():
         children[key] = list(set(value))
     return children
-
-
-def get_level_dict(df: DataFrame) -> Dict[int, List[str]]:
-    children: Dict[int, List[str]] = {}
-    for category in df[0]:
-        if category != "":
-
-            if category.count(":") in children.keys():
-                children[category.count(":")].append(category)
-            else:
-                children[category.count(":")] = [category]
-        else:
-            raise ValueError(f"Empty categories not supported:{category}")
-    for key, value in children.items():
-        children[key] = list(set(value))
-    return children
@@ -0,0 +1,192 @@
+"""Exports plotly figures to image files with a pool of worker processes.
+
+Each static image is rendered by Kaleido, which takes a second or more per
+figure on a single core. The workers receive the figures as plain
+dictionaries, such that they are cheap to pickle, and render them
+concurrently.
+
+Starting the renderer (a headless browser for Kaleido 1.x) costs more than
+rendering a typical figure. An ExportSession therefore starts it once per
+process, in the initializer of each worker, and streams every figure through
+the running renderer instead of starting it per image. The renderer is stopped
+when the session ends, or when the worker process exits.
+"""
+
+import math
+import multiprocessing.util
+import os
+from concurrent.futures import ProcessPoolExecutor
+from types import TracebackType
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+import plotly.io as pio
+from plotly.graph_objs._figure import Figure
+from typeguard import typechecked
+
+# Whether this process started its persistent renderer.
+renderer_is_started: bool = False
+
+# Starting a renderer costs more than rendering a typical figure, so by default
+# every export process gets at least this many images to render.
+min_images_per_worker: int = 4
+
+
+class ExportSession:
+    """Renders figures to image files, reusing one renderer per process.
+
+    With more than one worker, the images are rendered by a pool of
+    processes that each start their renderer once. With one worker, they are
+    rendered in this process.
+
+    Usage:
+        with ExportSession(max_workers=4) as export_session:
+            export_session.export(figures=..., image_formats=["png"])
+    """
+
+    @typechecked
+    def __init__(self, *, max_workers: Optional[int] = None):
+        """Initializes the export session.
+
+        Args:
+            max_workers: Maximum number of render processes. Defaults to the
+            number of CPUs.
+        """
+        self.max_workers: int = max_workers or os.cpu_count() or 1
+        self.executor: Optional[ProcessPoolExecutor] = None
+        # Whether this session started the renderer of this process, which
+        # it then stops. A batch worker keeps its renderer for all journals.
+        self.started_renderer: bool = False
+
+    def __enter__(self) -> "ExportSession":
+        if self.max_workers > 1:
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.max_workers, initializer=start_renderer
+            )
+        elif not renderer_is_started:
+            start_renderer()
+            self.started_renderer = True
+        return self
+
+    def __exit__(
+        self,
+        _exc_type: Optional[Type[BaseException]],
+        _exc_value: Optional[BaseException],
+        _traceback: Optional[TracebackType],
+    ) -> None:
+        if self.executor is not None:
+            # The workers stop their renderers when they exit.
+            self.executor.shutdown()
+            self.executor = None
+        if self.started_renderer:
+            stop_renderer()
+            self.started_renderer = False
+
+    @typechecked
+    def export(
+        self, *, figures: Dict[str, Figure], image_formats: List[str]
+    ) -> List[str]:
+        """Writes every figure in every image format.
+
+        Args:
+            figures: Maps the output filepath without extension to its
+            figure.
+            image_formats: The image formats to export, e.g. ["png", "svg"].
+
+        Returns:
+            The filepaths of the exported images.
+        """
+        export_jobs: List[Tuple[Dict[str, Any], str, str]] = [
+            (figure.to_dict(), f"{filepath}.{image_format}", image_format)
+            for filepath, figure in figures.items()
+            for image_format in image_formats
+        ]
+        if not export_jobs:
+            return []
+        if self.executor is None:
+            return [
+                write_figure_image(*export_job) for export_job in export_jobs
+            ]
+        return list(self.executor.map(write_figure_image, *zip(*export_jobs)))
+
+
+@typechecked
+def export_figures(
+    *,
+    figures: Dict[str, Figure],
+    image_formats: List[str],
+    max_workers: Optional[int] = None,
+) -> List[str]:
+    """Writes every figure in every image format, rendering the images
+    concurrently in a single export session.
+
+    Args:
+        figures: Maps the output filepath without extension to its figure.
+        image_formats: The image formats to export, e.g. ["png", "svg"].
+        max_workers: Maximum number of render processes, which never exceeds
+        the number of images. Defaults to the number of CPUs, but at most one
+        process per min_images_per_worker images, such that a few images are
+        rendered in this process, by its persistent renderer.
+
+    Returns:
+        The filepaths of the exported images.
+    """
+    nr_of_images: int = len(figures) * len(image_formats)
+    if nr_of_images == 0:
+        return []
+    if max_workers is None:
+        max_workers = min(
+            os.cpu_count() or 1,
+            math.ceil(nr_of_images / min_images_per_worker),
+        )
+    with ExportSession(
+        max_workers=min(max_workers, nr_of_images)
+    ) as export_session:
+        return export_session.export(
+            figures=figures, image_formats=image_formats
+        )
+
+
+def start_renderer() -> None:
+    """Starts the persistent renderer of this process, if Kaleido has one.
+
+    Kaleido 1.x starts a browser for every write_image call, unless a sync
+    server is running. Older Kaleido versions keep their renderer alive by
+    themselves, and have no start_sync_server.
+    """
+    global renderer_is_started
+    if renderer_is_started:
+        return
+    try:
+        import kaleido
+    except ImportError:
+        # write_image reports the missing Kaleido when it is used.
+        return
+    start_sync_server = getattr(kaleido, "start_sync_server", None)
+    if start_sync_server is not None:
+        start_sync_server()
+        # Pool workers exit with os._exit, which skips the atexit handler that
+        # Kaleido uses to close its browser. The finalizers of multiprocessing
+        # do run when a worker process exits, and at exit of the main process.
+        multiprocessing.util.Finalize(None, stop_renderer, exitpriority=10)
+    renderer_is_started = True
+
+
+def stop_renderer() -> None:
+    """Stops the persistent renderer of this process, if it was started."""
+    global renderer_is_started
+    if not renderer_is_started:
+        return
+    renderer_is_started = False
+    import kaleido
+
+    stop_sync_server = getattr(kaleido, "stop_sync_server", None)
+    if stop_sync_server is not None:
+        stop_sync_server(silence_warnings=True)
+
+
+def write_figure_image(
+    figure_dict: Dict[str, Any], filepath: str, image_format: str
+) -> str:
+    """Renders a figure to an image file, in a worker process."""
+    pio.write_image(figure_dict, filepath, format=image_format)
+    return filepath
@@ -1,6 +1,6 @@
 import os
 from argparse import Namespace
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import pandas as pd
 from pandas.core.frame import DataFrame
@@ -14,7 +14,64 @@ from hledger_plot.create_plots.create_sankey_plot import (
     to_sankey_df,
 )
 from hledger_plot.create_plots.create_treemap_plot import combined_treemap_plot
-from hledger_plot.parse_journal import read_balance_report
+from hledger_plot.create_plots.export_figures import export_figures
+from hledger_plot.create_plots.scrambler import Pseudonymizer
+from hledger_plot.journal_parsing.get_top_level_domains import (
+    get_top_level_account_categories,
+)
+from hledger_plot.journal_parsing.posting_table import (
+    get_posting_table_from_journal,
+    get_top_level_accounts_from_posting_table,
+)
+from hledger_plot.parse_journal import (
+    limit_account_depth,
+    read_balance_report,
+    select_account_categories,
+)
+
+
+@typechecked
+def process_journal(
+    *,
+    args: Namespace,
+    journal_filepath: str,
+    hledgerCategories: HledgerCategories,
+    pseudonymizer: Optional[Pseudonymizer],
+    separator: str,
+) -> None:
+    """Creates, exports and shows the plots of a single journal."""
+    posting_table: Optional[DataFrame] = None
+    top_level_account_categories: List[str]
+    if args.balance_backend == "python":
+        # Parse the journal once, for both the top level accounts and the
+        # balances.
+        posting_table = get_posting_table_from_journal(
+            journal_filepath=journal_filepath,
+            max_workers=args.parse_workers or None,
+            parse_index_dir=args.parse_index_dir,
+        )
+        top_level_account_categories = (
+            get_top_level_accounts_from_posting_table(
+                posting_table=posting_table
+            )
+        )
+    else:
+        top_level_account_categories = get_top_level_account_categories(
+            journal_filepath=journal_filepath
+        )
+    print(
+        "The top_level_account_categories found in your journals"
+        f" are:\n{top_level_account_categories}"
+    )
+    manage_plotting(
+        args=args,
+        journal_filepath=journal_filepath,
+        top_level_account_categories=top_level_account_categories,
+        hledgerCategories=hledgerCategories,
+        pseudonymizer=pseudonymizer,
+        separator=separator,
+        posting_table=posting_table,
+    )
 
 
 @typechecked
@@ -24,37 +81,39 @@ def manage_plotting(
     journal_filepath: str,
     top_level_account_categories: List[str],
     hledgerCategories: HledgerCategories,
-    random_words: List[str],
+    pseudonymizer: Optional[Pseudonymizer],
     separator: str,
+    posting_table: Optional[DataFrame] = None,
 ) -> None:
     merged_account_categories = " ".join(top_level_account_categories)
 
-    # Get all balances information used to create plot.
-    all_balances_df: DataFrame = read_balance_report(
-        args=args,
-        filename=journal_filepath,
-        account_categories=merged_account_categories,
-        top_level_account_categories=top_level_account_categories,
+    # Get all balances information used to create plot. This is the only
+    # hledger call, the other reports are sliced from it.
+    all_balances_df: DataFrame = limit_account_depth(
+        balances_df=read_balance_report(
+            args=args,
+            filename=journal_filepath,
+            account_categories=merged_account_categories,
+            top_level_account_categories=top_level_account_categories,
+            posting_table=posting_table,
+        ),
+        max_depth=args.max_depth,
     )
 
     # Create incomve vs expense dataframe. It's used to create the Sankey plot.
-    income_vs_expenses_df: DataFrame = read_balance_report(
-        args=args,
-        filename=journal_filepath,
+    income_vs_expenses_df: DataFrame = select_account_categories(
+        balances_df=all_balances_df,
         account_categories=hledgerCategories.expense_categories
         + " "
         + hledgerCategories.income_categories,
-        top_level_account_categories=top_level_account_categories,
     )
 
-    # Create incomve vs expense dataframe. It's used to create the Sankey plot.
-    net_worth_df: DataFrame = read_balance_report(
-        args=args,
-        filename=journal_filepath,
+    # Create the net worth dataframe. It's used to create the treemap plot.
+    net_worth_df: DataFrame = select_account_categories(
+        balances_df=all_balances_df,
         account_categories=hledgerCategories.liability_categories
         + " "
         + hledgerCategories.asset_categories,
-        top_level_account_categories=top_level_account_categories,
     )
     [
         net_worth_treemap,
@@ -70,12 +129,13 @@ def manage_plotting(
         hledgerCategories=hledgerCategories,
         income_expenses_df=income_vs_expenses_df,
         net_worth_df=net_worth_df,
-        random_words=random_words,
+        pseudonymizer=pseudonymizer,
         separator=separator,
     )
 
     export_plots(
         args=args,
+        journal_filepath=journal_filepath,
         # income_vs_expenses_treemap=income_vs_expenses_treemap, TODO: support.
         expenses_treemap=expenses_treemap,
         all_balances_sankey=all_balances_sankey_man_pos,
@@ -104,7 +164,7 @@ def create_plot_objects(
     hledgerCategories: HledgerCategories,
     income_expenses_df: DataFrame,
     net_worth_df: DataFrame,
-    random_words: List[str],
+    pseudonymizer: Optional[Pseudonymizer],
     separator: str,
 ) -> List[Figure]:
     net_worth_treemap: Figure = combined_treemap_plot(
@@ -115,7 +175,7 @@ def create_plot_objects(
             hledgerCategories.asset_categories,  # Assets are not shown but are scrambled.
         ],
         title="Treemap - Your financial state/position:",
-        random_words=random_words,
+        pseudonymizer=pseudonymizer,
         separator=separator,
     )
 
@@ -127,7 +187,7 @@ def create_plot_objects(
             hledgerCategories.liability_categories
         ],
         desired_right_top_level_categories=[hledgerCategories.asset_categories],
-        random_words=random_words,
+        pseudonymizer=pseudonymizer,
         separator=separator,
     )
 
@@ -135,6 +195,7 @@ def create_plot_objects(
     all_balances_sankey_man_pos: Figure = pysankey_plot_with_manual_pos(
         sankey_df=net_worth_sankey,
         title="Sankey plot - How your assets cover your liabilities:",
+        layout=args.sankey_layout,
     )
 
     # Create the income vs expense Sankey plot.
@@ -146,7 +207,7 @@ def create_plot_objects(
         desired_right_top_level_categories=[
             hledgerCategories.expense_categories
         ],
-        random_words=random_words,
+        pseudonymizer=pseudonymizer,
         separator=separator,
     )
     income_expenses_sankey_man_pos: Figure = pysankey_plot_with_manual_pos(
@@ -155,6 +216,7 @@ def create_plot_objects(
             "Sankey plot - Change over time: how your income covered your"
             " expenses:"
         ),
+        layout=args.sankey_layout,
     )
 
     # Generate the Treemap plot for the expenses.
@@ -168,7 +230,7 @@ def create_plot_objects(
         title=(
             "Treemap - Change over time: how your income covered your expenses:"
         ),
-        random_words=random_words,
+        pseudonymizer=pseudonymizer,
         separator=separator,
     )
 
@@ -177,7 +239,7 @@ def create_plot_objects(
         balances_df=income_expenses_df,
         account_categories=[hledgerCategories.expense_categories],
         title="Treemap - Overview of your expenses:",
-        random_words=random_words,
+        pseudonymizer=pseudonymizer,
         separator=separator,
     )
     income_treemap: Figure = combined_treemap_plot(
@@ -185,7 +247,7 @@ def create_plot_objects(
         balances_df=income_expenses_df,
         account_categories=[hledgerCategories.income_categories],
         title="Treemap - Overview of your income:",
-        random_words=random_words,
+        pseudonymizer=pseudonymizer,
         separator=separator,
     )
     return [
@@ -237,14 +299,15 @@ def show_plots(
 def export_plots(
     *,
     args: Namespace,
+    journal_filepath: str,
     expenses_treemap: Figure,
     all_balances_sankey: Figure,
     income_expenses_sankey: Figure,
     net_worth_treemap: Figure,
 ) -> None:
 
-    output_dir: str = os.path.dirname(args.journal_filepath)
-    journal_filename: str = os.path.basename(args.journal_filepath)
+    output_dir: str = os.path.dirname(journal_filepath)
+    journal_filename: str = os.path.basename(journal_filepath)
     # Validate the filename extension
     if journal_filename[-8:] != ".journal":
         raise ValueError("Journal filename must end in .journal")
@@ -256,29 +319,23 @@ def export_plots(
         raise ValueError("Journal should have a filename")
 
     # Export options
+    output_prefix: str = f"{output_dir}/{journal_filename_without_ext}"
+    figures: Dict[str, Figure] = {}
     if args.export_sankey:
-        # Export the first Sankey diagram
-        income_expenses_sankey.write_image(
-            f"{output_dir}/{journal_filename_without_ext}_income_expenses_sank"
-            + "ey.png",
-            format="png",
-        )
-        # Export the second Sankey diagram
-        all_balances_sankey.write_image(
-            f"{output_dir}/{journal_filename_without_ext}_all_balances_sanke"
-            + "y.png",
-            format="png",
+        figures[f"{output_prefix}_income_expenses_sankey"] = (
+            income_expenses_sankey
         )
+        figures[f"{output_prefix}_all_balances_sankey"] = all_balances_sankey
 
     if args.export_treemap:
-        # Export the treemap
-        expenses_treemap.write_image(
-            f"{output_dir}/{journal_filename_without_ext}_expense_treemap.png",
-            format="png",
-        )
+        figures[f"{output_prefix}_expense_treemap"] = expenses_treemap
+        figures[f"{output_prefix}_net_worth_treemap"] = net_worth_treemap
 
-        net_worth_treemap.write_image(
-            f"{output_dir}/{journal_filename_without_ext}_net_worth_treemap."
-            + "png",
-            format="png",
-        )
+    exported_filepaths: List[str] = export_figures(
+        figures=figures,
+        image_formats=args.export_formats,
+        max_workers=args.export_workers,
+    )
+    if args.verbose:
+        for exported_filepath in exported_filepaths:
+            print(f"Exported: {exported_filepath}")
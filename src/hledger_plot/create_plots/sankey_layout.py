@@ -0,0 +1,155 @@
+"""Computes the node positions of Sankey diagrams.
+
+A layout strategy receives the links as integer node codes and returns the x
+and y coordinates of every node, or None to let plotly arrange the nodes
+itself. The strategies are registered in sankey_layouts by name.
+"""
+
+from collections import deque
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from typeguard import typechecked
+
+# Plotly treats a node coordinate of exactly 0 as unset, so the coordinates are
+# kept just inside the plot area.
+min_coordinate: float = 0.001
+max_coordinate: float = 0.999
+
+# The vertical space between two nodes in a column, as a fraction of the sum of
+# the node values in that column.
+node_padding_fraction: float = 0.02
+
+NodePositions = Optional[Tuple[List[float], List[float]]]
+
+
+@typechecked
+def layered_layout(
+    *,
+    nr_of_nodes: int,
+    sources: np.ndarray,
+    targets: np.ndarray,
+    values: np.ndarray,
+) -> NodePositions:
+    """Places every node in the column of the longest path that leads to it,
+    and stacks the nodes of a column with heights proportional to their
+    value.
+
+    Args:
+        nr_of_nodes: The number of nodes.
+        sources: The source node of each link.
+        targets: The target node of each link.
+        values: The value of each link.
+
+    Returns:
+        The x and y coordinates of the node centres, in node order.
+    """
+    if nr_of_nodes == 0:
+        return [], []
+    columns: np.ndarray = get_node_columns(
+        nr_of_nodes=nr_of_nodes, sources=sources, targets=targets
+    )
+    max_column: int = int(columns.max())
+    if max_column == 0:
+        x_coords: np.ndarray = np.full(nr_of_nodes, 0.5)
+    else:
+        x_coords = columns / max_column
+
+    # A node is as high as the largest of its incoming and outgoing flows.
+    node_values: np.ndarray = np.maximum(
+        np.bincount(targets, weights=values, minlength=nr_of_nodes),
+        np.bincount(sources, weights=values, minlength=nr_of_nodes),
+    )
+
+    # Keep the children of a node together, next to their parent, by placing
+    # the nodes of each column in the order of their first incoming link.
+    first_source: np.ndarray = np.full(nr_of_nodes, -1)
+    linked_targets, first_links = np.unique(targets, return_index=True)
+    first_source[linked_targets] = sources[first_links]
+
+    y_coords: np.ndarray = np.zeros(nr_of_nodes)
+    for column in range(max_column + 1):
+        column_nodes: np.ndarray = np.flatnonzero(columns == column)
+        parent_y: np.ndarray = np.where(
+            first_source[column_nodes] >= 0,
+            y_coords[first_source[column_nodes]],
+            0.0,
+        )
+        # np.lexsort uses the last key as primary key.
+        column_nodes = column_nodes[np.lexsort((column_nodes, parent_y))]
+        y_coords[column_nodes] = stack_nodes(
+            node_values=node_values[column_nodes]
+        )
+
+    return (
+        np.clip(x_coords, min_coordinate, max_coordinate).tolist(),
+        np.clip(y_coords, min_coordinate, max_coordinate).tolist(),
+    )
+
+
+@typechecked
+def plotly_layout(
+    *,
+    nr_of_nodes: int,
+    sources: np.ndarray,
+    targets: np.ndarray,
+    values: np.ndarray,
+) -> NodePositions:
+    """Leaves the node placement to plotly."""
+    return None
+
+
+@typechecked
+def get_node_columns(
+    *, nr_of_nodes: int, sources: np.ndarray, targets: np.ndarray
+) -> np.ndarray:
+    """Returns the column of each node: the length of the longest path from a
+    node without incoming links to it.
+
+    The nodes are visited in topological order (Kahn's algorithm). Nodes on a
+    cycle are never visited, and keep the column reached before the cycle.
+    """
+    outgoing: List[List[int]] = [[] for _ in range(nr_of_nodes)]
+    for source, target in zip(sources.tolist(), targets.tolist()):
+        outgoing[source].append(target)
+    nr_of_incoming: List[int] = np.bincount(
+        targets, minlength=nr_of_nodes
+    ).tolist()
+
+    columns: List[int] = [0] * nr_of_nodes
+    queue: deque[int] = deque(
+        node for node in range(nr_of_nodes) if nr_of_incoming[node] == 0
+    )
+    while queue:
+        node: int = queue.popleft()
+        for target in outgoing[node]:
+            columns[target] = max(columns[target], columns[node] + 1)
+            nr_of_incoming[target] -= 1
+            if nr_of_incoming[target] == 0:
+                queue.append(target)
+    return np.array(columns)
+
+
+@typechecked
+def stack_nodes(*, node_values: np.ndarray) -> np.ndarray:
+    """Returns the y coordinates of the centres of nodes that are stacked from
+    top to bottom, with heights proportional to their value."""
+    total_value: float = float(node_values.sum())
+    if total_value == 0:
+        # Nodes without value are spread evenly.
+        return (np.arange(len(node_values)) + 0.5) / len(node_values)
+    padding: float = total_value * node_padding_fraction
+    tops: np.ndarray = (
+        np.cumsum(node_values)
+        - node_values
+        + padding * np.arange(len(node_values))
+    )
+    return (tops + node_values / 2) / (
+        total_value + padding * (len(node_values) - 1)
+    )
+
+
+sankey_layouts: Dict[str, Callable[..., NodePositions]] = {
+    "layered": layered_layout,
+    "plotly": plotly_layout,
+}
@@ -1,13 +1,17 @@
+import hashlib
+import hmac
+import importlib.resources
+import json
 import os
 import random
-from typing import Dict, List, Tuple, Union
+from argparse import Namespace
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from pandas.core.series import Series
 from typeguard import typechecked
 
-from hledger_plot.random_categories import long_random_categories
-
 # vulture
 pd.options.mode.copy_on_write = True
 
@@ -18,7 +22,22 @@ def get_rand_categories(*, random_wordlist_filepath: str) -> List[str]:
     if os.path.exists(random_wordlist_filepath):
         return load_words_from_file(filepath=random_wordlist_filepath)
 
-    return sorted(long_random_categories)
+    return list(load_packaged_random_categories())
+
+
+@lru_cache(maxsize=1)
+def load_packaged_random_categories() -> Tuple[str, ...]:
+    """Returns the random words that ship with the package.
+
+    The resource file is already deduplicated and sorted, with one word per
+    line.
+    """
+    return tuple(
+        importlib.resources.files("hledger_plot")
+        .joinpath("random_categories.txt")
+        .read_text(encoding="utf-8")
+        .splitlines()
+    )
 
 
 @typechecked
@@ -38,32 +57,167 @@ def load_words_from_file(*, filepath: str) -> List[str]:
     return sorted(list(set(words)))
 
 
+class Pseudonymizer:
+    """Maps atomic account categories to pseudonyms from a word list.
+
+    The pseudonym of a category is the word at the index that a keyed
+    HMAC-SHA256 of the category points to. If that word is already taken by
+    another category, the next free word is used (linear probing). So with the
+    same key and words, a category gets the same pseudonym in every plot, and
+    in every run in which the categories are added in the same order.
+
+    The taken words form runs of indices, and every taken index points
+    towards the next free index after it, with path compression. So finding
+    the next free word stays amortized constant time as the words fill up.
+
+    Optionally, the pseudonyms are loaded from and stored in a JSON map file.
+    Known categories then keep their pseudonym across runs, also if the key
+    or the words change, and are not computed again.
+    """
+
+    @typechecked
+    def __init__(
+        self,
+        *,
+        random_words: List[str],
+        key: bytes,
+        map_filepath: Optional[str] = None,
+    ):
+        """Initializes the pseudonymizer.
+
+        Args:
+            random_words: The words that are used as pseudonyms.
+            key: The secret HMAC key, without it the pseudonyms cannot be
+            traced back to the categories.
+            map_filepath: The JSON file with the pseudonyms of earlier runs,
+            if any.
+        """
+        self.random_words: List[str] = list(dict.fromkeys(random_words))
+        self.key: bytes = key
+        self.map_filepath: Optional[str] = map_filepath
+        self.pseudonyms: Dict[str, str] = {}
+        if map_filepath is not None and os.path.isfile(map_filepath):
+            with open(map_filepath, encoding="utf-8") as map_file:
+                self.pseudonyms = json.load(map_file)
+        self.used_words: set[str] = set(self.pseudonyms.values())
+        # The next index that may be free, per index, see find_free_index.
+        self.next_indices: List[int] = list(range(len(self.random_words)))
+        for index, word in enumerate(self.random_words):
+            if word in self.used_words:
+                self.take_index(index=index)
+
+    @typechecked
+    def get_scrambler_map(self, *, categories: List[str]) -> Dict[str, str]:
+        """Returns the pseudonym of every category, adding the pseudonyms of
+        new categories in sorted order."""
+        for category in sorted(categories):
+            if category not in self.pseudonyms:
+                self.add_pseudonym(category=category)
+        return {category: self.pseudonyms[category] for category in categories}
+
+    def add_pseudonym(self, *, category: str) -> None:
+        if len(self.used_words) >= len(self.random_words):
+            raise ValueError(
+                "Please provide more random words than:"
+                f"{len(self.random_words)}"
+            )
+        digest: bytes = hmac.new(
+            self.key, category.encode("utf-8"), hashlib.sha256
+        ).digest()
+        index: int = self.find_free_index(
+            index=int.from_bytes(digest[:8], "big") % len(self.random_words)
+        )
+        self.pseudonyms[category] = self.random_words[index]
+        self.used_words.add(self.random_words[index])
+        self.take_index(index=index)
+
+    def take_index(self, *, index: int) -> None:
+        self.next_indices[index] = (index + 1) % len(self.random_words)
+
+    def find_free_index(self, *, index: int) -> int:
+        """Returns the first free index from index onwards, wrapping around,
+        and points the visited indices directly at it."""
+        free_index: int = index
+        while self.next_indices[free_index] != free_index:
+            free_index = self.next_indices[free_index]
+        while index != free_index:
+            next_index: int = self.next_indices[index]
+            self.next_indices[index] = free_index
+            index = next_index
+        return free_index
+
+    @typechecked
+    def store(self) -> None:
+        """Writes the pseudonyms to the map file, if there is one."""
+        if self.map_filepath is None:
+            return
+        # Write to a temporary file first, such that an interrupted run never
+        # leaves a partially written map.
+        tmp_filepath: str = f"{self.map_filepath}.{os.getpid()}.tmp"
+        with open(tmp_filepath, "w", encoding="utf-8") as map_file:
+            json.dump(self.pseudonyms, map_file, indent=2, sort_keys=True)
+        os.replace(tmp_filepath, self.map_filepath)
+
+
+@typechecked
+def create_pseudonymizer(*, args: Namespace) -> Pseudonymizer:
+    """Creates the pseudonymizer that is shared by all plots of the run.
+
+    The HMAC key is the --randomize-key, or else the --random-seed. Without
+    either, a random key is used, so the pseudonyms differ per run.
+    """
+    random_wordlist_filepath: str = "random_categories.txt"
+    if args.randomize_key is not None:
+        key: bytes = args.randomize_key.encode("utf-8")
+    elif args.random_seed is not None:
+        print(
+            "Warning, the --random-seed is used as the key of the account"
+            " pseudonyms, so anyone who knows the seed can trace them back."
+            " Please pass a secret --randomize-key."
+        )
+        key = str(args.random_seed).encode("utf-8")
+    else:
+        key = os.urandom(32)
+    return Pseudonymizer(
+        random_words=get_rand_categories(
+            random_wordlist_filepath=random_wordlist_filepath
+        ),
+        key=key,
+        map_filepath=args.randomize_map_filepath,
+    )
+
+
 @typechecked
 def scramble_sankey_data(
     *,
     sankey_df: pd.DataFrame,
-    random_words: List[str],
+    pseudonymizer: Pseudonymizer,
     top_level_categories: List[str],
     separator: str,
     text_column_headers: List[Union[str, int]],
     numeric_column_headers: List[Union[str, int]],
+    rng: Optional[random.Random] = None,
 ) -> Tuple[pd.DataFrame, Dict[str, str]]:
-    unique_atomic_categories = set()
-
-    for text_column_header in text_column_headers:
+    # Split every text column once, the segments serve both to find the
+    # unique atomic categories and to replace them.
+    column_segments: Dict[Union[str, int], pd.DataFrame] = {
+        text_column_header: split_atomic_categories(
+            some_col=sankey_df[text_column_header]
+        )
+        for text_column_header in text_column_headers
+    }
+    unique_atomic_categories: set[str] = set()
+    for segments in column_segments.values():
         unique_atomic_categories.update(
-            get_unique_atomic_categories(
-                some_df_list=list(sankey_df[text_column_header])
-            )
+            get_unique_atomic_categories(segments=segments)
         )
     top_level_categories_copy = top_level_categories.copy() + [separator]
     for skipped_entry in top_level_categories_copy:
         if skipped_entry in unique_atomic_categories:
             unique_atomic_categories.remove(skipped_entry)
 
-    scrambler_map: Dict[str, str] = map_original_to_randomized(
-        random_words=random_words,
-        original_list=sorted(list(unique_atomic_categories)),
+    scrambler_map: Dict[str, str] = pseudonymizer.get_scrambler_map(
+        categories=sorted(unique_atomic_categories)
     )
     if len(set(scrambler_map.keys())) != len(scrambler_map.keys()):
         raise ValueError("Found dupes in randomization.")
@@ -71,115 +225,56 @@ def scramble_sankey_data(
         raise ValueError("Found dupes in randomization values.")
 
     # Randomize the dataframe column by column.
-    for text_column_header in text_column_headers:
+    for text_column_header, segments in column_segments.items():
         sankey_df[text_column_header] = scramble_df_column(
-            scrambler_map=scrambler_map, some_col=sankey_df[text_column_header]
-        )
+            scrambler_map=scrambler_map, segments=segments
+        ).to_numpy()
     for numeric_column_header in numeric_column_headers:
         sankey_df[numeric_column_header] = randomize_list_order_magnitude(
             numbers=list(sankey_df[numeric_column_header]),
             lower=0.12,
             upper=10.2,
+            rng=rng,
         )
 
     return sankey_df, scrambler_map
 
 
 @typechecked
-def scramble_df_column(
-    *, scrambler_map: Dict[str, str], some_col: Series
-) -> Series:
-    # Create a copy to avoid modifying the original Series directly
-    result = some_col.copy()
-    for i, entry in enumerate(result):
-        atomic_categories: List[str] = entry.split(":")
-        for j, atomic_category in enumerate(atomic_categories):
-            if atomic_category in scrambler_map:
-                atomic_categories[j] = scrambler_map[atomic_category]
-        # Update the current row, not the next one
-        result.iloc[i] = ":".join(atomic_categories)
-    return result
-
-
-@typechecked
-def get_unique_atomic_categories(*, some_df_list: List[str]) -> set[str]:
-
-    unique_atomic_categories: set[str] = set()
-    for entry in some_df_list:
-        atomic_categories: List[str] = entry.split(":")
-        atomic_categories
-        for atomic_category in atomic_categories:
-            unique_atomic_categories.add(atomic_category)
-    return unique_atomic_categories
-
-
-@typechecked
-def map_original_to_randomized(
-    *, random_words: List[str], original_list: List[str]
-) -> Dict[str, str]:
-    """Creates a dictionary mapping elements of original_list to randomly
-    selected words from random_words.
-
-    Args:
-    random_words: A list of words to be used for mapping.
-    original_list: A list of elements to be mapped.
+def split_atomic_categories(*, some_col: Series) -> pd.DataFrame:
+    """Splits the account names of a column into a matrix of atomic
+    categories, with one column per account level.
 
     Returns:
-    A dictionary where keys are elements from original_list and values are
-    randomly selected words from random_words.
+        The atomic categories per row position of some_col, padded with
+        missing values for accounts with fewer levels.
     """
-    shuffle_dict: Dict[str, str] = {}
-    if len(random_words) < len(original_list):
-        raise ValueError(
-            f"Please provide more random words than:{len(original_list)}"
-        )
-
-    for category in original_list:
+    return (
+        some_col.astype(str).reset_index(drop=True).str.split(":", expand=True)
+    )
 
-        shuffle_dict[category] = get_unique_random_word(
-            random_words, shuffle_dict
-        )
 
-    if len(shuffle_dict.keys()) != len(original_list):
-        raise ValueError(
-            "Did not create a mapping for each element in the original list."
+@typechecked
+def scramble_df_column(
+    *, scrambler_map: Dict[str, str], segments: pd.DataFrame
+) -> Series:
+    """Replaces the atomic categories that are in the scrambler_map, and joins
+    them back into account names, one per row position."""
+    scrambled_segments: pd.DataFrame = segments.apply(
+        lambda level: level.map(scrambler_map).fillna(level)
+    )
+    result: Series = scrambled_segments[0]
+    for level in scrambled_segments.columns[1:]:
+        is_missing: Series = scrambled_segments[level].isna()
+        result = result.where(
+            is_missing, result + ":" + scrambled_segments[level]
         )
-    return shuffle_dict
+    return result
 
 
 @typechecked
-def get_unique_random_word(
-    random_words: List[str], shuffle_dict: Dict[str, str]
-) -> str:
-    """Selects a random word from the given list that is not already present as
-    a value in the given dictionary.
-
-    Args:
-      random_words: A list of words.
-      shuffle_dict: A dictionary.
-
-    Returns:
-      The randomly selected word.
-
-    Raises:
-      ValueError: If all words in the list have already been used as values in
-      the dictionary.
-    """
-
-    attempts = 0
-    max_attempts = len(random_words)  # Limit attempts to the number of words
-
-    while True:
-        if attempts >= max_attempts:
-            raise ValueError("All words have already been used.")
-
-        random_index = int(random.uniform(0, len(random_words)))  # nosec
-        random_word = random_words[random_index]
-
-        if random_word not in shuffle_dict.values():
-            return random_word
-
-        attempts += 1
+def get_unique_atomic_categories(*, segments: pd.DataFrame) -> set[str]:
+    return set(pd.Series(segments.to_numpy().ravel()).dropna().unique())
 
 
 @typechecked
@@ -247,22 +342,28 @@ def randomize_list_order_magnitude1(numbers: List[float]) -> List[float]:
 
 @typechecked
 def randomize_list_order_magnitude(
-    numbers: List[float], lower: float, upper: float
+    numbers: List[float],
+    lower: float,
+    upper: float,
+    rng: Optional[random.Random] = None,
 ) -> List[float]:
     """Randomizes a list of numbers while preserving the order and maintaining
     roughly the same magnitude.
 
     Args:
         numbers: The input list of numbers.
+        rng: The random number generator, seed it for reproducible numbers.
 
     Returns:
         A new list with the numbers randomized while preserving order
         and roughly maintaining majgnitude.
     """
+    if rng is None:
+        rng = random.Random()  # nosec
 
     # mean = sum(numbers) / len(numbers)
     multipliers = sorted(
-        [random.uniform(lower, upper) for _ in range(len(numbers))]  # nosec
+        [rng.uniform(lower, upper) for _ in range(len(numbers))]
     )
 
     output_nrs: List[float] = [
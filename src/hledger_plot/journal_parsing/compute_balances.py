@@ -0,0 +1,161 @@
+"""Computes the balance report of a journal in-process, without hledger.
+
+The postings of the posting table of the journal are converted to the display
+currency with their @ or @@ prices, like hledger balance --cost does, and
+summed per account. The account balances are then rolled up the account tree,
+such that the report has the same inclusive balances as hledger balance --tree
+--no-elide. Amounts in other commodities without a price would need the market
+prices of hledger --value, which are not supported.
+"""
+
+from typing import List, Set
+
+import numpy as np
+import pandas as pd
+from pandas.core.frame import DataFrame
+from pandas.core.series import Series
+from typeguard import typechecked
+
+from hledger_plot.account_tree import get_tree_balances
+
+# The balances are rounded to this number of decimals, to remove the float
+# noise of summing many postings, e.g. 3329.7999999999997 instead of 3329.8.
+balance_decimals: int = 8
+
+
+@typechecked
+def compute_balance_report(
+    *,
+    postings: DataFrame,
+    disp_currency: str,
+    account_categories: str,
+    top_level_account_categories: List[str],
+    exclude_opening_balances: bool,
+) -> DataFrame:
+    """Computes the balance of every account, and all its parent accounts,
+    from the postings of the journal.
+
+    Args:
+        postings: The posting table of the journal, as returned by
+        get_posting_table_from_journal.
+        disp_currency: The currency in which the balances are reported.
+        account_categories: Space separated top-level account categories
+        whose accounts are reported, e.g. "assets liabilities".
+        top_level_account_categories: The top level accounts that are kept.
+        exclude_opening_balances: Whether to skip the transactions whose
+        description contains 'opening', like hledger query not:desc:opening.
+
+    Returns:
+        A DataFrame with the account name in column 0 and its balance,
+        including its subaccounts, in column 1. Accounts whose subtree has no
+        balance are left out, like hledger does without --empty.
+    """
+    if exclude_opening_balances:
+        descriptions: pd.Categorical = postings["description"].array
+        is_opening: np.ndarray = np.asarray(
+            descriptions.categories.str.contains(
+                "opening", case=False, regex=False
+            )
+        )[descriptions.codes]
+        postings = postings[~is_opening]
+
+    values: np.ndarray = get_posting_values(
+        postings=postings, disp_currency=disp_currency
+    )
+
+    accounts: pd.Categorical = postings["account"].array
+    account_balances: Series = pd.Series(
+        np.bincount(
+            accounts.codes,
+            weights=values,
+            minlength=len(accounts.categories),
+        ).round(balance_decimals),
+        index=accounts.categories.astype(str),
+    )
+    wanted_categories: Set[str] = {
+        category.lower() for category in account_categories.split()
+    } & {category.lower() for category in top_level_account_categories}
+    account_balances = account_balances[
+        account_balances.index.str.split(":")
+        .str[0]
+        .str.lower()
+        .isin(wanted_categories)
+    ]
+
+    tree_balances: Series = get_tree_balances(
+        account_balances=account_balances
+    ).round(balance_decimals)
+    # Like hledger, show the accounts with a balance and their parents, which
+    # may have a zero balance when their subaccounts cancel out.
+    is_shown: Series = (
+        get_tree_balances(account_balances=account_balances.abs()) > 0
+    )
+    tree_balances = tree_balances[is_shown]
+    return DataFrame(
+        {
+            0: tree_balances.index.to_numpy(),
+            # Adding 0.0 turns the -0.0 of rounding into 0.0.
+            1: tree_balances.to_numpy() + 0.0,
+        }
+    )
+
+
+@typechecked
+def get_posting_values(
+    *, postings: DataFrame, disp_currency: str
+) -> np.ndarray:
+    """Returns the value of every posting in the display currency.
+
+    A posting with a price is valued at its total price, with the sign of its
+    quantity. A posting without amount gets the amount that balances its
+    transaction, like hledger infers it.
+
+    Raises:
+        ValueError: If a posting without price is in another commodity than
+        the display currency, or a transaction has more than one posting
+        without amount.
+    """
+    quantities: np.ndarray = postings["quantity"].to_numpy()
+    prices: np.ndarray = postings["price"].to_numpy()
+    has_price: np.ndarray = ~np.isnan(prices)
+    is_elided: np.ndarray = np.isnan(quantities)
+    values: np.ndarray = np.where(
+        has_price, np.copysign(prices, quantities), quantities
+    )
+
+    commodities: np.ndarray = np.where(
+        has_price,
+        postings["price_currency"].to_numpy(dtype=object),
+        postings["currency"].to_numpy(dtype=object),
+    )
+    other_commodities: np.ndarray = np.unique(
+        commodities[~is_elided & (commodities != disp_currency)]
+    )
+    if len(other_commodities):
+        raise ValueError(
+            "The journal contains amounts in"
+            f" {', '.join(map(repr, other_commodities))} without a price in"
+            f" {disp_currency}. The python balance backend only converts"
+            " amounts with @ or @@ prices, please use --balance-backend"
+            " hledger to value them with market prices."
+        )
+
+    if is_elided.any():
+        transactions: np.ndarray = postings["transaction"].to_numpy()
+        nr_of_elided: Series = pd.Series(is_elided).groupby(transactions).sum()
+        if (nr_of_elided > 1).any():
+            ambiguous_transactions: Series = postings["description"][
+                np.isin(transactions, nr_of_elided.index[nr_of_elided > 1])
+            ]
+            raise ValueError(
+                "Found transactions with more than one posting without"
+                f" amount:{ambiguous_transactions.unique().tolist()}"
+            )
+        transaction_sums: np.ndarray = (
+            pd.Series(np.where(is_elided, 0.0, values))
+            .groupby(transactions)
+            .transform("sum")
+            .to_numpy()
+        )
+        values[is_elided] = -transaction_sums[is_elided]
+    return values
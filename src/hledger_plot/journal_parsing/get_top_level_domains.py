@@ -1,27 +1,106 @@
 import io
 import os
-from typing import List
+import re
+from typing import Dict, List
 
 from typeguard import typechecked
 
-from hledger_plot.file_reading_and_writing import load_file_to_string
 from hledger_plot.journal_parsing.import_journal_file import (
     Transaction,
+    get_include_filepath,
     parseJournal,
+    re_account_str,
+    re_commentblock_begin,
+    re_commentblock_end,
+    re_commentline,
+    re_include,
+    re_journalcommentline,
+    re_transaction,
 )
 
+re_posting_account = re.compile(r"^\s\s+(" + re_account_str + r")")
+
 
 @typechecked
 def get_top_level_account_categories(*, journal_filepath: str) -> List[str]:
-    transactions: List[Transaction] = get_all_transactions_from_journal(
-        journal_filepath=journal_filepath
-    )
-    top_level_account_category_account_categories: List[str] = (
-        get_top_level_account_category_domains_from_transactions(
-            transactions=transactions
-        )
+    """Returns the top level accounts of all postings in the journal and the
+    files it includes, in order of first occurrence.
+
+    Only the account names are scanned, so no Transaction, Posting or Amount
+    objects are constructed.
+    """
+    top_level_account_categories: Dict[str, None] = {}
+    scan_top_level_account_categories(
+        filepath=journal_filepath,
+        top_level_account_categories=top_level_account_categories,
     )
-    return top_level_account_category_account_categories
+    return list(top_level_account_categories)
+
+
+@typechecked
+def scan_top_level_account_categories(
+    *,
+    filepath: str,
+    top_level_account_categories: Dict[str, None],
+    read_buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+) -> None:
+    """Adds the top level accounts of the postings in a journal file, and of
+    the files it includes, to the (insertion ordered) top level accounts.
+
+    Mirrors the line handling of parseJournal: comment blocks are skipped, and
+    postings only count once the file has an entry they can belong to.
+    """
+    parent_path: str = os.path.dirname(filepath)
+    within_commentblock = False
+    has_entry = False
+    with open(
+        filepath, encoding="utf-8", buffering=read_buffer_size
+    ) as journal_file:
+        for line in journal_file:
+            line = line.strip("\n\r")
+
+            if re_commentblock_end.match(line):
+                within_commentblock = False
+                continue
+            if within_commentblock:
+                continue
+            if re_commentblock_begin.match(line):
+                within_commentblock = True
+                continue
+
+            if not has_entry:
+                has_entry = (
+                    re_journalcommentline.match(line) is not None
+                    or re_commentline.match(line) is not None
+                    or re_transaction.match(line) is not None
+                )
+                if has_entry:
+                    continue
+
+            m = re_posting_account.match(line)
+            if m is not None:
+                if has_entry:
+                    top_level_account_categories.setdefault(
+                        m.group(1).strip().split(":", 1)[0]
+                    )
+                continue
+
+            m = re_include.match(line)
+            if m is not None:
+                include_filepath: str = get_include_filepath(
+                    include_path=m.group(1), parent_path=parent_path
+                )
+                if not os.path.isfile(include_filepath):
+                    raise ValueError(
+                        "ERROR: Could not find include file:"
+                        f" {m.group(1)} at"
+                        f" absolute_import_path={include_filepath}"
+                    )
+                scan_top_level_account_categories(
+                    filepath=include_filepath,
+                    top_level_account_categories=top_level_account_categories,
+                    read_buffer_size=read_buffer_size,
+                )
 
 
 @typechecked
@@ -29,31 +108,38 @@ def get_top_level_account_category_domains_from_transactions(
     *, transactions: List[Transaction]
 ) -> List[str]:
 
-    top_level_account_category_account_categories: List[str] = []
+    # A dict keeps the insertion order, and has O(1) membership tests.
+    top_level_account_category_account_categories: Dict[str, None] = {}
     for transaction in transactions:
         for posting in transaction.postings:
-            top_level_account_category: str = posting.account.strip().split(
-                ":"
-            )[0]
-            if (
-                top_level_account_category
-                not in top_level_account_category_account_categories
-            ):
-                top_level_account_category_account_categories.append(
-                    top_level_account_category
-                )
-    return top_level_account_category_account_categories
+            top_level_account_category_account_categories.setdefault(
+                posting.account.strip().split(":")[0]
+            )
+    return list(top_level_account_category_account_categories)
 
 
 @typechecked
 def get_all_transactions_from_journal(
-    *, journal_filepath: str
+    *,
+    journal_filepath: str,
+    read_buffer_size: int = io.DEFAULT_BUFFER_SIZE,
 ) -> List[Transaction]:
+    """Parses the journal, and the files it includes, line by line from the
+    open file, such that the raw journal is never loaded into memory as a
+    whole.
 
+    Args:
+        journal_filepath: Path to the journal file.
+        read_buffer_size: Size in bytes of the read buffer of each opened
+        journal file.
+    """
     parent_path: str = os.path.dirname(journal_filepath)
-    journal_content: str = load_file_to_string(filepath=journal_filepath)
-    test_journal1 = io.StringIO(journal_content)
-    j: List[Transaction] = parseJournal(
-        jreader=test_journal1, parent_path=parent_path
-    )
+    with open(
+        journal_filepath, encoding="utf-8", buffering=read_buffer_size
+    ) as journal_file:
+        j: List[Transaction] = parseJournal(
+            jreader=journal_file,
+            parent_path=parent_path,
+            read_buffer_size=read_buffer_size,
+        )
     return j
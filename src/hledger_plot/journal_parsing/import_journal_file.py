@@ -4,6 +4,7 @@
 
 import copy
 import datetime
+import io
 import os
 import re
 from typing import List
@@ -16,6 +17,8 @@ class DifferentCurrency(Exception):
 
 
 class Amount:
+    __slots__ = ("quantity", "currency", "totalprice", "perunitprice")
+
     def __init__(self, quantity, currency):
         self.quantity = float(quantity)
         self.currency = currency.strip()
@@ -129,6 +132,8 @@ class Amount:
 
 
 class NoAmount(Amount):
+    __slots__ = ()
+
     def __init__(self):
         self.quantity = 0
         self.currency = ""
@@ -139,6 +144,17 @@ class NoAmount(Amount):
 
 
 class Posting:
+    # Most postings have no tags or comments, so their containers are only
+    # created once they are accessed.
+    __slots__ = (
+        "account",
+        "amount",
+        "_tags",
+        "_commenttags",
+        "virtual",
+        "post_posting_assert_amount",
+    )
+
     def __init__(
         self, account, amount, commenttags=[], assertamount=None, virtual=False
     ):
@@ -146,8 +162,8 @@ class Posting:
         self.amount = amount if not amount is None else NoAmount()
         if not isinstance(self.amount, Amount):
             raise TypeError("Expected amount to be of type Amount.")
-        self.tags = {}
-        self.commenttags = []
+        self._tags = None
+        self._commenttags = None
         self.virtual = virtual
         self.post_posting_assert_amount = (
             None if isinstance(assertamount, NoAmount) else assertamount
@@ -155,6 +171,26 @@ class Posting:
         if isinstance(commenttags, str):
             self.commenttags.append(commenttags.strip())
 
+    @property
+    def tags(self):
+        if self._tags is None:
+            self._tags = {}
+        return self._tags
+
+    @tags.setter
+    def tags(self, tags):
+        self._tags = tags
+
+    @property
+    def commenttags(self):
+        if self._commenttags is None:
+            self._commenttags = []
+        return self._commenttags
+
+    @commenttags.setter
+    def commenttags(self, commenttags):
+        self._commenttags = commenttags
+
     def addComment(self, comment):
         self.commenttags.append(comment.strip())
         return self
@@ -202,8 +238,8 @@ class Posting:
         # it's a good idea to always close a tag with a comma. Reduces mistakes during manual edit
         # NOTE: tags come first, comment comes later on postings. Otherwise we would have to check the commenttags for stray ':'
         commenttags = [
-            "%s:%s," % x for x in sorted(self.tags.items())
-        ] + self.commenttags
+            "%s:%s," % x for x in sorted((self._tags or {}).items())
+        ] + (self._commenttags or [])
         if len(commenttags) == 0:
             return ""
         return (
@@ -231,14 +267,56 @@ class Posting:
 
 
 class Transaction:
+    # The description, comment and tag containers are only created once they
+    # are accessed, because most transactions have none.
+    __slots__ = (
+        "date",
+        "_desc",
+        "name",
+        "code",
+        "_comments",
+        "postings",
+        "_tags",
+    )
+
     def __init__(self, name="", date=None):
         self.setDate(date)
-        self.desc = []
+        self._desc = None
         self.name = name.strip()
         self.code = None
-        self.comments = []
+        self._comments = None
         self.postings = []
-        self.tags = {}
+        self._tags = None
+
+    @property
+    def desc(self):
+        if self._desc is None:
+            self._desc = []
+        return self._desc
+
+    @desc.setter
+    def desc(self, desc):
+        self._desc = desc
+
+    @property
+    def comments(self):
+        if self._comments is None:
+            self._comments = []
+        return self._comments
+
+    @comments.setter
+    def comments(self, comments):
+        self._comments = comments
+
+    @property
+    def tags(self):
+        if self._tags is None:
+            self._tags = {}
+        return self._tags
+
+    @tags.setter
+    def tags(self, tags):
+        self._tags = tags
 
     def copy(self):
         return copy.deepcopy(self)
@@ -371,6 +449,12 @@ def parseAmount(c1, quantity, c2):
     currency = c2 if c1 is None else c1
     if currency is None:
         currency = ""
+    return Amount(normalizeQuantity(quantity), currency)
+
+
+def normalizeQuantity(quantity):
+    """Returns the quantity with a dot as decimal mark, and without thousands
+    separators."""
     cp = quantity.find(",")
     dp = quantity.find(".")
     if cp >= 0 and dp >= 0:
@@ -378,8 +462,7 @@ def parseAmount(c1, quantity, c2):
             quantity = quantity.replace(",", "")
         else:
             quantity = quantity.replace(".", "")
-    quantity = quantity.replace(",", ".")
-    return Amount(quantity, currency)
+    return quantity.replace(",", ".")
 
 
 def separateAndAddCommentAndTags(commenttagstr, f_addcomment, f_addtag):
@@ -394,77 +477,119 @@ def separateAndAddCommentAndTags(commenttagstr, f_addcomment, f_addtag):
         f_addcomment(cmt)
 
 
-def import_include_path_v2(*, match, journal, journal_reader, parent_path: str):
+def import_include_path_v2(
+    *,
+    match,
+    journal,
+    parent_path: str,
+    read_buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+):
     """Process an include path, combining it with the parent path if relative,
     and validating existence if absolute.
 
     Args:
         match: Match object containing the include path
         journal: Existing journal content to append to
-        journal_reader: Reader object (e.g., file or StringIO)
         parent_path: Parent directory path of the original file
+        read_buffer_size: Size in bytes of the read buffer of the include file
     """
-    # Try to build include path relative to journal reader's directory
-    try:
-        include_path = os.path.join(
-            os.path.split(journal_reader.name)[0], match.group(1)
-        )
-    except AttributeError:
-        include_path = match.group(1)
-
-    # Determine if we need to combine with parent_path
-    if parent_path != os.path.dirname(include_path):
-        absolute_import_path = os.path.join(parent_path, include_path)
-    else:
-        absolute_import_path = include_path
+    absolute_import_path = get_include_filepath(
+        include_path=match.group(1), parent_path=parent_path
+    )
 
     # Check if the file exists and process it
     if os.path.isfile(absolute_import_path):
         new_parent_path = os.path.dirname(absolute_import_path)
 
-        with open(absolute_import_path) as include_file:
+        with open(
+            absolute_import_path, encoding="utf-8", buffering=read_buffer_size
+        ) as include_file:
             journal += parseJournal(
-                jreader=include_file, parent_path=new_parent_path
+                jreader=include_file,
+                parent_path=new_parent_path,
+                read_buffer_size=read_buffer_size,
             )
         return journal
     else:
         raise ValueError(
-            f"ERROR: Could not find include file: {include_path} at"
+            f"ERROR: Could not find include file: {match.group(1)} at"
             f" absolute_import_path={absolute_import_path}"
         )
 
 
-def parseJournal(*, jreader, parent_path: str) -> List[Transaction]:
+def get_include_filepath(*, include_path: str, parent_path: str) -> str:
+    """Returns the path of an included file. Relative include paths are
+    relative to the directory of the file that contains the include directive,
+    like hledger resolves them.
+
+    Args:
+        include_path: The path as written after the include directive.
+        parent_path: Directory of the file that contains the include directive.
+    """
+    return os.path.join(parent_path, os.path.expanduser(include_path.strip()))
+
+
+def parseJournal(
+    *,
+    jreader,
+    parent_path: str,
+    read_buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+) -> List[Transaction]:
+    """Parses the journal lines that jreader yields one at a time, so jreader
+    can be an open file that is streamed instead of a string in memory."""
     journal: List[Transaction] = []
     within_commentblock = False
     for line in jreader:
-        line = line.strip("\n\r")
+        within_commentblock = parseJournalLine(
+            line=line,
+            journal=journal,
+            within_commentblock=within_commentblock,
+            parent_path=parent_path,
+            read_buffer_size=read_buffer_size,
+        )
 
-        if is_end_of_commentblock(line):
-            within_commentblock = False
-            continue
-        if within_commentblock:
-            continue
-        if is_start_of_commentblock(line):
-            within_commentblock = True
-            continue
+    return journal
 
-        if process_journal_commentline(line, journal):
-            continue
 
-        if process_commentline(line, journal):
-            continue
+def parseJournalLine(
+    *,
+    line: str,
+    journal: List[Transaction],
+    within_commentblock: bool,
+    parent_path: str,
+    read_buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+) -> bool:
+    """Parses a single journal line into journal. The only other parser state
+    is whether the line is inside a comment block, which is returned for the
+    next line."""
+    line = line.strip("\n\r")
+
+    if is_end_of_commentblock(line):
+        return False
+    if within_commentblock:
+        return True
+    if is_start_of_commentblock(line):
+        return True
 
-        if process_transaction(line, journal):
-            continue
+    if process_journal_commentline(line, journal):
+        return False
 
-        if process_posting(line, journal):
-            continue
+    if process_commentline(line, journal):
+        return False
 
-        if process_include(line, journal, jreader, parent_path):
-            continue
+    if process_transaction(line, journal):
+        return False
 
-    return journal
+    if process_posting(line, journal):
+        return False
+
+    process_include(
+        line,
+        journal,
+        parent_path,
+        read_buffer_size,
+    )
+    return False
 
 
 def is_end_of_commentblock(line: str) -> bool:
@@ -540,15 +665,18 @@ def process_posting(line: str, journal: list) -> bool:
 
 
 def process_include(
-    line: str, journal: list, jreader, parent_path: str
+    line: str,
+    journal: list,
+    parent_path: str,
+    read_buffer_size: int = io.DEFAULT_BUFFER_SIZE,
 ) -> bool:
     m = re_include.match(line)
     if m is not None:
         import_include_path_v2(
             match=m,
             journal=journal,
-            journal_reader=jreader,
             parent_path=parent_path,
+            read_buffer_size=read_buffer_size,
         )
         return True
     return False
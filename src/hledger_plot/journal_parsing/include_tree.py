@@ -0,0 +1,89 @@
+import os
+from typing import Dict, List
+
+from typeguard import typechecked
+
+from hledger_plot.journal_parsing.import_journal_file import (
+    get_include_filepath,
+    re_commentblock_begin,
+    re_commentblock_end,
+    re_include,
+)
+
+
+@typechecked
+def get_include_tree_filepaths(*, journal_filepath: str) -> List[str]:
+    """Returns the journal file and all the files it (recursively) includes,
+    in the order in which the include directives are encountered.
+
+    Args:
+        journal_filepath: Path to the main journal file.
+
+    Returns:
+        The paths of the journal file and all its included files, without
+        duplicates.
+    """
+    return list(get_include_graph(journal_filepath=journal_filepath))
+
+
+@typechecked
+def get_include_graph(*, journal_filepath: str) -> Dict[str, List[str]]:
+    """Returns the include graph of a journal, without parsing any
+    transactions.
+
+    Args:
+        journal_filepath: Path to the main journal file.
+
+    Returns:
+        A dictionary that maps the journal file and every file it (recursively)
+        includes, in order of discovery, to the paths of the files it directly
+        includes, in include order. Files without includes are the leaves.
+    """
+    include_graph: Dict[str, List[str]] = {}
+    add_include_graph_filepaths(
+        filepath=journal_filepath, include_graph=include_graph
+    )
+    return include_graph
+
+
+@typechecked
+def add_include_graph_filepaths(
+    *, filepath: str, include_graph: Dict[str, List[str]]
+) -> None:
+    if filepath in include_graph:
+        return
+    if not os.path.isfile(filepath):
+        raise ValueError(f"ERROR: Could not find include file: {filepath}")
+    include_graph[filepath] = []
+
+    for include_path in get_include_paths(filepath=filepath):
+        include_filepath: str = get_include_filepath(
+            include_path=include_path,
+            parent_path=os.path.dirname(filepath),
+        )
+        include_graph[filepath].append(include_filepath)
+        add_include_graph_filepaths(
+            filepath=include_filepath, include_graph=include_graph
+        )
+
+
+@typechecked
+def get_include_paths(*, filepath: str) -> List[str]:
+    """Returns the paths of the include directives of a single journal file,
+    ignoring the ones in comment blocks."""
+    include_paths: List[str] = []
+    within_commentblock = False
+    with open(filepath, encoding="utf-8") as journal_file:
+        for line in journal_file:
+            line = line.strip("\n\r")
+            if re_commentblock_end.match(line):
+                within_commentblock = False
+            elif within_commentblock:
+                continue
+            elif re_commentblock_begin.match(line):
+                within_commentblock = True
+            else:
+                m = re_include.match(line)
+                if m is not None:
+                    include_paths.append(m.group(1))
+    return include_paths
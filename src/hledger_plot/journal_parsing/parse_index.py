@@ -0,0 +1,159 @@
+"""Persistent parse index that lets the posting table resume append-only
+journals.
+
+For every parsed journal file the index stores the byte offset up to which
+the file was parsed, the sha256 of those bytes, and the state of the parser
+at that offset: the column buffers of the file, its last transaction and
+whether the offset lies inside a comment block. If the bytes before the
+offset are unchanged on the next run, parsing resumes at the offset, so only
+the appended tail is parsed. Any change before the offset invalidates the
+entry, and the file is parsed from the start.
+
+The column buffers of an entry include the postings of the files it includes,
+since the lines after an include directive can add postings to the last
+included transaction. The entry therefore also stores the size and
+modification time of all files it (recursively) includes. If one of them
+changed, the including file is parsed from the start, while the included file
+itself resumes from its own entry.
+"""
+
+import hashlib
+import os
+import pickle  # nosec
+from typing import IO, TYPE_CHECKING, Dict, Optional, Tuple
+
+from typeguard import typechecked
+
+if TYPE_CHECKING:
+    from hledger_plot.journal_parsing.posting_table import (
+        PostingTableBuilder,
+        TransactionState,
+    )
+
+# Increase this when the posting table changes, to discard old index entries.
+parse_index_version: int = 1
+
+# The size and modification time of a file.
+FileSignature = Tuple[int, int]
+
+
+class ParseIndexEntry:
+    def __init__(
+        self,
+        *,
+        offset: int,
+        prefix_hash: str,
+        builder: "PostingTableBuilder",
+        last_transaction: Optional["TransactionState"],
+        within_commentblock: bool,
+        include_signatures: Dict[str, FileSignature],
+    ):
+        """Initializes a parse index entry.
+
+        Args:
+            offset: Number of bytes of the file that were parsed.
+            prefix_hash: sha256 hex digest of those bytes.
+            builder: The postings of those bytes, including the postings of
+            the files they include.
+            last_transaction: The state of the last transaction at the offset.
+            within_commentblock: Whether the offset lies in a comment block.
+            include_signatures: Size and modification time of all
+            (recursively) included files.
+        """
+        self.version = parse_index_version
+        self.offset = offset
+        self.prefix_hash = prefix_hash
+        self.builder = builder
+        self.last_transaction = last_transaction
+        self.within_commentblock = within_commentblock
+        self.include_signatures = include_signatures
+
+
+@typechecked
+def get_file_signature(*, filepath: str) -> FileSignature:
+    file_stat = os.stat(filepath)
+    return file_stat.st_size, file_stat.st_mtime_ns
+
+
+@typechecked
+def includes_are_unchanged(
+    *, include_signatures: Dict[str, FileSignature]
+) -> bool:
+    for include_filepath, signature in include_signatures.items():
+        if not os.path.isfile(include_filepath):
+            return False
+        if get_file_signature(filepath=include_filepath) != signature:
+            return False
+    return True
+
+
+# Not typechecked, because the hash objects of hashlib have no runtime type.
+def update_hash(
+    *, some_hash: "hashlib._Hash", journal_file: IO[bytes], nr_of_bytes: int
+) -> None:
+    """Reads nr_of_bytes from the journal_file into some_hash."""
+    while nr_of_bytes > 0:
+        chunk: bytes = journal_file.read(min(nr_of_bytes, 1024 * 1024))
+        if not chunk:
+            break
+        some_hash.update(chunk)
+        nr_of_bytes -= len(chunk)
+
+
+@typechecked
+def get_parse_index_filepath(*, index_dir: str, filepath: str) -> str:
+    filepath_hash: str = hashlib.sha256(
+        os.path.abspath(filepath).encode("utf-8")
+    ).hexdigest()
+    return os.path.join(index_dir, f"{filepath_hash}.pickle")
+
+
+@typechecked
+def load_parse_index_entry(
+    *, index_dir: str, filepath: str
+) -> Optional[ParseIndexEntry]:
+    """Returns the index entry of the journal file, or None if it has no
+    (readable) entry of the current version."""
+    index_filepath: str = get_parse_index_filepath(
+        index_dir=index_dir, filepath=filepath
+    )
+    try:
+        with open(index_filepath, "rb") as index_file:
+            entry = pickle.load(index_file)  # nosec
+    except (
+        OSError,
+        pickle.UnpicklingError,
+        EOFError,
+        AttributeError,
+        ImportError,
+    ):
+        return None
+    if (
+        not isinstance(entry, ParseIndexEntry)
+        or entry.version != parse_index_version
+    ):
+        return None
+    return entry
+
+
+@typechecked
+def store_parse_index_entry(
+    *, index_dir: str, filepath: str, entry: ParseIndexEntry
+) -> None:
+    """Stores the index entry of the journal file. The index is best-effort,
+    so an entry that cannot be written is skipped."""
+    index_filepath: str = get_parse_index_filepath(
+        index_dir=index_dir, filepath=filepath
+    )
+    # Write to a temporary file first, such that an interrupted or concurrent
+    # run never reads a partially written entry.
+    tmp_filepath: str = f"{index_filepath}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(index_dir, exist_ok=True)
+        with open(tmp_filepath, "wb") as index_file:
+            pickle.dump(entry, index_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_filepath, index_filepath)
+    except OSError as error:
+        print(f"Could not write the parse index:{error}\n")
+        if os.path.isfile(tmp_filepath):
+            os.remove(tmp_filepath)
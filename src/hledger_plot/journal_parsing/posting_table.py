@@ -0,0 +1,628 @@
+"""Parses a journal straight into a columnar table with one row per posting.
+
+Unlike parseJournal, no Transaction, Posting or Amount objects are created.
+Every posting is appended to typed column buffers, and the repeated strings
+(dates, descriptions, accounts and currencies) are dictionary-encoded, such
+that they become pandas categoricals without copying the strings per row.
+Tags, comments and balance assertions are not part of the table.
+
+Optionally, the included files that include nothing themselves (the leaves)
+are parsed in a process pool. Their column buffers are merged in at their
+include directive, such that the table equals the one of the serial parse.
+
+Optionally, a parse index (see parse_index.py) stores the column buffers of
+every file, such that an append-only file is only parsed from where the
+previous run stopped.
+"""
+
+import datetime
+import hashlib
+import io
+import os
+import re
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.core.frame import DataFrame
+from typeguard import typechecked
+
+from hledger_plot.journal_parsing.import_journal_file import (
+    dateformat_hledger_csvexport_,
+    get_include_filepath,
+    normalizeQuantity,
+    re_commentblock_begin,
+    re_commentblock_end,
+    re_commentline,
+    re_include,
+    re_journalcommentline,
+    re_posting,
+    re_transaction,
+)
+from hledger_plot.journal_parsing.include_tree import get_include_graph
+from hledger_plot.journal_parsing.parse_index import (
+    FileSignature,
+    ParseIndexEntry,
+    get_file_signature,
+    includes_are_unchanged,
+    load_parse_index_entry,
+    store_parse_index_entry,
+    update_hash,
+)
+
+# The state of the last transaction of a journal file: its number, date,
+# description and whether it is still empty (no description and postings).
+TransactionState = Tuple[int, str, str, bool]
+
+
+class PostingTableBuilder:
+    """Collects the postings of journal files into column buffers."""
+
+    def __init__(
+        self,
+        *,
+        parsed_leaves: Optional[
+            Dict[str, Tuple["PostingTableBuilder", Optional[TransactionState]]]
+        ] = None,
+        parse_index_dir: Optional[str] = None,
+    ) -> None:
+        """Initializes an empty posting table.
+
+        Args:
+            parsed_leaves: The already parsed builder, and the last
+            transaction state, of included files that include nothing
+            themselves. They are merged in instead of parsed again.
+            parse_index_dir: Directory of the parse index, from which the
+            journal files are resumed. None parses every file from the start.
+        """
+        self.parsed_leaves: Dict[
+            str, Tuple[PostingTableBuilder, Optional[TransactionState]]
+        ] = (parsed_leaves or {})
+        self.parse_index_dir: Optional[str] = parse_index_dir
+        # The size and modification time of every file that was included,
+        # only kept for the parse index.
+        self.include_signatures: Dict[str, FileSignature] = {}
+        self.nr_of_transactions: int = 0
+        self.transactions: array[int] = array("q")
+        self.quantities: array[float] = array("d")
+        self.prices: array[float] = array("d")
+        self.dates: Dict[str, int] = {}
+        self.date_codes: array[int] = array("q")
+        self.descriptions: Dict[str, int] = {}
+        self.description_codes: array[int] = array("q")
+        self.accounts: Dict[str, int] = {}
+        self.account_codes: array[int] = array("q")
+        self.currencies: Dict[str, int] = {}
+        self.currency_codes: array[int] = array("q")
+        self.price_currency_codes: array[int] = array("q")
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Leaves the parse settings out of a pickled builder, e.g. of a parse
+        index entry, since they belong to the run."""
+        state: Dict[str, Any] = self.__dict__.copy()
+        state["parsed_leaves"] = {}
+        state["parse_index_dir"] = None
+        return state
+
+    def add_journal_file(
+        self,
+        *,
+        filepath: str,
+        read_buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+    ) -> Optional[TransactionState]:
+        """Adds the postings of a journal file and the files it includes.
+
+        Follows the line handling of parseJournal, such that the postings are
+        assigned to the same transactions.
+
+        Returns:
+            The state of the last transaction of the file, if it has any.
+        """
+        if self.parse_index_dir is not None:
+            return self.add_journal_file_with_index(
+                filepath=filepath,
+                read_buffer_size=read_buffer_size,
+                parse_index_dir=self.parse_index_dir,
+            )
+        parent_path: str = os.path.dirname(filepath)
+        within_commentblock = False
+        transaction: Optional[TransactionState] = None
+        with open(
+            filepath, encoding="utf-8", buffering=read_buffer_size
+        ) as journal_file:
+            for line in journal_file:
+                within_commentblock, transaction = self.add_journal_line(
+                    line=line,
+                    parent_path=parent_path,
+                    read_buffer_size=read_buffer_size,
+                    within_commentblock=within_commentblock,
+                    transaction=transaction,
+                )
+        return transaction
+
+    def add_journal_file_with_index(
+        self,
+        *,
+        filepath: str,
+        read_buffer_size: int,
+        parse_index_dir: str,
+    ) -> Optional[TransactionState]:
+        """Adds the postings of a journal file and the files it includes,
+        resuming from the parse index entry of the file if the bytes before
+        its offset are unchanged, and stores the new entry of the file.
+
+        The file is parsed into a builder of its own, which is stored in the
+        entry, and then merged in like a parsed leaf.
+
+        Returns:
+            The state of the last transaction of the file, if it has any.
+        """
+        entry: Optional[ParseIndexEntry] = load_parse_index_entry(
+            index_dir=parse_index_dir, filepath=filepath
+        )
+        if entry is not None and not includes_are_unchanged(
+            include_signatures=entry.include_signatures
+        ):
+            # Lines after an include may add postings to the last included
+            # transaction, so the included postings cannot be replaced.
+            entry = None
+
+        file_builder = PostingTableBuilder(
+            parsed_leaves=self.parsed_leaves, parse_index_dir=parse_index_dir
+        )
+        parent_path: str = os.path.dirname(filepath)
+        offset: int = 0
+        prefix_hash = hashlib.sha256()
+        within_commentblock = False
+        transaction: Optional[TransactionState] = None
+        is_stored: bool = False
+        with open(filepath, "rb", buffering=read_buffer_size) as journal_file:
+            if entry is not None:
+                update_hash(
+                    some_hash=prefix_hash,
+                    journal_file=journal_file,
+                    nr_of_bytes=entry.offset,
+                )
+                if prefix_hash.hexdigest() == entry.prefix_hash:
+                    file_builder = entry.builder
+                    file_builder.parsed_leaves = self.parsed_leaves
+                    file_builder.parse_index_dir = parse_index_dir
+                    offset = entry.offset
+                    within_commentblock = entry.within_commentblock
+                    transaction = entry.last_transaction
+                else:
+                    # An earlier byte changed, so parse the file from the
+                    # start.
+                    prefix_hash = hashlib.sha256()
+                    journal_file.seek(0)
+
+            for raw_line in journal_file:
+                if raw_line.endswith(b"\n"):
+                    offset += len(raw_line)
+                    prefix_hash.update(raw_line)
+                else:
+                    # The unterminated last line may still be extended, so
+                    # the entry ends before it.
+                    store_parse_index_entry(
+                        index_dir=parse_index_dir,
+                        filepath=filepath,
+                        entry=file_builder.get_parse_index_entry(
+                            offset=offset,
+                            prefix_hash=prefix_hash.hexdigest(),
+                            last_transaction=transaction,
+                            within_commentblock=within_commentblock,
+                        ),
+                    )
+                    is_stored = True
+                within_commentblock, transaction = (
+                    file_builder.add_journal_line(
+                        line=raw_line.decode("utf-8"),
+                        parent_path=parent_path,
+                        read_buffer_size=read_buffer_size,
+                        within_commentblock=within_commentblock,
+                        transaction=transaction,
+                    )
+                )
+
+        if not is_stored:
+            store_parse_index_entry(
+                index_dir=parse_index_dir,
+                filepath=filepath,
+                entry=file_builder.get_parse_index_entry(
+                    offset=offset,
+                    prefix_hash=prefix_hash.hexdigest(),
+                    last_transaction=transaction,
+                    within_commentblock=within_commentblock,
+                ),
+            )
+        self.include_signatures.update(file_builder.include_signatures)
+        return self.add_posting_table(
+            other=file_builder, last_transaction=transaction
+        )
+
+    def add_journal_line(
+        self,
+        *,
+        line: str,
+        parent_path: str,
+        read_buffer_size: int,
+        within_commentblock: bool,
+        transaction: Optional[TransactionState],
+    ) -> Tuple[bool, Optional[TransactionState]]:
+        """Adds a single line of a journal file.
+
+        Returns:
+            Whether the next line is within a comment block, and the state of
+            the last transaction.
+        """
+        line = line.strip("\n\r")
+
+        if re_commentblock_end.match(line):
+            return False, transaction
+        if within_commentblock:
+            return True, transaction
+        if re_commentblock_begin.match(line):
+            return True, transaction
+
+        if re_journalcommentline.match(line):
+            if transaction is None or not transaction[3]:
+                transaction = self.new_transaction()
+            return False, transaction
+
+        if re_commentline.match(line):
+            if transaction is None:
+                transaction = self.new_transaction()
+            return False, transaction
+
+        m = re_transaction.match(line)
+        if m is not None:
+            if transaction is None or not transaction[3]:
+                transaction = self.new_transaction()
+            description: str = m.group(3).strip()
+            return False, (
+                transaction[0],
+                m.group(1),
+                description,
+                description == "",
+            )
+
+        m = re_posting.match(line)
+        if m is not None:
+            if transaction is not None:
+                self.add_posting(transaction=transaction, posting_match=m)
+                transaction = (*transaction[:3], False)
+            return False, transaction
+
+        m = re_include.match(line)
+        if m is not None:
+            include_filepath: str = get_include_filepath(
+                include_path=m.group(1), parent_path=parent_path
+            )
+            if not os.path.isfile(include_filepath):
+                raise ValueError(
+                    "ERROR: Could not find include file:"
+                    f" {m.group(1)} at"
+                    f" absolute_import_path={include_filepath}"
+                )
+            if self.parse_index_dir is not None:
+                self.include_signatures[include_filepath] = get_file_signature(
+                    filepath=include_filepath
+                )
+            included_transaction: Optional[TransactionState]
+            if include_filepath in self.parsed_leaves:
+                leaf, leaf_transaction = self.parsed_leaves[include_filepath]
+                included_transaction = self.add_posting_table(
+                    other=leaf, last_transaction=leaf_transaction
+                )
+            else:
+                included_transaction = self.add_journal_file(
+                    filepath=include_filepath,
+                    read_buffer_size=read_buffer_size,
+                )
+            if included_transaction is not None:
+                transaction = included_transaction
+        return False, transaction
+
+    def get_parse_index_entry(
+        self,
+        *,
+        offset: int,
+        prefix_hash: str,
+        last_transaction: Optional[TransactionState],
+        within_commentblock: bool,
+    ) -> ParseIndexEntry:
+        """Returns the parse index entry of a file parsed into this builder,
+        up to offset."""
+        return ParseIndexEntry(
+            offset=offset,
+            prefix_hash=prefix_hash,
+            builder=self,
+            last_transaction=last_transaction,
+            within_commentblock=within_commentblock,
+            include_signatures=self.include_signatures,
+        )
+
+    def new_transaction(self) -> TransactionState:
+        # A transaction without date line gets the date of today, like
+        # Transaction does.
+        self.nr_of_transactions += 1
+        return (
+            self.nr_of_transactions - 1,
+            datetime.date.today().strftime(dateformat_hledger_csvexport_),
+            "",
+            True,
+        )
+
+    def add_posting(
+        self, *, transaction: TransactionState, posting_match: re.Match[str]
+    ) -> None:
+        c1, quantity, c2 = posting_match.group(2, 3, 4)
+        if quantity is None:
+            # The amount is left out, hledger infers it from the other
+            # postings.
+            self.quantities.append(float("nan"))
+            currency: str = ""
+        else:
+            self.quantities.append(float(normalizeQuantity(quantity)))
+            currency = (c2 if c1 is None else c1) or ""
+
+        price_currency: str = ""
+        price: float = float("nan")
+        if posting_match.group(5) is not None:
+            p1, price_quantity, p2 = posting_match.group(6, 7, 8)
+            price_currency = ((p2 if p1 is None else p1) or "").strip()
+            price = abs(float(normalizeQuantity(price_quantity)))
+            if posting_match.group(5) == "@":
+                # Store the total price, like Amount.addPerUnitPrice.
+                price *= abs(self.quantities[-1])
+
+        account: str = posting_match.group(1).strip()
+        self.transactions.append(transaction[0])
+        self.prices.append(price)
+        # Dictionary-encode the strings, a new string gets the next code.
+        self.date_codes.append(
+            self.dates.setdefault(transaction[1], len(self.dates))
+        )
+        self.description_codes.append(
+            self.descriptions.setdefault(transaction[2], len(self.descriptions))
+        )
+        self.account_codes.append(
+            self.accounts.setdefault(account, len(self.accounts))
+        )
+        self.currency_codes.append(
+            self.currencies.setdefault(currency.strip(), len(self.currencies))
+        )
+        self.price_currency_codes.append(
+            self.currencies.setdefault(price_currency, len(self.currencies))
+        )
+
+    def add_posting_table(
+        self,
+        *,
+        other: "PostingTableBuilder",
+        last_transaction: Optional[TransactionState],
+    ) -> Optional[TransactionState]:
+        """Appends the postings of a separately parsed journal file, as if
+        the file was parsed here.
+
+        The transactions of the file are renumbered after the ones parsed so
+        far, and its dictionary-encoded strings are re-encoded, in the order
+        of first occurrence in the file.
+
+        Returns:
+            The state of the last transaction of the file, renumbered.
+        """
+        transaction_offset: int = self.nr_of_transactions
+        self.nr_of_transactions += other.nr_of_transactions
+        self.transactions.frombytes(
+            (
+                np.frombuffer(other.transactions, dtype=np.int64)
+                + transaction_offset
+            ).tobytes()
+        )
+        self.quantities.extend(other.quantities)
+        self.prices.extend(other.prices)
+        # The currencies and price currencies share their categories, so
+        # re-encoding the currencies twice gives the same codes.
+        for codes, categories, other_codes, other_categories in (
+            (self.date_codes, self.dates, other.date_codes, other.dates),
+            (
+                self.description_codes,
+                self.descriptions,
+                other.description_codes,
+                other.descriptions,
+            ),
+            (
+                self.account_codes,
+                self.accounts,
+                other.account_codes,
+                other.accounts,
+            ),
+            (
+                self.currency_codes,
+                self.currencies,
+                other.currency_codes,
+                other.currencies,
+            ),
+            (
+                self.price_currency_codes,
+                self.currencies,
+                other.price_currency_codes,
+                other.currencies,
+            ),
+        ):
+            recode_into(
+                codes=codes,
+                categories=categories,
+                other_codes=other_codes,
+                other_categories=other_categories,
+            )
+
+        if last_transaction is None:
+            return None
+        return (
+            last_transaction[0] + transaction_offset,
+            *last_transaction[1:],
+        )
+
+    def to_dataframe(self) -> DataFrame:
+        currencies: List[str] = list(self.currencies)
+        date_strings: List[str] = list(self.dates)
+        return DataFrame(
+            {
+                "transaction": np.frombuffer(self.transactions, dtype=np.int64),
+                "date": pd.Categorical.from_codes(
+                    codes=np.frombuffer(self.date_codes, dtype=np.int64),
+                    categories=pd.Index(date_strings),
+                ),
+                "description": pd.Categorical.from_codes(
+                    codes=np.frombuffer(self.description_codes, dtype=np.int64),
+                    categories=pd.Index(list(self.descriptions)),
+                ),
+                "account": pd.Categorical.from_codes(
+                    codes=np.frombuffer(self.account_codes, dtype=np.int64),
+                    categories=pd.Index(list(self.accounts)),
+                ),
+                "quantity": np.frombuffer(self.quantities, dtype=np.float64),
+                "currency": pd.Categorical.from_codes(
+                    codes=np.frombuffer(self.currency_codes, dtype=np.int64),
+                    categories=pd.Index(currencies),
+                ),
+                "price": np.frombuffer(self.prices, dtype=np.float64),
+                "price_currency": pd.Categorical.from_codes(
+                    codes=np.frombuffer(
+                        self.price_currency_codes, dtype=np.int64
+                    ),
+                    categories=pd.Index(currencies),
+                ),
+            }
+        )
+
+
+def recode_into(
+    *,
+    codes: "array[int]",
+    categories: Dict[str, int],
+    other_codes: "array[int]",
+    other_categories: Dict[str, int],
+) -> None:
+    """Appends the codes of another dictionary encoding, re-encoded into
+    categories, to which its new strings are added."""
+    code_map: np.ndarray = np.array(
+        [
+            categories.setdefault(category, len(categories))
+            for category in other_categories
+        ],
+        dtype=np.int64,
+    )
+    codes.frombytes(
+        code_map[np.frombuffer(other_codes, dtype=np.int64)].tobytes()
+    )
+
+
+@typechecked
+def get_posting_table_from_journal(
+    *,
+    journal_filepath: str,
+    read_buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+    max_workers: Optional[int] = 1,
+    parse_index_dir: Optional[str] = None,
+) -> DataFrame:
+    """Parses the journal, and the files it includes, into a posting table.
+
+    Args:
+        journal_filepath: Path to the journal file.
+        read_buffer_size: Size in bytes of the read buffer of each opened
+        journal file.
+        max_workers: If not 1, the included files that include nothing
+        themselves are parsed in a pool of this many processes (None means
+        one per CPU).
+        parse_index_dir: Directory of the parse index, from which unchanged
+        prefixes of the journal files are resumed. None parses every file
+        from the start.
+
+    Returns:
+        A DataFrame with one row per posting and the columns: transaction (the
+        number of the transaction in the journal), date, description, account,
+        quantity (NaN if left out), currency, price (the total price, NaN if
+        none) and price_currency. The string columns are categoricals whose
+        categories are in order of first occurrence.
+    """
+    parsed_leaves: Dict[
+        str, Tuple[PostingTableBuilder, Optional[TransactionState]]
+    ] = {}
+    if max_workers != 1:
+        parsed_leaves = parse_leaf_journal_files(
+            journal_filepath=journal_filepath,
+            read_buffer_size=read_buffer_size,
+            max_workers=max_workers,
+            parse_index_dir=parse_index_dir,
+        )
+    builder = PostingTableBuilder(
+        parsed_leaves=parsed_leaves, parse_index_dir=parse_index_dir
+    )
+    builder.add_journal_file(
+        filepath=journal_filepath, read_buffer_size=read_buffer_size
+    )
+    return builder.to_dataframe()
+
+
+@typechecked
+def parse_leaf_journal_files(
+    *,
+    journal_filepath: str,
+    read_buffer_size: int,
+    max_workers: Optional[int],
+    parse_index_dir: Optional[str] = None,
+) -> Dict[str, Tuple[PostingTableBuilder, Optional[TransactionState]]]:
+    """Parses the included files that include nothing themselves in a
+    process pool, since they do not depend on each other.
+
+    Returns:
+        The builder and last transaction state of every leaf file.
+    """
+    include_graph: Dict[str, List[str]] = get_include_graph(
+        journal_filepath=journal_filepath
+    )
+    leaf_filepaths: List[str] = [
+        filepath
+        for filepath, include_filepaths in include_graph.items()
+        if not include_filepaths and filepath != journal_filepath
+    ]
+    if not leaf_filepaths:
+        return {}
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return dict(
+            zip(
+                leaf_filepaths,
+                executor.map(
+                    parse_leaf_journal_file,
+                    leaf_filepaths,
+                    [read_buffer_size] * len(leaf_filepaths),
+                    [parse_index_dir] * len(leaf_filepaths),
+                ),
+            )
+        )
+
+
+def parse_leaf_journal_file(
+    filepath: str, read_buffer_size: int, parse_index_dir: Optional[str]
+) -> Tuple[PostingTableBuilder, Optional[TransactionState]]:
+    """Parses a single journal file, in a worker process."""
+    builder = PostingTableBuilder(parse_index_dir=parse_index_dir)
+    last_transaction: Optional[TransactionState] = builder.add_journal_file(
+        filepath=filepath, read_buffer_size=read_buffer_size
+    )
+    return builder, last_transaction
+
+
+@typechecked
+def get_top_level_accounts_from_posting_table(
+    *, posting_table: DataFrame
+) -> List[str]:
+    """Returns the top level accounts of a posting table, in order of first
+    occurrence."""
+    accounts = pd.Series(posting_table["account"].cat.categories)
+    return accounts.str.split(":", n=1).str[0].unique().tolist()
@@ -1,12 +1,28 @@
+import json
 import subprocess  # nosec
 from argparse import Namespace
+from concurrent.futures import ThreadPoolExecutor
 from io import StringIO
-from typing import List
+from typing import Any, Dict, List, Optional, Set, Tuple
 
+import numpy as np
 import pandas as pd
 from pandas.core.frame import DataFrame
 from typeguard import typechecked
 
+from hledger_plot.balance_cache import (
+    get_cache_key,
+    get_default_cache_dir,
+    load_cached_output,
+    store_cached_output,
+)
+from hledger_plot.journal_parsing.compute_balances import (
+    compute_balance_report,
+)
+from hledger_plot.journal_parsing.posting_table import (
+    get_posting_table_from_journal,
+)
+
 
 @typechecked
 def read_balance_report(
@@ -14,7 +30,115 @@ def read_balance_report(
     filename: str,
     account_categories: str,
     top_level_account_categories: List[str],
+    posting_table: Optional[DataFrame] = None,
 ) -> DataFrame:
+    if args.balance_backend == "python":
+        # Reuse the posting table of the caller, if it already parsed the
+        # journal.
+        if posting_table is None:
+            posting_table = get_posting_table_from_journal(
+                journal_filepath=filename,
+                max_workers=args.parse_workers or None,
+                parse_index_dir=args.parse_index_dir,
+            )
+        balances_df: DataFrame = compute_balance_report(
+            postings=posting_table,
+            disp_currency=args.display_currency,
+            account_categories=account_categories,
+            top_level_account_categories=top_level_account_categories,
+            exclude_opening_balances=args.exclude_opening_balances,
+        )
+        return balances_df
+    balance_command: List[str] = get_balance_command(
+        args=args, filename=filename, account_categories=account_categories
+    )
+    process_output: str = get_hledger_output(
+        args=args, command=balance_command, journal_filepath=filename
+    )
+    return parse_balance_output(
+        args=args,
+        process_output=process_output,
+        top_level_account_categories=top_level_account_categories,
+    )
+
+
+@typechecked
+def read_balance_reports(
+    *,
+    args: Namespace,
+    filename: str,
+    account_categories_list: List[str],
+    top_level_account_categories: List[str],
+    max_workers: Optional[int] = None,
+) -> List[DataFrame]:
+    """Reads one balance report per entry of account_categories_list, running
+    the hledger processes concurrently.
+
+    Each hledger call is a separate process that spends its time parsing the
+    journal, so running them in a thread pool lets them use separate cores.
+
+    Args:
+        args: The parsed CLI arguments.
+        filename: Path to the journal file that hledger reads.
+        account_categories_list: The account query of each balance report.
+        top_level_account_categories: The top level accounts that are kept.
+        max_workers: Maximum number of concurrent hledger processes. Defaults
+        to the number of CPUs.
+
+    Returns:
+        The balance reports, in the order of account_categories_list.
+    """
+    if args.balance_backend == "python":
+        # All reports are computed from the same posting table.
+        posting_table: DataFrame = get_posting_table_from_journal(
+            journal_filepath=filename,
+            max_workers=args.parse_workers or None,
+            parse_index_dir=args.parse_index_dir,
+        )
+        return [
+            read_balance_report(
+                args=args,
+                filename=filename,
+                account_categories=account_categories,
+                top_level_account_categories=top_level_account_categories,
+                posting_table=posting_table,
+            )
+            for account_categories in account_categories_list
+        ]
+    balance_commands: List[List[str]] = [
+        get_balance_command(
+            args=args,
+            filename=filename,
+            account_categories=account_categories,
+        )
+        for account_categories in account_categories_list
+    ]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        process_outputs: List[str] = list(
+            executor.map(
+                lambda command: get_hledger_output(
+                    args=args, command=command, journal_filepath=filename
+                ),
+                balance_commands,
+            )
+        )
+    return [
+        parse_balance_output(
+            args=args,
+            process_output=process_output,
+            top_level_account_categories=top_level_account_categories,
+        )
+        for process_output in process_outputs
+    ]
+
+
+@typechecked
+def get_balance_command(
+    *,
+    args: Namespace,
+    filename: str,
+    account_categories: str,
+) -> List[str]:
     disp_currency: str = args.display_currency
     optional_balance_args = [
         # not:desc:opening: Excludes entries with descriptions containing the
@@ -24,6 +148,11 @@ def read_balance_report(
         # of previous years.
         "not:desc:opening",
     ]
+    if args.exclude_opening_balances:
+        account_categories = " ".join(
+            [account_categories, *optional_balance_args]
+        )
+        optional_balance_args = []
 
     required_exotic_args = [
         " --tree --no-elide",  # Ensures that parent accounts are listed even
@@ -37,21 +166,196 @@ def read_balance_report(
     # read_balance_report--cost: Reads cost-related data in the balance report.
     default_command = (
         f"hledger -f {filename} balance {account_categories} --no-total"
-        " --output-format csv"
+        f" --output-format {args.hledger_output_format}"
         + " ".join(required_exotic_args)
     )
 
-    # Call hledger to compute balances.
     if args.verbose:
-        print(f"Ignoring options:{optional_balance_args}\n")
+        if optional_balance_args:
+            print(f"Ignoring options:{optional_balance_args}\n")
         print(f"default_command=:{default_command}\n")
-    process_output = subprocess.run(  # nosec
-        default_command.split(" "),
+    return default_command.split(" ")
+
+
+@typechecked
+def get_hledger_output(
+    *, args: Namespace, command: List[str], journal_filepath: str
+) -> str:
+    """Returns the output of the hledger command, from the on-disk cache if
+    neither the command nor any file of the journal changed since it was
+    stored, unless --no-cache is given.
+
+    The cache is best-effort: if it cannot be read or written, e.g. because
+    the cache directory is read-only or the disk is full, the output of
+    hledger is used without caching it.
+    """
+    if args.no_cache:
+        return run_hledger_command(command=command)
+
+    cache_dir: str = args.cache_dir or get_default_cache_dir()
+    max_age_seconds: float = args.cache_max_age_days * 24 * 3600
+    cache_key: str = get_cache_key(
+        command=command, journal_filepath=journal_filepath
+    )
+    cached_output: Optional[str] = None
+    try:
+        cached_output = load_cached_output(
+            cache_dir=cache_dir,
+            cache_key=cache_key,
+            output_format=args.hledger_output_format,
+            max_age_seconds=max_age_seconds,
+        )
+    except OSError as error:
+        print(f"Could not read the hledger output cache:{error}\n")
+    if cached_output is not None:
+        if args.verbose:
+            print(f"Loaded hledger output from cache:{cache_dir}\n")
+        return cached_output
+
+    process_output: str = run_hledger_command(command=command)
+    # Do not cache the (empty) output of failed hledger calls.
+    if process_output:
+        try:
+            store_cached_output(
+                cache_dir=cache_dir,
+                cache_key=cache_key,
+                output_format=args.hledger_output_format,
+                output=process_output,
+                max_size_bytes=int(args.cache_max_size_mb * 1024 * 1024),
+                max_age_seconds=max_age_seconds,
+            )
+        except OSError as error:
+            print(f"Could not write the hledger output cache:{error}\n")
+    return process_output
+
+
+@typechecked
+def run_hledger_command(*, command: List[str]) -> str:
+    # Call hledger to compute balances.
+    return subprocess.run(  # nosec
+        command,
         stdout=subprocess.PIPE,
         text=True,
         # shell=False,
     ).stdout
 
+
+@typechecked
+def parse_balance_output(
+    *,
+    args: Namespace,
+    process_output: str,
+    top_level_account_categories: List[str],
+) -> DataFrame:
+    if args.hledger_output_format == "json":
+        return parse_balance_json(
+            process_output=process_output,
+            disp_currency=args.display_currency,
+            top_level_account_categories=top_level_account_categories,
+        )
+    return parse_balance_csv(
+        process_output=process_output,
+        disp_currency=args.display_currency,
+        top_level_account_categories=top_level_account_categories,
+    )
+
+
+@typechecked
+def parse_balance_json(
+    *,
+    process_output: str,
+    disp_currency: str,
+    top_level_account_categories: List[str],
+) -> DataFrame:
+    """Parses the JSON output of a hledger balance report.
+
+    Each report item is a list of the full account name, the display name,
+    the indentation and the amounts of the account. The quantity of an amount
+    is a decimal mantissa and its number of decimal places, so the balances
+    are read without rounding or locale dependent number formatting.
+
+    Args:
+        process_output: The output of hledger balance -O json.
+        disp_currency: The currency into which hledger converted the amounts.
+        top_level_account_categories: The top level accounts that are kept.
+
+    Returns:
+        A DataFrame with the account name in column 0, the balance as float in
+        column 1, and the exact balance as mantissa and places columns, where
+        balance = mantissa / 10**places and the mantissas are Python ints.
+    """
+    report_items, _ = json.loads(process_output)
+    wanted_categories: Set[str] = set(top_level_account_categories)
+    accounts: List[str] = []
+    mantissas: List[int] = []
+    places: List[int] = []
+    for account, _, _, amounts in report_items:
+        if account.split(":", 1)[0] not in wanted_categories:
+            continue
+        mantissa, decimal_places = get_single_commodity_quantity(
+            account=account, amounts=amounts, disp_currency=disp_currency
+        )
+        accounts.append(account)
+        mantissas.append(mantissa)
+        places.append(decimal_places)
+
+    # The mantissas are kept as Python ints, since they can exceed int64.
+    # Dividing two ints rounds the exact quotient to the nearest float.
+    return DataFrame(
+        {
+            0: accounts,
+            1: [
+                mantissa / 10**decimal_places
+                for mantissa, decimal_places in zip(mantissas, places)
+            ],
+            "mantissa": pd.Series(mantissas, dtype=object),
+            "places": np.array(places, dtype=np.int64),
+        }
+    )
+
+
+# Not typechecked, because it is called for every account of the report, and
+# checking the amounts costs more than reading them.
+def get_single_commodity_quantity(
+    *, account: str, amounts: List[Dict[str, Any]], disp_currency: str
+) -> Tuple[int, int]:
+    """Returns the decimal mantissa and places of the balance of an account,
+    which must be in the display currency.
+
+    hledger leaves out zero amounts, an account without amounts has a zero
+    balance. Amounts without a commodity, i.e. bare numbers, count as the
+    display currency, like they do in the csv output.
+    """
+    quantities: List[Tuple[int, int]] = []
+    for amount in amounts:
+        quantity: Dict[str, Any] = amount["aquantity"]
+        if quantity["decimalMantissa"] == 0:
+            continue
+        if amount["acommodity"] not in ("", disp_currency):
+            raise ValueError(
+                f"The balance of {account} contains the commodity"
+                f" {amount['acommodity']}, which could not be converted to"
+                f" {disp_currency}. Please check the prices in your journal."
+            )
+        quantities.append(
+            (quantity["decimalMantissa"], quantity["decimalPlaces"])
+        )
+    if not quantities:
+        return 0, 0
+    if len(quantities) > 1:
+        raise ValueError(
+            f"Expected a single amount for {account}, found:{quantities}"
+        )
+    return quantities[0]
+
+
+@typechecked
+def parse_balance_csv(
+    *,
+    process_output: str,
+    disp_currency: str,
+    top_level_account_categories: List[str],
+) -> DataFrame:
     # Read the process output into a DataFrame, and clean it up, removing
     # headers.
     raw_df: DataFrame = pd.read_csv(StringIO(process_output), header=None)
@@ -63,3 +367,54 @@ def read_balance_report(
     df[1] = df[1].str.replace(",", ".").astype(float)
     df[1] = pd.to_numeric(df[1], errors="coerce")
     return df
+
+
+@typechecked
+def select_account_categories(
+    *, balances_df: DataFrame, account_categories: str
+) -> DataFrame:
+    """Selects the rows of a balance report that belong to the given top-level
+    account categories.
+
+    This slices the full ``--tree --no-elide`` balance report in-process,
+    instead of asking hledger to re-parse the journal for each subset of
+    categories. Since the tree balances are inclusive, the selected rows have
+    the same balances hledger would report for the narrower query.
+
+    Args:
+        balances_df: Balance report as returned by read_balance_report.
+        account_categories: Space separated top-level account categories,
+        e.g. "expenses income".
+
+    Returns:
+        The rows whose top-level account is in account_categories.
+    """
+    wanted_categories: List[str] = [
+        category.lower() for category in account_categories.split()
+    ]
+    top_level_accounts = balances_df[0].str.split(":").str[0].str.lower()
+    return balances_df[top_level_accounts.isin(wanted_categories)].copy()
+
+
+@typechecked
+def limit_account_depth(
+    *, balances_df: DataFrame, max_depth: Optional[int]
+) -> DataFrame:
+    """Aggregates a balance report to the accounts of at most max_depth
+    levels.
+
+    Since the ``--tree --no-elide`` balances are inclusive, the balance of an
+    account already is the sum over all its subaccounts, so aggregating to a
+    depth comes down to dropping the deeper accounts.
+
+    Args:
+        balances_df: Balance report as returned by read_balance_report.
+        max_depth: The maximum number of account levels, e.g. 2 keeps
+        expenses:food but not expenses:food:groceries. None keeps all.
+
+    Returns:
+        The rows of the accounts of at most max_depth levels.
+    """
+    if max_depth is None:
+        return balances_df
+    return balances_df[balances_df[0].str.count(":") < max_depth].copy()
@@ -1,8256 +0,0 @@
-"""Parses the CLI args."""
-
-from typing import List
-
-short_random_categories: List[str] = [
-    "Assets",
-    "RealEstate",
-    "PrimaryResidence",
-    "Assets",
-    "RealEstate",
-    "RentalProperty",
-    "Assets",
-    "RealEstate",
-    "Land",
-    "Assets",
-    "Investments",
-    "Stocks",
-    "Assets",
-    "Investments",
-    "Bonds",
-    "Assets",
-    "Investments",
-    "MutualFunds",
-    "Assets",
-    "Investments",
-    "ETFs",
-    "Assets",
-    "Investments",
-    "Cryptocurrency",
-    "Bitcoin",
-    "Assets",
-    "Investments",
-    "Cryptocurrency",
-    "Ethereum",
-    "Assets",
-    "Investments",
-    "Cryptocurrency",
-    "Monero",
-    "Assets",
-    "Vehicles",
-    "Car",
-    "Assets",
-    "Vehicles",
-    "Motorcycle",
-    "Assets",
-    "Vehicles",
-    "Boat",
-    "Assets",
-    "Vehicles",
-    "RV",
-    "Assets",
-    "Savings",
-    "EmergencyFund",
-    "Assets",
-    "Savings",
-    "VacationFund",
-    "Assets",
-    "Savings",
-    "RetirementFund",
-    "Assets",
-    "Savings",
-    "ChildrensEducationFund",
-    "Assets",
-    "Business",
-    "Inventory",
-    "Assets",
-    "Business",
-    "Equipment",
-    "Assets",
-    "Business",
-    "AccountsReceivable",
-    "Assets",
-    "Other",
-    "Jewelry",
-    "Assets",
-    "Other",
-    "Artwork",
-    "Assets",
-    "Other",
-    "Collectibles",
-    "Liabilities",
-    "Liabilities",
-    "Mortgage",
-    "PrimaryResidence",
-    "Liabilities",
-    "Mortgage",
-    "RentalProperty",
-    "Liabilities",
-    "AutoLoan",
-    "Car",
-    "Liabilities",
-    "AutoLoan",
-    "Motorcycle",
-    "Liabilities",
-    "StudentLoan",
-    "Federal",
-    "Liabilities",
-    "StudentLoan",
-    "Private",
-    "Liabilities",
-    "CreditCardDebt",
-    "Visa",
-    "Liabilities",
-    "CreditCardDebt",
-    "Mastercard",
-    "Liabilities",
-    "CreditCardDebt",
-    "AmericanExpress",
-    "Liabilities",
-    "PersonalLoan",
-    "Bank",
-    "Liabilities",
-    "PersonalLoan",
-    "OnlineLender",
-    "Liabilities",
-    "Other",
-    "MedicalDebt",
-    "Equity",
-    "Equity",
-    "NetWorth",
-    "Equity",
-    "HomeEquity",
-    "Income",
-    "Income",
-    "Salary",
-    "PrimaryJob",
-    "Income",
-    "Salary",
-    "SecondaryJob",
-    "Income",
-    "SelfEmployment",
-    "Freelance",
-    "Income",
-    "SelfEmployment",
-    "Business",
-    "Income",
-    "RentalIncome",
-    "Property1",
-    "Income",
-    "RentalIncome",
-    "Property2",
-    "Income",
-    "InvestmentIncome",
-    "Dividends",
-    "Income",
-    "InvestmentIncome",
-    "Interest",
-    "Income",
-    "InvestmentIncome",
-    "CapitalGains",
-    "Income",
-    "OtherIncome",
-    "Gifts",
-    "Income",
-    "OtherIncome",
-    "Bonuses",
-    "Income",
-    "OtherIncome",
-    "Refunds",
-    "Expenses",
-    "Expenses",
-    "Housing",
-    "Mortgage",
-    "Expenses",
-    "Housing",
-    "Rent",
-    "Expenses",
-    "Housing",
-    "PropertyTax",
-    "Expenses",
-    "Housing",
-    "HomeownersInsurance",
-    "Expenses",
-    "Housing",
-    "Utilities",
-    "Electricity",
-    "Expenses",
-    "Housing",
-    "Utilities",
-    "Gas",
-    "Expenses",
-    "Housing",
-    "Utilities",
-    "Water",
-    "Expenses",
-    "Housing",
-    "Utilities",
-    "Internet",
-    "Expenses",
-    "Housing",
-    "Utilities",
-    "CableTV",
-    "Expenses",
-    "Housing",
-    "HomeMaintenance",
-    "Repairs",
-    "Expenses",
-    "Housing",
-    "HomeMaintenance",
-    "Improvements",
-    "Expenses",
-    "Transportation",
-    "CarPayment",
-    "Expenses",
-    "Transportation",
-    "CarInsurance",
-    "Expenses",
-    "Transportation",
-    "Gas",
-    "Expenses",
-    "Transportation",
-    "PublicTransportation",
-    "Expenses",
-    "Transportation",
-    "Parking",
-    "Expenses",
-    "Transportation",
-    "Tolls",
-    "Expenses",
-    "Food",
-    "Groceries",
-    "Expenses",
-    "Food",
-    "DiningOut",
-    "Expenses",
-    "Food",
-    "Coffee",
-    "Expenses",
-    "Healthcare",
-    "InsurancePremiums",
-    "Expenses",
-    "Healthcare",
-    "DoctorVisits",
-    "Expenses",
-    "Healthcare",
-    "Prescriptions",
-    "Expenses",
-    "Healthcare",
-    "Dental",
-    "Expenses",
-    "Healthcare",
-    "Vision",
-    "Expenses",
-    "PersonalCare",
-    "Haircuts",
-    "Expenses",
-    "PersonalCare",
-    "Cosmetics",
-    "Expenses",
-    "PersonalCare",
-    "GymMembership",
-    "Expenses",
-    "Entertainment",
-    "Movies",
-    "Expenses",
-    "Entertainment",
-    "StreamingServices",
-    "Expenses",
-    "Entertainment",
-    "Hobbies",
-    "Expenses",
-    "Entertainment",
-    "Travel",
-    "Expenses",
-    "Entertainment",
-    "Gaming",
-    "Expenses",
-    "Education",
-    "Tuition",
-    "Expenses",
-    "Education",
-    "Books",
-    "Expenses",
-    "Education",
-    "CourseFees",
-    "Expenses",
-    "Clothing",
-    "Clothes",
-    "Expenses",
-    "Clothing",
-    "Shoes",
-    "Expenses",
-    "Gifts",
-    "Birthdays",
-    "Expenses",
-    "Gifts",
-    "Holidays",
-    "Expenses",
-    "Gifts",
-    "Charity",
-    "Expenses",
-    "Fees",
-    "BankFees",
-    "Expenses",
-    "Fees",
-    "InvestmentFees",
-    "Expenses",
-    "Fees",
-    "ProfessionalFees",
-    "Expenses",
-    "Taxes",
-    "FederalIncomeTax",
-    "Expenses",
-    "Taxes",
-    "StateIncomeTax",
-    "Expenses",
-    "Taxes",
-    "PropertyTax",
-    "Expenses",
-    "Taxes",
-    "SalesTax",
-    "Expenses",
-    "Other",
-    "Subscriptions",
-    "Expenses",
-    "Other",
-    "PhoneBill",
-    "Expenses",
-    "Other",
-    "PetExpenses",
-    "Expenses",
-    "Other",
-    "Childcare",
-    "Expenses",
-    "Other",
-    "Miscellaneous",
-]
-
-long_random_categories: List[str] = [
-    "boat",
-    "maintenance",
-    "rent",
-    "mortgage",
-    "utilities",
-    "electricity",
-    "water",
-    "gas",
-    "internet",
-    "phone",
-    "groceries",
-    "dining",
-    "transportation",
-    "car_payment",
-    "fuel",
-    "insurance",
-    "health_insurance",
-    "car_insurance",
-    "life_insurance",
-    "home_insurance",
-    "repairs",
-    "clothing",
-    "shoes",
-    "accessories",
-    "entertainment",
-    "movies",
-    "concerts",
-    "subscriptions",
-    "streaming",
-    "cable",
-    "gym",
-    "hobbies",
-    "travel",
-    "flights",
-    "hotels",
-    "vacation",
-    "gifts",
-    "donations",
-    "charity",
-    "taxes",
-    "property_tax",
-    "income_tax",
-    "sales_tax",
-    "childcare",
-    "daycare",
-    "tuition",
-    "school_supplies",
-    "books",
-    "stationery",
-    "medical",
-    "doctor_visits",
-    "prescriptions",
-    "therapy",
-    "dental",
-    "vision",
-    "glasses",
-    "contacts",
-    "pet_care",
-    "vet_bills",
-    "pet_food",
-    "grooming",
-    "furniture",
-    "appliances",
-    "decor",
-    "cleaning_supplies",
-    "lawn_care",
-    "gardening",
-    "tools",
-    "equipment",
-    "software",
-    "hardware",
-    "computer",
-    "phone_upgrade",
-    "salary",
-    "wages",
-    "bonus",
-    "commission",
-    "tips",
-    "freelance",
-    "consulting",
-    "side_hustle",
-    "investments",
-    "stocks",
-    "bonds",
-    "dividends",
-    "interest",
-    "rental_income",
-    "royalties",
-    "pension",
-    "social_security",
-    "alimony",
-    "child_support",
-    "grants",
-    "scholarships",
-    "refunds",
-    "cashback",
-    "rewards",
-    "savings",
-    "inheritance",
-    "lottery",
-    "gambling",
-    "sales",
-    "resale",
-    "flipping",
-    "business_income",
-    "profit",
-    "revenue",
-    "advertising",
-    "sponsorships",
-    "merchandise",
-    "services",
-    "fees",
-    "dues",
-    "membership",
-    "parking",
-    "tolls",
-    "fines",
-    "penalties",
-    "legal_fees",
-    "accounting",
-    "bookkeeping",
-    "office_supplies",
-    "printing",
-    "postage",
-    "shipping",
-    "advertising_costs",
-    "marketing",
-    "website",
-    "domain",
-    "hosting",
-    "training",
-    "courses",
-    "certifications",
-    "conferences",
-    "seminars",
-    "workshops",
-    "networking",
-    "subscriptions",
-    "trade_shows",
-    "uniforms",
-    "work_clothes",
-    "safety_gear",
-    "commuting",
-    "mileage",
-    "relocation",
-    "moving",
-    "storage",
-    "warehouse",
-    "inventory",
-    "materials",
-    "supplies",
-    "packaging",
-    "utilities",
-    "rent",
-    "lease",
-    "equipment_rental",
-    "machinery",
-    "repairs",
-    "upgrades",
-    "renovations",
-    "construction",
-    "landscaping",
-    "pest_control",
-    "security",
-    "alarm_system",
-    "cameras",
-    "locks",
-    "fencing",
-    "plumbing",
-    "electrical",
-    "heating",
-    "cooling",
-    "roofing",
-    "painting",
-    "flooring",
-    "windows",
-    "doors",
-    "insulation",
-    "permits",
-    "licenses",
-    "registration",
-    "inspections",
-    "appraisals",
-    "surveys",
-    "closing_costs",
-    "real_estate",
-    "property",
-    "land",
-    "development",
-    "mortgage_interest",
-    "down_payment",
-    "escrow",
-    "HOA_fees",
-    "condo_fees",
-    "maintenance_fees",
-    "repairs",
-    "upgrades",
-    "appliances",
-    "furniture",
-    "staging",
-    "photography",
-    "listing_fees",
-    "commissions",
-    "agent_fees",
-    "title_insurance",
-    "flood_insurance",
-    "earthquake_insurance",
-    "umbrella_insurance",
-    "disability_insurance",
-    "long-term_care",
-    "premiums",
-    "deductibles",
-    "copays",
-    "out-of-pocket",
-    "therapy",
-    "counseling",
-    "rehab",
-    "detox",
-    "supplements",
-    "vitamins",
-    "gym_membership",
-    "personal_training",
-    "classes",
-    "yoga",
-    "pilates",
-    "sports",
-    "equipment",
-    "gear",
-    "uniforms",
-    "league_fees",
-    "coaching",
-    "camps",
-    "tournaments",
-    "travel",
-    "hotels",
-    "meals",
-    "snacks",
-    "drinks",
-    "coffee",
-    "alcohol",
-    "tobacco",
-    "vaping",
-    "subscriptions",
-    "magazines",
-    "newspapers",
-    "books",
-    "audiobooks",
-    "podcasts",
-    "apps",
-    "games",
-    "in-app_purchases",
-    "DLC",
-    "microtransactions",
-    "toys",
-    "games",
-    "crafts",
-    "art_supplies",
-    "music",
-    "instruments",
-    "lessons",
-    "tutoring",
-    "coaching",
-    "mentoring",
-    "babysitting",
-    "nanny",
-    "au_pair",
-    "eldercare",
-    "nursing",
-    "hospice",
-    "funeral",
-    "burial",
-    "cremation",
-    "memorial",
-    "flowers",
-    "catering",
-    "events",
-    "parties",
-    "weddings",
-    "receptions",
-    "invitations",
-    "decorations",
-    "photography",
-    "videography",
-    "DJ",
-    "band",
-    "venue",
-    "rentals",
-    "chairs",
-    "tables",
-    "linens",
-    "lighting",
-    "sound",
-    "staging",
-    "transportation",
-    "limo",
-    "shuttle",
-    "valet",
-    "tips",
-    "gratuity",
-    "service_fees",
-    "delivery",
-    "takeout",
-    "groceries",
-    "meal_prep",
-    "cooking",
-    "baking",
-    "ingredients",
-    "spices",
-    "cookware",
-    "bakeware",
-    "utensils",
-    "dishes",
-    "glassware",
-    "storage",
-    "containers",
-    "organization",
-    "shelving",
-    "bins",
-    "labels",
-    "cleaning",
-    "laundry",
-    "detergent",
-    "dry_cleaning",
-    "tailoring",
-    "alterations",
-    "shoes",
-    "boots",
-    "sandals",
-    "sneakers",
-    "heels",
-    "flats",
-    "slippers",
-    "socks",
-    "underwear",
-    "pajamas",
-    "robes",
-    "hats",
-    "gloves",
-    "scarves",
-    "coats",
-    "jackets",
-    "sweaters",
-    "shirts",
-    "pants",
-    "jeans",
-    "shorts",
-    "skirts",
-    "dresses",
-    "suits",
-    "ties",
-    "belts",
-    "bags",
-    "purses",
-    "wallets",
-    "jewelry",
-    "watches",
-    "sunglasses",
-    "umbrellas",
-    "rain_gear",
-    "snow_gear",
-    "camping",
-    "hiking",
-    "fishing",
-    "hunting",
-    "boating",
-    "sailing",
-    "kayaking",
-    "canoeing",
-    "rafting",
-    "swimming",
-    "diving",
-    "snorkeling",
-    "surfing",
-    "skiing",
-    "snowboarding",
-    "skateboarding",
-    "biking",
-    "cycling",
-    "running",
-    "marathon",
-    "triathlon",
-    "golf",
-    "tennis",
-    "basketball",
-    "soccer",
-    "football",
-    "baseball",
-    "softball",
-    "volleyball",
-    "hockey",
-    "lacrosse",
-    "rugby",
-    "wrestling",
-    "boxing",
-    "martial_arts",
-    "yoga_mats",
-    "weights",
-    "treadmill",
-    "elliptical",
-    "bike",
-    "rowing",
-    "climbing",
-    "gear",
-    "apparel",
-    "shoes",
-    "nutrition",
-    "protein",
-    "supplements",
-    "bars",
-    "shakes",
-    "water",
-    "electrolytes",
-    "recovery",
-    "massage",
-    "spa",
-    "sauna",
-    "steam",
-    "hot_tub",
-    "pool",
-    "maintenance",
-    "chemicals",
-    "filters",
-    "pumps",
-    "heaters",
-    "covers",
-    "toys",
-    "floats",
-    "goggles",
-    "towels",
-    "robes",
-    "slippers",
-    "sunscreen",
-    "lotion",
-    "skincare",
-    "haircare",
-    "shampoo",
-    "conditioner",
-    "styling",
-    "haircut",
-    "color",
-    "highlights",
-    "waxing",
-    "threading",
-    "nails",
-    "manicure",
-    "pedicure",
-    "makeup",
-    "brushes",
-    "tools",
-    "fragrance",
-    "perfume",
-    "cologne",
-    "deodorant",
-    "soap",
-    "body_wash",
-    "razors",
-    "shaving",
-    "toothpaste",
-    "toothbrush",
-    "floss",
-    "mouthwash",
-    "hygiene",
-    "tampons",
-    "pads",
-    "liners",
-    "birth_control",
-    "condoms",
-    "lube",
-    "toys",
-    "testing",
-    "screening",
-    "vaccines",
-    "boosters",
-    "flu_shot",
-    "checkups",
-    "physicals",
-    "bloodwork",
-    "imaging",
-    "x-rays",
-    "MRI",
-    "CT_scan",
-    "ultrasound",
-    "surgery",
-    "recovery",
-    "rehab",
-    "braces",
-    "retainers",
-    "whitening",
-    "fillings",
-    "crowns",
-    "root_canal",
-    "extraction",
-    "implants",
-    "hearing_aids",
-    "batteries",
-    "maintenance",
-    "repairs",
-    "upgrades",
-    "subscriptions",
-    "memberships",
-    "dues",
-    "fees",
-    "fines",
-    "penalties",
-    "interest",
-    "late_fees",
-    "overdraft",
-    "NSF_fees",
-    "ATM_fees",
-    "foreign_transaction",
-    "currency_exchange",
-    "wire_transfer",
-    "payment_processing",
-    "credit_card",
-    "rewards",
-    "points",
-    "miles",
-    "cashback",
-    "annual_fee",
-    "interest",
-    "balance_transfer",
-    "loan",
-    "principal",
-    "amortization",
-    "origination",
-    "closing_costs",
-    "PMI",
-    "escrow",
-    "taxes",
-    "filing",
-    "preparation",
-    "software",
-    "deductions",
-    "credits",
-    "audit",
-    "penalties",
-    "fines",
-    "liens",
-    "garnishments",
-    "bankruptcy",
-    "settlement",
-    "negotiation",
-    "mediation",
-    "arbitration",
-    "lawsuit",
-    "damages",
-    "compensation",
-    "award",
-    "severance",
-    "unemployment",
-    "disability",
-    "workers_comp",
-    "leave",
-    "vacation",
-    "sick_pay",
-    "maternity",
-    "paternity",
-    "adoption",
-    "childcare",
-    "preschool",
-    "kindergarten",
-    "elementary",
-    "middle_school",
-    "high_school",
-    "college",
-    "university",
-    "tuition",
-    "fees",
-    "room",
-    "board",
-    "meal_plan",
-    "books",
-    "supplies",
-    "laptop",
-    "tablet",
-    "software",
-    "internet",
-    "phone",
-    "transportation",
-    "parking",
-    "bus_pass",
-    "train_pass",
-    "bike",
-    "maintenance",
-    "repairs",
-    "gas",
-    "oil",
-    "tires",
-    "battery",
-    "brakes",
-    "alignment",
-    "tune-up",
-    "inspection",
-    "registration",
-    "tolls",
-    "tickets",
-    "fines",
-    "towing",
-    "storage",
-    "rental",
-    "lease",
-    "deposit",
-    "application",
-    "credit_check",
-    "background_check",
-    "references",
-    "utilities",
-    "hookup",
-    "installation",
-    "activation",
-    "cancellation",
-    "termination",
-    "penalties",
-    "deposits",
-    "refunds",
-    "rebates",
-    "coupons",
-    "discounts",
-    "sales",
-    "clearance",
-    "returns",
-    "exchanges",
-    "warranties",
-    "guarantees",
-    "extended_warranty",
-    "service_plan",
-    "repairs",
-    "parts",
-    "labor",
-    "shipping",
-    "handling",
-    "tax",
-    "duties",
-    "customs",
-    "brokerage",
-    "freight",
-    "delivery",
-    "pickup",
-    "curbside",
-    "installation",
-    "setup",
-    "haul_away",
-    "recycling",
-    "disposal",
-    "landfill",
-    "dump_fees",
-    "trash",
-    "garbage",
-    "recycling",
-    "compost",
-    "water",
-    "sewer",
-    "stormwater",
-    "electricity",
-    "gas",
-    "propane",
-    "oil",
-    "wood",
-    "coal",
-    "solar",
-    "wind",
-    "geothermal",
-    "battery",
-    "generator",
-    "inverter",
-    "panels",
-    "installation",
-    "maintenance",
-    "repairs",
-    "upgrades",
-    "monitoring",
-    "subscription",
-    "service",
-    "support",
-    "helpline",
-    "chat",
-    "email",
-    "tickets",
-    "cases",
-    "resolutions",
-    "refunds",
-    "credits",
-    "compensation",
-    "vouchers",
-    "gift_cards",
-    "certificates",
-    "loyalty",
-    "rewards",
-    "points",
-    "miles",
-    "tiers",
-    "status",
-    "upgrades",
-    "perks",
-    "benefits",
-    "discounts",
-    "promos",
-    "offers",
-    "deals",
-    "bundles",
-    "packages",
-    "subscriptions",
-    "renewals",
-    "cancellations",
-    "trials",
-    "samples",
-    "testers",
-    "demos",
-    "previews",
-    "beta",
-    "access",
-    "VIP",
-    "premium",
-    "elite",
-    "exclusive",
-    "limited",
-    "special",
-    "edition",
-    "collector",
-    "signed",
-    "numbered",
-    "rare",
-    "vintage",
-    "antique",
-    "used",
-    "pre-owned",
-    "refurbished",
-    "reconditioned",
-    "certified",
-    "inspected",
-    "tested",
-    "verified",
-    "authenticated",
-    "appraised",
-    "valued",
-    "insured",
-    "protected",
-    "secured",
-    "locked",
-    "encrypted",
-    "backed_up",
-    "stored",
-    "archived",
-    "retrieved",
-    "restored",
-    "recovered",
-    "repaired",
-    "fixed",
-    "serviced",
-    "maintained",
-    "cleaned",
-    "polished",
-    "detailed",
-    "washed",
-    "waxed",
-    "vacuumed",
-    "sanitized",
-    "disinfected",
-    "sterilized",
-    "filtered",
-    "purified",
-    "treated",
-    "processed",
-    "packaged",
-    "shipped",
-    "tracked",
-    "delivered",
-    "received",
-    "signed",
-    "confirmed",
-    "accepted",
-    "rejected",
-    "returned",
-    "refunded",
-    "exchanged",
-    "replaced",
-    "upgraded",
-    "updated",
-    "patched",
-    "fixed",
-    "debugged",
-    "tested",
-    "deployed",
-    "launched",
-    "released",
-    "published",
-    "distributed",
-    "sold",
-    "purchased",
-    "leased",
-    "rented",
-    "borrowed",
-    "loaned",
-    "financed",
-    "crowdfunded",
-    "backed",
-    "supported",
-    "donated",
-    "gifted",
-    "granted",
-    "awarded",
-    "won",
-    "earned",
-    "accrued",
-    "accumulated",
-    "compounded",
-    "invested",
-    "diversified",
-    "balanced",
-    "rebalanced",
-    "adjusted",
-    "monitored",
-    "tracked",
-    "reported",
-    "analyzed",
-    "audited",
-    "reviewed",
-    "assessed",
-    "evaluated",
-    "rated",
-    "ranked",
-    "scored",
-    "graded",
-    "certified",
-    "accredited",
-    "licensed",
-    "registered",
-    "patented",
-    "trademarked",
-    "copyrighted",
-    "protected",
-    "insured",
-    "bonded",
-    "guaranteed",
-    "warranted",
-    "secured",
-    "collateral",
-    "equity",
-    "shares",
-    "units",
-    "options",
-    "futures",
-    "derivatives",
-    "commodities",
-    "currencies",
-    "crypto",
-    "tokens",
-    "NFTs",
-    "blockchain",
-    "wallet",
-    "exchange",
-    "trading",
-    "fees",
-    "commissions",
-    "spreads",
-    "slippage",
-    "leverage",
-    "margin",
-    "interest",
-    "dividends",
-    "capital_gains",
-    "losses",
-    "write-offs",
-    "depreciation",
-    "amortization",
-    "depletion",
-    "impairment",
-    "restructuring",
-    "merger",
-    "acquisition",
-    "divestiture",
-    "spin-off",
-    "IPO",
-    "offering",
-    "subscription",
-    "redemption",
-    "conversion",
-    "exercise",
-    "expiration",
-    "settlement",
-    "clearing",
-    "custody",
-    "escrow",
-    "trust",
-    "estate",
-    "will",
-    "probate",
-    "inheritance",
-    "legacy",
-    "bequest",
-    "endowment",
-    "foundation",
-    "grant",
-    "scholarship",
-    "fellowship",
-    "award",
-    "prize",
-    "trophy",
-    "medal",
-    "certificate",
-    "diploma",
-    "degree",
-    "credential",
-    "badge",
-    "recognition",
-    "honor",
-    "distinction",
-    "title",
-    "rank",
-    "position",
-    "promotion",
-    "raise",
-    "bonus",
-    "incentive",
-    "commission",
-    "royalty",
-    "residual",
-    "annuity",
-    "payout",
-    "distribution",
-    "disbursement",
-    "refund",
-    "rebate",
-    "credit",
-    "adjustment",
-    "allowance",
-    "stipend",
-    "subsidy",
-    "assistance",
-    "relief",
-    "aid",
-    "welfare",
-    "benefit",
-    "entitlement",
-    "pension",
-    "retirement",
-    "401k",
-    "IRA",
-    "Roth",
-    "rollover",
-    "withdrawal",
-    "contribution",
-    "match",
-    "vesting",
-    "forfeiture",
-    "penalty",
-    "tax",
-    "deduction",
-    "exemption",
-    "exclusion",
-    "credit",
-    "deferral",
-    "acceleration",
-    "recognition",
-    "realization",
-    "crystallization",
-    "liquidation",
-    "dissolution",
-    "termination",
-    "cancellation",
-    "expiration",
-    "lapse",
-    "renewal",
-    "extension",
-    "amendment",
-    "modification",
-    "revision",
-    "update",
-    "upgrade",
-    "enhancement",
-    "improvement",
-    "optimization",
-    "efficiency",
-    "productivity",
-    "performance",
-    "output",
-    "yield",
-    "return",
-    "ROI",
-    "profit",
-    "margin",
-    "markup",
-    "overhead",
-    "cost",
-    "expense",
-    "expenditure",
-    "outlay",
-    "payment",
-    "disbursement",
-    "invoice",
-    "bill",
-    "receipt",
-    "statement",
-    "balance",
-    "ledger",
-    "account",
-    "reconciliation",
-    "adjustment",
-    "correction",
-    "error",
-    "discrepancy",
-    "variance",
-    "deviation",
-    "fluctuation",
-    "volatility",
-    "risk",
-    "exposure",
-    "liability",
-    "obligation",
-    "debt",
-    "loan",
-    "mortgage",
-    "lien",
-    "encumbrance",
-    "default",
-    "delinquency",
-    "foreclosure",
-    "repossession",
-    "bankruptcy",
-    "insolvency",
-    "restructuring",
-    "workout",
-    "settlement",
-    "compromise",
-    "agreement",
-    "contract",
-    "lease",
-    "rental",
-    "subscription",
-    "membership",
-    "enrollment",
-    "registration",
-    "application",
-    "admission",
-    "entry",
-    "access",
-    "permission",
-    "authorization",
-    "approval",
-    "consent",
-    "license",
-    "permit",
-    "certificate",
-    "credential",
-    "accreditation",
-    "certification",
-    "validation",
-    "verification",
-    "authentication",
-    "confirmation",
-    "endorsement",
-    "recommendation",
-    "referral",
-    "reference",
-    "testimonial",
-    "review",
-    "rating",
-    "ranking",
-    "score",
-    "grade",
-    "assessment",
-    "evaluation",
-    "appraisal",
-    "estimate",
-    "quote",
-    "bid",
-    "offer",
-    "proposal",
-    "tender",
-    "contract",
-    "agreement",
-    "deal",
-    "transaction",
-    "purchase",
-    "sale",
-    "exchange",
-    "trade",
-    "barter",
-    "swap",
-    "transfer",
-    "assignment",
-    "conveyance",
-    "delivery",
-    "shipment",
-    "dispatch",
-    "distribution",
-    "allocation",
-    "apportionment",
-    "division",
-    "split",
-    "share",
-    "portion",
-    "percentage",
-    "ratio",
-    "proportion",
-    "fraction",
-    "segment",
-    "slice",
-    "cut",
-    "piece",
-    "unit",
-    "item",
-    "article",
-    "product",
-    "good",
-    "commodity",
-    "merchandise",
-    "inventory",
-    "stock",
-    "supply",
-    "reserve",
-    "surplus",
-    "excess",
-    "shortage",
-    "deficit",
-    "demand",
-    "need",
-    "requirement",
-    "necessity",
-    "essential",
-    "priority",
-    "urgency",
-    "emergency",
-    "contingency",
-    "backup",
-    "redundancy",
-    "safety",
-    "security",
-    "protection",
-    "insurance",
-    "coverage",
-    "policy",
-    "premium",
-    "deductible",
-    "claim",
-    "settlement",
-    "payout",
-    "compensation",
-    "reimbursement",
-    "refund",
-    "rebate",
-    "credit",
-    "discount",
-    "allowance",
-    "concession",
-    "compromise",
-    "negotiation",
-    "bargaining",
-    "haggling",
-    "deal",
-    "arrangement",
-    "understanding",
-    "pact",
-    "accord",
-    "alliance",
-    "partnership",
-    "collaboration",
-    "cooperation",
-    "joint_venture",
-    "merger",
-    "acquisition",
-    "consolidation",
-    "integration",
-    "unification",
-    "standardization",
-    "normalization",
-    "regulation",
-    "compliance",
-    "adherence",
-    "conformity",
-    "alignment",
-    "adjustment",
-    "adaptation",
-    "modification",
-    "alteration",
-    "change",
-    "transition",
-    "transformation",
-    "conversion",
-    "evolution",
-    "development",
-    "growth",
-    "expansion",
-    "increase",
-    "augmentation",
-    "amplification",
-    "enhancement",
-    "improvement",
-    "upgrade",
-    "update",
-    "revision",
-    "refinement",
-    "optimization",
-    "streamlining",
-    "simplification",
-    "automation",
-    "digitization",
-    "modernization",
-    "innovation",
-    "invention",
-    "creation",
-    "design",
-    "development",
-    "production",
-    "manufacturing",
-    "fabrication",
-    "assembly",
-    "construction",
-    "building",
-    "installation",
-    "setup",
-    "deployment",
-    "implementation",
-    "execution",
-    "operation",
-    "management",
-    "administration",
-    "supervision",
-    "oversight",
-    "monitoring",
-    "tracking",
-    "measurement",
-    "analysis",
-    "assessment",
-    "evaluation",
-    "review",
-    "audit",
-    "inspection",
-    "examination",
-    "investigation",
-    "research",
-    "study",
-    "survey",
-    "poll",
-    "questionnaire",
-    "interview",
-    "observation",
-    "experiment",
-    "test",
-    "trial",
-    "pilot",
-    "prototype",
-    "demo",
-    "sample",
-    "example",
-    "case",
-    "instance",
-    "scenario",
-    "situation",
-    "circumstance",
-    "condition",
-    "state",
-    "status",
-    "position",
-    "standing",
-    "rank",
-    "level",
-    "tier",
-    "grade",
-    "class",
-    "category",
-    "type",
-    "kind",
-    "sort",
-    "variety",
-    "form",
-    "format",
-    "style",
-    "mode",
-    "method",
-    "approach",
-    "technique",
-    "strategy",
-    "tactic",
-    "plan",
-    "scheme",
-    "program",
-    "project",
-    "initiative",
-    "campaign",
-    "effort",
-    "endeavor",
-    "undertaking",
-    "task",
-    "assignment",
-    "duty",
-    "responsibility",
-    "obligation",
-    "commitment",
-    "promise",
-    "pledge",
-    "vow",
-    "oath",
-    "guarantee",
-    "warranty",
-    "assurance",
-    "certainty",
-    "confidence",
-    "trust",
-    "faith",
-    "belief",
-    "expectation",
-    "anticipation",
-    "forecast",
-    "prediction",
-    "projection",
-    "estimate",
-    "guess",
-    "speculation",
-    "assumption",
-    "presumption",
-    "hypothesis",
-    "theory",
-    "model",
-    "framework",
-    "system",
-    "structure",
-    "organization",
-    "arrangement",
-    "configuration",
-    "composition",
-    "makeup",
-    "constitution",
-    "construction",
-    "design",
-    "pattern",
-    "layout",
-    "plan",
-    "blueprint",
-    "schematic",
-    "diagram",
-    "chart",
-    "graph",
-    "table",
-    "list",
-    "index",
-    "catalog",
-    "directory",
-    "database",
-    "record",
-    "file",
-    "document",
-    "report",
-    "statement",
-    "summary",
-    "overview",
-    "review",
-    "analysis",
-    "breakdown",
-    "detail",
-    "specification",
-    "description",
-    "explanation",
-    "interpretation",
-    "commentary",
-    "narrative",
-    "story",
-    "account",
-    "history",
-    "log",
-    "journal",
-    "diary",
-    "memoir",
-    "biography",
-    "autobiography",
-    "profile",
-    "portrait",
-    "sketch",
-    "outline",
-    "draft",
-    "version",
-    "edition",
-    "copy",
-    "duplicate",
-    "replica",
-    "reproduction",
-    "clone",
-    "facsimile",
-    "image",
-    "picture",
-    "photo",
-    "photograph",
-    "snapshot",
-    "shot",
-    "frame",
-    "scene",
-    "view",
-    "perspective",
-    "angle",
-    "aspect",
-    "facet",
-    "dimension",
-    "element",
-    "component",
-    "part",
-    "piece",
-    "section",
-    "segment",
-    "portion",
-    "division",
-    "unit",
-    "module",
-    "block",
-    "chunk",
-    "slice",
-    "layer",
-    "level",
-    "stage",
-    "phase",
-    "step",
-    "process",
-    "procedure",
-    "protocol",
-    "routine",
-    "practice",
-    "habit",
-    "custom",
-    "tradition",
-    "convention",
-    "norm",
-    "standard",
-    "rule",
-    "regulation",
-    "law",
-    "policy",
-    "guideline",
-    "principle",
-    "doctrine",
-    "tenet",
-    "precept",
-    "maxim",
-    "axiom",
-    "theorem",
-    "formula",
-    "equation",
-    "calculation",
-    "computation",
-    "estimation",
-    "measurement",
-    "quantification",
-    "assessment",
-    "evaluation",
-    "appraisal",
-    "valuation",
-    "rating",
-    "ranking",
-    "scoring",
-    "grading",
-    "classification",
-    "categorization",
-    "sorting",
-    "ordering",
-    "arrangement",
-    "organization",
-    "grouping",
-    "clustering",
-    "bunching",
-    "bundling",
-    "packaging",
-    "packing",
-    "boxing",
-    "crating",
-    "shipping",
-    "transport",
-    "delivery",
-    "distribution",
-    "dissemination",
-    "dispersion",
-    "scattering",
-    "spreading",
-    "broadcasting",
-    "transmission",
-    "communication",
-    "publication",
-    "release",
-    "announcement",
-    "disclosure",
-    "revelation",
-    "exposure",
-    "display",
-    "presentation",
-    "demonstration",
-    "exhibition",
-    "show",
-    "performance",
-    "act",
-    "play",
-    "production",
-    "event",
-    "occasion",
-    "happening",
-    "occurrence",
-    "incident",
-    "episode",
-    "experience",
-    "encounter",
-    "interaction",
-    "engagement",
-    "involvement",
-    "participation",
-    "contribution",
-    "input",
-    "feedback",
-    "response",
-    "reply",
-    "answer",
-    "solution",
-    "resolution",
-    "decision",
-    "determination",
-    "conclusion",
-    "outcome",
-    "result",
-    "effect",
-    "impact",
-    "consequence",
-    "implication",
-    "ramification",
-    "repercussion",
-    "aftermath",
-    "fallout",
-    "ripple",
-    "wave",
-    "chain",
-    "sequence",
-    "series",
-    "progression",
-    "succession",
-    "continuation",
-    "extension",
-    "prolongation",
-    "duration",
-    "period",
-    "term",
-    "tenure",
-    "span",
-    "stretch",
-    "length",
-    "time",
-    "timing",
-    "schedule",
-    "timetable",
-    "agenda",
-    "calendar",
-    "plan",
-    "itinerary",
-    "route",
-    "path",
-    "course",
-    "track",
-    "trail",
-    "way",
-    "direction",
-    "orientation",
-    "bearing",
-    "heading",
-    "destination",
-    "target",
-    "goal",
-    "objective",
-    "aim",
-    "purpose",
-    "intent",
-    "intention",
-    "ambition",
-    "aspiration",
-    "dream",
-    "vision",
-    "mission",
-    "quest",
-    "pursuit",
-    "chase",
-    "hunt",
-    "search",
-    "exploration",
-    "discovery",
-    "finding",
-    "revelation",
-    "insight",
-    "realization",
-    "understanding",
-    "comprehension",
-    "grasp",
-    "knowledge",
-    "wisdom",
-    "intelligence",
-    "information",
-    "data",
-    "facts",
-    "details",
-    "particulars",
-    "specifics",
-    "evidence",
-    "proof",
-    "confirmation",
-    "verification",
-    "validation",
-    "authentication",
-    "certification",
-    "endorsement",
-    "approval",
-    "sanction",
-    "authorization",
-    "permission",
-    "consent",
-    "agreement",
-    "accord",
-    "harmony",
-    "unity",
-    "alignment",
-    "synchronization",
-    "coordination",
-    "cooperation",
-    "collaboration",
-    "partnership",
-    "alliance",
-    "union",
-    "merger",
-    "fusion",
-    "integration",
-    "combination",
-    "blend",
-    "mix",
-    "mixture",
-    "compound",
-    "composite",
-    "synthesis",
-    "creation",
-    "generation",
-    "production",
-    "manufacture",
-    "fabrication",
-    "construction",
-    "building",
-    "assembly",
-    "compilation",
-    "collection",
-    "gathering",
-    "accumulation",
-    "aggregation",
-    "amassing",
-    "stockpiling",
-    "hoarding",
-    "storage",
-    "preservation",
-    "conservation",
-    "maintenance",
-    "upkeep",
-    "repair",
-    "service",
-    "support",
-    "assistance",
-    "help",
-    "aid",
-    "relief",
-    "benefit",
-    "advantage",
-    "gain",
-    "profit",
-    "return",
-    "yield",
-    "reward",
-    "payoff",
-    "dividend",
-    "interest",
-    "income",
-    "revenue",
-    "earnings",
-    "proceeds",
-    "receipts",
-    "takings",
-    "turnover",
-    "output",
-    "production",
-    "harvest",
-    "crop",
-    "haul",
-    "catch",
-    "take",
-    "score",
-    "win",
-    "victory",
-    "success",
-    "achievement",
-    "accomplishment",
-    "attainment",
-    "realization",
-    "fulfillment",
-    "completion",
-    "conclusion",
-    "finish",
-    "end",
-    "termination",
-    "closure",
-    "wrap-up",
-    "wind-up",
-    "shutdown",
-    "cessation",
-    "stop",
-    "halt",
-    "pause",
-    "break",
-    "interruption",
-    "suspension",
-    "delay",
-    "postponement",
-    "deferral",
-    "adjournment",
-    "rescheduling",
-    "cancellation",
-    "annulment",
-    "revocation",
-    "repeal",
-    "withdrawal",
-    "retraction",
-    "recall",
-    "return",
-    "refund",
-    "reimbursement",
-    "repayment",
-    "restitution",
-    "compensation",
-    "indemnification",
-    "redress",
-    "remedy",
-    "cure",
-    "fix",
-    "repair",
-    "restoration",
-    "recovery",
-    "revival",
-    "renewal",
-    "rejuvenation",
-    "regeneration",
-    "revitalization",
-    "refreshment",
-    "update",
-    "upgrade",
-    "improvement",
-    "enhancement",
-    "refinement",
-    "polish",
-    "perfection",
-    "optimization",
-    "maximization",
-    "increase",
-    "growth",
-    "expansion",
-    "extension",
-    "augmentation",
-    "amplification",
-    "escalation",
-    "elevation",
-    "rise",
-    "climb",
-    "ascent",
-    "uplift",
-    "boost",
-    "promotion",
-    "advancement",
-    "progress",
-    "development",
-    "evolution",
-    "transformation",
-    "transition",
-    "change",
-    "shift",
-    "switch",
-    "pivot",
-    "turn",
-    "twist",
-    "bend",
-    "curve",
-    "arc",
-    "loop",
-    "cycle",
-    "rotation",
-    "revolution",
-    "orbit",
-    "circuit",
-    "round",
-    "lap",
-    "tour",
-    "trip",
-    "journey",
-    "voyage",
-    "expedition",
-    "adventure",
-    "exploration",
-    "quest",
-    "mission",
-    "campaign",
-    "drive",
-    "push",
-    "thrust",
-    "effort",
-    "endeavor",
-    "attempt",
-    "try",
-    "shot",
-    "stab",
-    "crack",
-    "go",
-    "run",
-    "spell",
-    "stint",
-    "stretch",
-    "term",
-    "period",
-    "duration",
-    "tenure",
-    "reign",
-    "rule",
-    "dominion",
-    "control",
-    "command",
-    "authority",
-    "power",
-    "influence",
-    "sway",
-    "leverage",
-    "pull",
-    "clout",
-    "weight",
-    "force",
-    "strength",
-    "might",
-    "energy",
-    "vigor",
-    "vitality",
-    "life",
-    "spirit",
-    "soul",
-    "essence",
-    "core",
-    "heart",
-    "center",
-    "nucleus",
-    "hub",
-    "base",
-    "foundation",
-    "groundwork",
-    "bedrock",
-    "root",
-    "source",
-    "origin",
-    "beginning",
-    "start",
-    "launch",
-    "kickoff",
-    "initiation",
-    "inception",
-    "opening",
-    "debut",
-    "premiere",
-    "introduction",
-    "presentation",
-    "unveiling",
-    "reveal",
-    "disclosure",
-    "exposure",
-    "announcement",
-    "publication",
-    "release",
-    "broadcast",
-    "transmission",
-    "dissemination",
-    "distribution",
-    "sharing",
-    "spreading",
-    "circulation",
-    "promotion",
-    "marketing",
-    "advertising",
-    "publicity",
-    "exposure",
-    "coverage",
-    "attention",
-    "notice",
-    "recognition",
-    "acknowledgment",
-    "credit",
-    "praise",
-    "acclaim",
-    "applause",
-    "approval",
-    "acceptance",
-    "adoption",
-    "embrace",
-    "welcome",
-    "reception",
-    "greeting",
-    "hospitality",
-    "accommodation",
-    "housing",
-    "lodging",
-    "shelter",
-    "refuge",
-    "sanctuary",
-    "haven",
-    "retreat",
-    "escape",
-    "getaway",
-    "vacation",
-    "holiday",
-    "break",
-    "recess",
-    "respite",
-    "rest",
-    "relaxation",
-    "leisure",
-    "recreation",
-    "play",
-    "fun",
-    "enjoyment",
-    "pleasure",
-    "satisfaction",
-    "happiness",
-    "joy",
-    "delight",
-    "thrill",
-    "excitement",
-    "adventure",
-    "experience",
-    "event",
-    "occasion",
-    "celebration",
-    "festivity",
-    "party",
-    "gathering",
-    "meeting",
-    "assembly",
-    "conference",
-    "convention",
-    "summit",
-    "symposium",
-    "seminar",
-    "workshop",
-    "training",
-    "education",
-    "learning",
-    "study",
-    "research",
-    "investigation",
-    "inquiry",
-    "exploration",
-    "discovery",
-    "invention",
-    "innovation",
-    "creation",
-    "design",
-    "development",
-    "progress",
-    "advancement",
-    "improvement",
-    "enhancement",
-    "upgrade",
-    "update",
-    "revision",
-    "modification",
-    "adjustment",
-    "adaptation",
-    "evolution",
-    "transformation",
-    "change",
-    "shift",
-    "transition",
-    "move",
-    "relocation",
-    "migration",
-    "travel",
-    "journey",
-    "trip",
-    "tour",
-    "voyage",
-    "expedition",
-    "outing",
-    "excursion",
-    "jaunt",
-    "stroll",
-    "walk",
-    "hike",
-    "trek",
-    "climb",
-    "ascent",
-    "descent",
-    "ride",
-    "drive",
-    "cruise",
-    "flight",
-    "sailing",
-    "navigation",
-    "passage",
-    "crossing",
-    "transit",
-    "transfer",
-    "transport",
-    "shipment",
-    "delivery",
-    "dispatch",
-    "distribution",
-    "allocation",
-    "assignment",
-    "placement",
-    "positioning",
-    "arrangement",
-    "organization",
-    "order",
-    "sequence",
-    "series",
-    "succession",
-    "progression",
-    "chain",
-    "link",
-    "connection",
-    "tie",
-    "bond",
-    "attachment",
-    "association",
-    "affiliation",
-    "alliance",
-    "partnership",
-    "collaboration",
-    "cooperation",
-    "coordination",
-    "teamwork",
-    "unity",
-    "harmony",
-    "agreement",
-    "accord",
-    "understanding",
-    "consensus",
-    "deal",
-    "contract",
-    "pact",
-    "treaty",
-    "settlement",
-    "resolution",
-    "solution",
-    "answer",
-    "response",
-    "reply",
-    "feedback",
-    "input",
-    "contribution",
-    "participation",
-    "involvement",
-    "engagement",
-    "interaction",
-    "communication",
-    "dialogue",
-    "conversation",
-    "discussion",
-    "debate",
-    "negotiation",
-    "mediation",
-    "arbitration",
-    "compromise",
-    "concession",
-    "allowance",
-    "adjustment",
-    "accommodation",
-    "adaptation",
-    "modification",
-    "change",
-    "alteration",
-    "revision",
-    "update",
-    "upgrade",
-    "improvement",
-    "enhancement",
-    "refinement",
-    "optimization",
-    "perfection",
-    "completion",
-    "fulfillment",
-    "realization",
-    "achievement",
-    "success",
-    "victory",
-    "win",
-    "triumph",
-    "conquest",
-    "mastery",
-    "dominance",
-    "supremacy",
-    "superiority",
-    "excellence",
-    "quality",
-    "merit",
-    "worth",
-    "value",
-    "benefit",
-    "advantage",
-    "gain",
-    "profit",
-    "return",
-    "reward",
-    "compensation",
-    "payment",
-    "wage",
-    "salary",
-    "income",
-    "revenue",
-    "earnings",
-    "proceeds",
-    "receipts",
-    "turnover",
-    "profit",
-    "margin",
-    "markup",
-    "increase",
-    "growth",
-    "expansion",
-    "development",
-    "progress",
-    "advancement",
-    "promotion",
-    "elevation",
-    "rise",
-    "boost",
-    "uplift",
-    "enhancement",
-    "improvement",
-    "upgrade",
-    "update",
-    "renewal",
-    "revival",
-    "recovery",
-    "restoration",
-    "repair",
-    "fix",
-    "solution",
-    "remedy",
-    "cure",
-    "relief",
-    "aid",
-    "assistance",
-    "help",
-    "support",
-    "backing",
-    "reinforcement",
-    "strength",
-    "power",
-    "force",
-    "energy",
-    "effort",
-    "work",
-    "labor",
-    "task",
-    "job",
-    "duty",
-    "responsibility",
-    "obligation",
-    "commitment",
-    "promise",
-    "pledge",
-    "guarantee",
-    "assurance",
-    "certainty",
-    "confidence",
-    "trust",
-    "faith",
-    "belief",
-    "expectation",
-    "hope",
-    "wish",
-    "desire",
-    "want",
-    "need",
-    "demand",
-    "requirement",
-    "necessity",
-    "essential",
-    "priority",
-    "urgency",
-    "importance",
-    "significance",
-    "meaning",
-    "purpose",
-    "goal",
-    "objective",
-    "aim",
-    "target",
-    "destination",
-    "end",
-    "finish",
-    "conclusion",
-    "outcome",
-    "result",
-    "effect",
-    "impact",
-    "consequence",
-    "benefit",
-    "advantage",
-    "gain",
-    "profit",
-    "return",
-    "yield",
-    "harvest",
-    "production",
-    "output",
-    "revenue",
-    "income",
-    "earnings",
-    "wealth",
-    "riches",
-    "fortune",
-    "treasure",
-    "assets",
-    "resources",
-    "capital",
-    "funds",
-    "money",
-    "cash",
-    "currency",
-    "coin",
-    "bills",
-    "notes",
-    "checks",
-    "drafts",
-    "transfers",
-    "deposits",
-    "withdrawals",
-    "savings",
-    "investments",
-    "stocks",
-    "bonds",
-    "securities",
-    "shares",
-    "equity",
-    "ownership",
-    "property",
-    "real_estate",
-    "land",
-    "buildings",
-    "homes",
-    "houses",
-    "apartments",
-    "condos",
-    "rentals",
-    "leases",
-    "mortgages",
-    "loans",
-    "debts",
-    "liabilities",
-    "obligations",
-    "bills",
-    "invoices",
-    "accounts",
-    "expenses",
-    "costs",
-    "expenditures",
-    "outlays",
-    "payments",
-    "disbursements",
-    "fees",
-    "charges",
-    "rates",
-    "prices",
-    "values",
-    "worth",
-    "estimates",
-    "appraisals",
-    "assessments",
-    "evaluations",
-    "analyses",
-    "reviews",
-    "audits",
-    "inspections",
-    "examinations",
-    "surveys",
-    "studies",
-    "research",
-    "investigations",
-    "inquiries",
-    "questions",
-    "queries",
-    "searches",
-    "explorations",
-    "discoveries",
-    "findings",
-    "insights",
-    "revelations",
-    "realizations",
-    "understandings",
-    "knowledge",
-    "information",
-    "data",
-    "facts",
-    "details",
-    "specifics",
-    "particulars",
-    "evidence",
-    "proof",
-    "confirmation",
-    "verification",
-    "validation",
-    "certification",
-    "authentication",
-    "authorization",
-    "approval",
-    "permission",
-    "consent",
-    "agreement",
-    "acceptance",
-    "adoption",
-    "endorsement",
-    "support",
-    "backing",
-    "promotion",
-    "advancement",
-    "progress",
-    "development",
-    "growth",
-    "expansion",
-    "increase",
-    "rise",
-    "elevation",
-    "upgrade",
-    "improvement",
-    "enhancement",
-    "refinement",
-    "optimization",
-    "perfection",
-    "excellence",
-    "quality",
-    "merit",
-    "virtue",
-    "benefit",
-    "advantage",
-    "gain",
-    "profit",
-    "return",
-    "reward",
-    "compensation",
-    "reimbursement",
-    "refund",
-    "rebate",
-    "credit",
-    "discount",
-    "saving",
-    "economy",
-    "thrift",
-    "frugality",
-    "prudence",
-    "caution",
-    "care",
-    "attention",
-    "focus",
-    "concentration",
-    "effort",
-    "work",
-    "labor",
-    "task",
-    "job",
-    "project",
-    "undertaking",
-    "endeavor",
-    "pursuit",
-    "quest",
-    "mission",
-    "goal",
-    "aim",
-    "objective",
-    "target",
-    "purpose",
-    "intention",
-    "plan",
-    "scheme",
-    "strategy",
-    "tactic",
-    "method",
-    "approach",
-    "technique",
-    "process",
-    "procedure",
-    "system",
-    "structure",
-    "framework",
-    "model",
-    "design",
-    "pattern",
-    "blueprint",
-    "plan",
-    "scheme",
-    "program",
-    "schedule",
-    "agenda",
-    "timeline",
-    "timetable",
-    "calendar",
-    "itinerary",
-    "route",
-    "path",
-    "course",
-    "direction",
-    "way",
-    "road",
-    "street",
-    "avenue",
-    "highway",
-    "freeway",
-    "turnpike",
-    "tollway",
-    "bridge",
-    "tunnel",
-    "passage",
-    "channel",
-    "corridor",
-    "lane",
-    "track",
-    "trail",
-    "walkway",
-    "sidewalk",
-    "path",
-    "pathway",
-    "driveway",
-    "parking",
-    "garage",
-    "lot",
-    "space",
-    "spot",
-    "place",
-    "location",
-    "site",
-    "position",
-    "point",
-    "area",
-    "zone",
-    "region",
-    "district",
-    "territory",
-    "land",
-    "property",
-    "estate",
-    "realty",
-    "holdings",
-    "possessions",
-    "belongings",
-    "assets",
-    "resources",
-    "wealth",
-    "capital",
-    "funds",
-    "money",
-    "finances",
-    "budget",
-    "accounts",
-    "books",
-    "records",
-    "ledger",
-    "balance",
-    "statement",
-    "report",
-    "summary",
-    "overview",
-    "analysis",
-    "breakdown",
-    "review",
-    "assessment",
-    "evaluation",
-    "appraisal",
-    "estimate",
-    "projection",
-    "forecast",
-    "prediction",
-    "outlook",
-    "expectation",
-    "anticipation",
-    "prospect",
-    "possibility",
-    "potential",
-    "opportunity",
-    "chance",
-    "option",
-    "choice",
-    "alternative",
-    "selection",
-    "decision",
-    "determination",
-    "resolution",
-    "conclusion",
-    "outcome",
-    "result",
-    "effect",
-    "impact",
-    "consequence",
-    "influence",
-    "power",
-    "authority",
-    "control",
-    "command",
-    "direction",
-    "guidance",
-    "leadership",
-    "management",
-    "administration",
-    "supervision",
-    "oversight",
-    "monitoring",
-    "observation",
-    "watch",
-    "surveillance",
-    "tracking",
-    "following",
-    "pursuit",
-    "chase",
-    "hunt",
-    "search",
-    "quest",
-    "exploration",
-    "investigation",
-    "inquiry",
-    "research",
-    "study",
-    "analysis",
-    "examination",
-    "inspection",
-    "review",
-    "audit",
-    "check",
-    "verification",
-    "validation",
-    "confirmation",
-    "proof",
-    "evidence",
-    "testimony",
-    "witness",
-    "account",
-    "story",
-    "narrative",
-    "description",
-    "explanation",
-    "interpretation",
-    "understanding",
-    "comprehension",
-    "grasp",
-    "knowledge",
-    "wisdom",
-    "intelligence",
-    "insight",
-    "realization",
-    "discovery",
-    "finding",
-    "revelation",
-    "breakthrough",
-    "innovation",
-    "invention",
-    "creation",
-    "development",
-    "progress",
-    "advancement",
-    "improvement",
-    "enhancement",
-    "upgrade",
-    "update",
-    "renewal",
-    "revival",
-    "restoration",
-    "recovery",
-    "repair",
-    "fix",
-    "solution",
-    "remedy",
-    "cure",
-    "relief",
-    "help",
-    "aid",
-    "assistance",
-    "support",
-    "benefit",
-    "advantage",
-    "gain",
-    "profit",
-    "return",
-    "reward",
-    "payoff",
-    "dividend",
-    "interest",
-    "income",
-    "revenue",
-    "earnings",
-    "proceeds",
-    "receipts",
-    "takings",
-    "turnover",
-    "output",
-    "production",
-    "yield",
-    "harvest",
-    "crop",
-    "haul",
-    "catch",
-    "take",
-    "score",
-    "win",
-    "victory",
-    "success",
-    "achievement",
-    "accomplishment",
-    "attainment",
-    "realization",
-    "fulfillment",
-    "completion",
-    "finish",
-    "end",
-    "closure",
-    "conclusion",
-    "termination",
-    "cessation",
-    "stop",
-    "halt",
-    "pause",
-    "break",
-    "rest",
-    "respite",
-    "recess",
-    "vacation",
-    "holiday",
-    "leave",
-    "absence",
-    "getaway",
-    "escape",
-    "retreat",
-    "refuge",
-    "shelter",
-    "sanctuary",
-    "haven",
-    "home",
-    "house",
-    "residence",
-    "dwelling",
-    "abode",
-    "habitat",
-    "lodging",
-    "quarters",
-    "accommodations",
-    "apartment",
-    "condo",
-    "flat",
-    "unit",
-    "suite",
-    "room",
-    "space",
-    "place",
-    "spot",
-    "location",
-    "site",
-    "position",
-    "point",
-    "area",
-    "zone",
-    "region",
-    "district",
-    "neighborhood",
-    "community",
-    "town",
-    "city",
-    "county",
-    "state",
-    "province",
-    "country",
-    "nation",
-    "continent",
-    "world",
-    "globe",
-    "planet",
-    "earth",
-    "environment",
-    "nature",
-    "outdoors",
-    "wilderness",
-    "wild",
-    "forest",
-    "woods",
-    "jungle",
-    "bush",
-    "plains",
-    "prairie",
-    "steppe",
-    "desert",
-    "tundra",
-    "mountains",
-    "hills",
-    "valleys",
-    "canyons",
-    "cliffs",
-    "peaks",
-    "ridges",
-    "slopes",
-    "plateaus",
-    "basins",
-    "ranges",
-    "coast",
-    "shore",
-    "beach",
-    "seaside",
-    "ocean",
-    "sea",
-    "lake",
-    "river",
-    "stream",
-    "creek",
-    "brook",
-    "pond",
-    "pool",
-    "waterfall",
-    "spring",
-    "well",
-    "reservoir",
-    "dam",
-    "canal",
-    "channel",
-    "ditch",
-    "trench",
-    "bay",
-    "gulf",
-    "cove",
-    "inlet",
-    "harbor",
-    "port",
-    "dock",
-    "pier",
-    "wharf",
-    "quay",
-    "marina",
-    "anchorage",
-    "mooring",
-    "landing",
-    "terminal",
-    "station",
-    "depot",
-    "hub",
-    "center",
-    "nexus",
-    "core",
-    "heart",
-    "middle",
-    "midst",
-    "interior",
-    "inside",
-    "indoors",
-    "room",
-    "chamber",
-    "hall",
-    "corridor",
-    "passage",
-    "hallway",
-    "lobby",
-    "foyer",
-    "entrance",
-    "entry",
-    "exit",
-    "door",
-    "gate",
-    "portal",
-    "threshold",
-    "opening",
-    "window",
-    "view",
-    "vista",
-    "outlook",
-    "perspective",
-    "angle",
-    "aspect",
-    "side",
-    "facet",
-    "dimension",
-    "element",
-    "component",
-    "part",
-    "piece",
-    "section",
-    "segment",
-    "portion",
-    "share",
-    "division",
-    "split",
-    "cut",
-    "slice",
-    "chunk",
-    "block",
-    "unit",
-    "module",
-    "item",
-    "article",
-    "object",
-    "thing",
-    "entity",
-    "being",
-    "creature",
-    "animal",
-    "pet",
-    "livestock",
-    "cattle",
-    "herd",
-    "flock",
-    "pack",
-    "swarm",
-    "group",
-    "cluster",
-    "bunch",
-    "batch",
-    "lot",
-    "set",
-    "collection",
-    "series",
-    "sequence",
-    "chain",
-    "string",
-    "line",
-    "row",
-    "column",
-    "rank",
-    "file",
-    "stack",
-    "pile",
-    "heap",
-    "mound",
-    "hill",
-    "ridge",
-    "range",
-    "array",
-    "assortment",
-    "variety",
-    "diversity",
-    "mix",
-    "mixture",
-    "blend",
-    "combination",
-    "composite",
-    "compound",
-    "alloy",
-    "amalgam",
-    "fusion",
-    "merger",
-    "union",
-    "unity",
-    "whole",
-    "entirety",
-    "totality",
-    "sum",
-    "total",
-    "aggregate",
-    "gross",
-    "amount",
-    "quantity",
-    "volume",
-    "mass",
-    "bulk",
-    "size",
-    "extent",
-    "magnitude",
-    "scale",
-    "scope",
-    "range",
-    "reach",
-    "span",
-    "stretch",
-    "length",
-    "width",
-    "height",
-    "depth",
-    "breadth",
-    "area",
-    "space",
-    "room",
-    "capacity",
-    "load",
-    "weight",
-    "burden",
-    "pressure",
-    "stress",
-    "strain",
-    "tension",
-    "force",
-    "power",
-    "strength",
-    "might",
-    "energy",
-    "vigor",
-    "vitality",
-    "life",
-    "spirit",
-    "essence",
-    "soul",
-    "heart",
-    "mind",
-    "intellect",
-    "intelligence",
-    "wisdom",
-    "knowledge",
-    "understanding",
-    "comprehension",
-    "grasp",
-    "awareness",
-    "consciousness",
-    "perception",
-    "sensation",
-    "feeling",
-    "emotion",
-    "passion",
-    "sentiment",
-    "mood",
-    "attitude",
-    "disposition",
-    "temperament",
-    "character",
-    "personality",
-    "nature",
-    "quality",
-    "trait",
-    "feature",
-    "attribute",
-    "property",
-    "characteristic",
-    "aspect",
-    "facet",
-    "detail",
-    "particular",
-    "specific",
-    "instance",
-    "example",
-    "case",
-    "illustration",
-    "demonstration",
-    "proof",
-    "evidence",
-    "sign",
-    "signal",
-    "indication",
-    "hint",
-    "clue",
-    "tip",
-    "suggestion",
-    "advice",
-    "counsel",
-    "guidance",
-    "direction",
-    "instruction",
-    "order",
-    "command",
-    "mandate",
-    "directive",
-    "rule",
-    "regulation",
-    "law",
-    "policy",
-    "procedure",
-    "process",
-    "method",
-    "technique",
-    "system",
-    "approach",
-    "strategy",
-    "plan",
-    "scheme",
-    "design",
-    "pattern",
-    "model",
-    "framework",
-    "structure",
-    "organization",
-    "arrangement",
-    "order",
-    "configuration",
-    "composition",
-    "makeup",
-    "constitution",
-    "form",
-    "shape",
-    "figure",
-    "outline",
-    "contour",
-    "profile",
-    "silhouette",
-    "frame",
-    "skeleton",
-    "shell",
-    "body",
-    "mass",
-    "substance",
-    "material",
-    "matter",
-    "stuff",
-    "content",
-    "essence",
-    "core",
-    "gist",
-    "meat",
-    "pith",
-    "marrow",
-    "nucleus",
-    "kernel",
-    "seed",
-    "germ",
-    "root",
-    "base",
-    "foundation",
-    "ground",
-    "bedrock",
-    "basis",
-    "footing",
-    "support",
-    "backing",
-    "brace",
-    "prop",
-    "stay",
-    "buttress",
-    "pillar",
-    "column",
-    "beam",
-    "girder",
-    "truss",
-    "arch",
-    "vault",
-    "dome",
-    "roof",
-    "ceiling",
-    "floor",
-    "wall",
-    "partition",
-    "divider",
-    "screen",
-    "shield",
-    "barrier",
-    "fence",
-    "gate",
-    "door",
-    "window",
-    "opening",
-    "passage",
-    "channel",
-    "conduit",
-    "pipe",
-    "tube",
-    "duct",
-    "vent",
-    "outlet",
-    "inlet",
-    "intake",
-    "exhaust",
-    "drain",
-    "sewer",
-    "gutter",
-    "trough",
-    "basin",
-    "bowl",
-    "sink",
-    "tub",
-    "tank",
-    "reservoir",
-    "container",
-    "vessel",
-    "jar",
-    "jug",
-    "bottle",
-    "flask",
-    "can",
-    "tin",
-    "box",
-    "crate",
-    "case",
-    "carton",
-    "package",
-    "pack",
-    "bundle",
-    "bale",
-    "roll",
-    "coil",
-    "spool",
-    "reel",
-    "drum",
-    "barrel",
-    "keg",
-    "cask",
-    "bucket",
-    "pail",
-    "pot",
-    "pan",
-    "kettle",
-    "cauldron",
-    "vat",
-    "bin",
-    "basket",
-    "hamper",
-    "sack",
-    "bag",
-    "pouch",
-    "purse",
-    "wallet",
-    "pocket",
-    "compartment",
-    "drawer",
-    "shelf",
-    "rack",
-    "stand",
-    "table",
-    "desk",
-    "bench",
-    "chair",
-    "seat",
-    "sofa",
-    "couch",
-    "bed",
-    "cot",
-    "bunk",
-    "hammock",
-    "cradle",
-    "crib",
-    "bassinet",
-    "carrier",
-    "sling",
-    "pack",
-    "backpack",
-    "knapsack",
-    "satchel",
-    "briefcase",
-    "suitcase",
-    "trunk",
-    "chest",
-    "locker",
-    "cabinet",
-    "cupboard",
-    "closet",
-    "wardrobe",
-    "armoire",
-    "bureau",
-    "dresser",
-    "vanity",
-    "mirror",
-    "glass",
-    "window",
-    "pane",
-    "lens",
-    "prism",
-    "crystal",
-    "jewel",
-    "gem",
-    "stone",
-    "rock",
-    "boulder",
-    "pebble",
-    "gravel",
-    "sand",
-    "dust",
-    "dirt",
-    "soil",
-    "earth",
-    "ground",
-    "land",
-    "terrain",
-    "landscape",
-    "scenery",
-    "view",
-    "vista",
-    "panorama",
-    "outlook",
-    "prospect",
-    "scene",
-    "picture",
-    "image",
-    "portrait",
-    "photograph",
-    "snapshot",
-    "shot",
-    "frame",
-    "film",
-    "movie",
-    "video",
-    "clip",
-    "reel",
-    "tape",
-    "disc",
-    "record",
-    "album",
-    "track",
-    "song",
-    "tune",
-    "melody",
-    "harmony",
-    "rhythm",
-    "beat",
-    "tempo",
-    "pulse",
-    "sound",
-    "noise",
-    "tone",
-    "pitch",
-    "volume",
-    "echo",
-    "resonance",
-    "vibration",
-    "wave",
-    "frequency",
-    "signal",
-    "transmission",
-    "broadcast",
-    "airing",
-    "showing",
-    "screening",
-    "display",
-    "exhibition",
-    "presentation",
-    "demonstration",
-    "performance",
-    "act",
-    "play",
-    "drama",
-    "comedy",
-    "tragedy",
-    "opera",
-    "musical",
-    "concert",
-    "recital",
-    "reading",
-    "lecture",
-    "speech",
-    "talk",
-    "address",
-    "sermon",
-    "homily",
-    "lesson",
-    "tutorial",
-    "class",
-    "course",
-    "seminar",
-    "workshop",
-    "training",
-    "session",
-    "meeting",
-    "conference",
-    "convention",
-    "assembly",
-    "gathering",
-    "rally",
-    "protest",
-    "demonstration",
-    "march",
-    "parade",
-    "procession",
-    "caravan",
-    "convoy",
-    "fleet",
-    "squadron",
-    "armada",
-    "navy",
-    "army",
-    "force",
-    "troop",
-    "platoon",
-    "company",
-    "battalion",
-    "regiment",
-    "brigade",
-    "division",
-    "corps",
-    "team",
-    "squad",
-    "crew",
-    "gang",
-    "band",
-    "group",
-    "party",
-    "crowd",
-    "mob",
-    "throng",
-    "horde",
-    "swarm",
-    "flock",
-    "herd",
-    "pack",
-    "litter",
-    "brood",
-    "clutch",
-    "nest",
-    "colony",
-    "hive",
-    "den",
-    "lair",
-    "burrow",
-    "hole",
-    "cave",
-    "cavern",
-    "tunnel",
-    "passage",
-    "channel",
-    "corridor",
-    "hallway",
-    "aisle",
-    "path",
-    "walkway",
-    "sidewalk",
-    "pavement",
-    "road",
-    "street",
-    "avenue",
-    "boulevard",
-    "lane",
-    "alley",
-    "drive",
-    "route",
-    "course",
-    "track",
-    "trail",
-    "way",
-    "highway",
-    "freeway",
-    "turnpike",
-    "tollway",
-    "bridge",
-    "overpass",
-    "underpass",
-    "viaduct",
-    "aqueduct",
-    "canal",
-    "waterway",
-    "river",
-    "stream",
-    "creek",
-    "brook",
-    "tributary",
-    "delta",
-    "estuary",
-    "bay",
-    "gulf",
-    "cove",
-    "inlet",
-    "harbor",
-    "port",
-    "dock",
-    "pier",
-    "wharf",
-    "quay",
-    "jetty",
-    "breakwater",
-    "seawall",
-    "levee",
-    "dam",
-    "dike",
-    "embankment",
-    "rampart",
-    "wall",
-    "fence",
-    "barrier",
-    "gate",
-    "door",
-    "portal",
-    "entrance",
-    "exit",
-    "opening",
-    "threshold",
-    "archway",
-    "gateway",
-    "passageway",
-    "entryway",
-    "hatch",
-    "trapdoor",
-    "skylight",
-    "window",
-    "vent",
-    "chimney",
-    "flue",
-    "stack",
-    "pipe",
-    "tube",
-    "hose",
-    "line",
-    "cable",
-    "wire",
-    "cord",
-    "rope",
-    "chain",
-    "link",
-    "tie",
-    "bond",
-    "strap",
-    "belt",
-    "band",
-    "ribbon",
-    "tape",
-    "strip",
-    "bar",
-    "rod",
-    "pole",
-    "staff",
-    "stick",
-    "stake",
-    "peg",
-    "pin",
-    "nail",
-    "screw",
-    "bolt",
-    "nut",
-    "washer",
-    "rivet",
-    "clamp",
-    "clip",
-    "hook",
-    "latch",
-    "lock",
-    "key",
-    "hinge",
-    "knob",
-    "handle",
-    "grip",
-    "lever",
-    "crank",
-    "wheel",
-    "gear",
-    "pulley",
-    "sprocket",
-    "chain",
-    "belt",
-    "shaft",
-    "axle",
-    "spindle",
-    "pivot",
-    "joint",
-    "hinge",
-    "bearing",
-    "coupling",
-    "connector",
-    "fitting",
-    "adapter",
-    "plug",
-    "socket",
-    "outlet",
-    "jack",
-    "port",
-    "terminal",
-    "switch",
-    "button",
-    "dial",
-    "knob",
-    "lever",
-    "pedal",
-    "treadle",
-    "trigger",
-    "catch",
-    "latch",
-    "bolt",
-    "lock",
-    "bar",
-    "barrier",
-    "gate",
-    "fence",
-    "wall",
-    "rampart",
-    "bulwark",
-    "bastion",
-    "fortress",
-    "castle",
-    "citadel",
-    "stronghold",
-    "fort",
-    "bunker",
-    "shelter",
-    "refuge",
-    "haven",
-    "sanctuary",
-    "retreat",
-    "hideout",
-    "lair",
-    "den",
-    "nest",
-    "roost",
-    "perch",
-    "coop",
-    "cage",
-    "pen",
-    "enclosure",
-    "paddock",
-    "corral",
-    "yard",
-    "court",
-    "garden",
-    "park",
-    "grounds",
-    "estate",
-    "property",
-    "land",
-    "plot",
-    "parcel",
-    "tract",
-    "lot",
-    "field",
-    "meadow",
-    "pasture",
-    "prairie",
-    "plain",
-    "steppe",
-    "savanna",
-    "tundra",
-    "desert",
-    "wilderness",
-    "jungle",
-    "forest",
-    "woods",
-    "grove",
-    "orchard",
-    "vineyard",
-    "plantation",
-    "farm",
-    "ranch",
-    "homestead",
-    "holding",
-    "acreage",
-    "territory",
-    "domain",
-    "realm",
-    "kingdom",
-    "empire",
-    "nation",
-    "state",
-    "province",
-    "county",
-    "citykum",
-    "town",
-    "village",
-    "hamlet",
-    "settlement",
-    "colony",
-    "outpost",
-    "camp",
-    "base",
-    "station",
-    "post",
-    "depot",
-    "terminal",
-    "hub",
-    "center",
-    "nexus",
-    "core",
-    "heart",
-    "middle",
-    "midst",
-    "interior",
-    "inside",
-    "indoors",
-    "room",
-    "chamber",
-    "hall",
-    "corridor",
-    "passage",
-    "hallway",
-    "lobby",
-    "foyer",
-    "entrance",
-    "entry",
-    "exit",
-    "door",
-    "gate",
-    "portal",
-    "threshold",
-    "opening",
-    "window",
-    "view",
-    "vista",
-    "outlook",
-    "perspective",
-    "angle",
-    "aspect",
-    "side",
-    "facet",
-    "dimension",
-    "element",
-    "component",
-    "part",
-    "piece",
-    "section",
-    "segment",
-    "portion",
-    "share",
-    "division",
-    "split",
-    "cut",
-    "slice",
-    "chunk",
-    "block",
-    "unit",
-    "module",
-    "item",
-    "article",
-    "object",
-    "thing",
-    "entity",
-    "being",
-    "creature",
-    "animal",
-    "pet",
-    "livestock",
-    "cattle",
-    "herd",
-    "flock",
-    "pack",
-    "swarm",
-    "group",
-    "cluster",
-    "bunch",
-    "batch",
-    "lot",
-    "set",
-    "collection",
-    "series",
-    "sequence",
-    "chain",
-    "string",
-    "line",
-    "row",
-    "column",
-    "rank",
-    "file",
-    "stack",
-    "pile",
-    "heap",
-    "mound",
-    "hill",
-    "ridge",
-    "range",
-    "array",
-    "assortment",
-    "variety",
-    "diversity",
-    "mix",
-    "mixture",
-    "blend",
-    "combination",
-    "composite",
-    "compound",
-    "alloy",
-    "amalgam",
-    "fusion",
-    "merger",
-    "union",
-    "unity",
-    "whole",
-    "entirety",
-    "totality",
-    "sum",
-    "total",
-    "aggregate",
-    "gross",
-    "amount",
-    "quantity",
-    "volume",
-    "mass",
-    "bulk",
-    "size",
-    "extent",
-    "magnitude",
-    "scale",
-    "scope",
-    "range",
-    "reach",
-    "span",
-    "stretch",
-    "length",
-    "width",
-    "height",
-    "depth",
-    "breadth",
-    "area",
-    "space",
-    "room",
-    "capacity",
-    "load",
-    "weight",
-    "burden",
-    "pressure",
-    "stress",
-    "strain",
-    "tension",
-    "force",
-    "power",
-    "strength",
-    "might",
-    "energy",
-    "vigor",
-    "vitality",
-    "life",
-    "spirit",
-    "essence",
-    "soul",
-    "heart",
-    "mind",
-    "intellect",
-    "intelligence",
-    "wisdom",
-    "knowledge",
-    "understanding",
-    "comprehension",
-    "grasp",
-    "awareness",
-    "consciousness",
-    "perception",
-    "sensation",
-    "feeling",
-    "emotion",
-    "passion",
-    "sentiment",
-    "mood",
-    "attitude",
-    "disposition",
-    "temperament",
-    "character",
-    "personality",
-    "nature",
-    "quality",
-    "trait",
-    "feature",
-    "attribute",
-    "property",
-    "characteristic",
-    "aspect",
-    "facet",
-    "detail",
-    "particular",
-    "specific",
-    "instance",
-    "example",
-    "case",
-    "illustration",
-    "demonstration",
-    "proof",
-    "evidence",
-    "sign",
-    "signal",
-    "indication",
-    "hint",
-    "clue",
-    "tip",
-    "suggestion",
-    "advice",
-    "counsel",
-    "guidance",
-    "direction",
-    "instruction",
-    "order",
-    "command",
-    "mandate",
-    "directive",
-    "rule",
-    "regulation",
-    "law",
-    "policy",
-    "procedure",
-    "process",
-    "method",
-    "technique",
-    "system",
-    "approach",
-    "strategy",
-    "plan",
-    "scheme",
-    "design",
-    "pattern",
-    "model",
-    "framework",
-    "structure",
-    "organization",
-    "arrangement",
-    "order",
-    "configuration",
-    "composition",
-    "makeup",
-    "constitution",
-    "form",
-    "shape",
-    "figure",
-    "outline",
-    "contour",
-    "profile",
-    "silhouette",
-    "frame",
-    "skeleton",
-    "shell",
-    "body",
-    "mass",
-    "substance",
-    "material",
-    "matter",
-    "stuff",
-    "content",
-    "essence",
-    "core",
-    "gist",
-    "meat",
-    "pith",
-    "marrow",
-    "nucleus",
-    "kernel",
-    "seed",
-    "germ",
-    "root",
-    "base",
-    "foundation",
-    "ground",
-    "bedrock",
-    "basis",
-    "footing",
-    "support",
-    "backing",
-    "brace",
-    "prop",
-    "stay",
-    "buttress",
-    "pillar",
-    "column",
-    "beam",
-    "girder",
-    "truss",
-    "arch",
-    "vault",
-    "dome",
-    "roof",
-    "ceiling",
-    "floor",
-    "wall",
-    "partition",
-    "divider",
-    "screen",
-    "shield",
-    "barrier",
-    "fence",
-    "gate",
-    "door",
-    "window",
-    "opening",
-    "passage",
-    "channel",
-    "conduit",
-    "pipe",
-    "tube",
-    "duct",
-    "vent",
-    "outlet",
-    "inlet",
-    "intake",
-    "exhaust",
-    "drain",
-    "sewer",
-    "gutter",
-    "trough",
-    "basin",
-    "bowl",
-    "sink",
-    "tub",
-    "tank",
-    "reservoir",
-    "container",
-    "vessel",
-    "jar",
-    "jug",
-    "bottle",
-    "flask",
-    "can",
-    "tin",
-    "box",
-    "crate",
-    "case",
-    "carton",
-    "package",
-    "pack",
-    "bundle",
-    "bale",
-    "roll",
-    "coil",
-    "spool",
-    "reel",
-    "drum",
-    "barrel",
-    "keg",
-    "cask",
-    "bucket",
-    "pail",
-    "pot",
-    "pan",
-    "kettle",
-    "cauldron",
-    "vat",
-    "bin",
-    "basket",
-    "hamper",
-    "sack",
-    "bag",
-    "pouch",
-    "purse",
-    "wallet",
-    "pocket",
-    "compartment",
-    "drawer",
-    "shelf",
-    "rack",
-    "stand",
-    "table",
-    "desk",
-    "bench",
-    "chair",
-    "seat",
-    "sofa",
-    "couch",
-    "bed",
-    "cot",
-    "bunk",
-    "hammock",
-    "cradle",
-    "crib",
-    "bassinet",
-    "carrier",
-    "sling",
-    "pack",
-    "backpack",
-    "knapsack",
-    "satchel",
-    "briefcase",
-    "suitcase",
-    "trunk",
-    "chest",
-    "locker",
-    "cabinet",
-    "cupboard",
-    "closet",
-    "wardrobe",
-    "armoire",
-    "bureau",
-    "dresser",
-    "vanity",
-    "mirror",
-    "glass",
-    "window",
-    "pane",
-    "lens",
-    "prism",
-    "crystal",
-    "jewel",
-    "gem",
-    "stone",
-    "rock",
-    "boulder",
-    "pebble",
-    "gravel",
-    "sand",
-    "dust",
-    "dirt",
-    "soil",
-    "earth",
-    "ground",
-    "land",
-    "terrain",
-    "landscape",
-    "scenery",
-    "view",
-    "vista",
-    "panorama",
-    "outlook",
-    "prospect",
-    "scene",
-    "picture",
-    "image",
-    "portrait",
-    "photograph",
-    "snapshot",
-    "shot",
-    "frame",
-    "film",
-    "movie",
-    "video",
-    "clip",
-    "reel",
-    "tape",
-    "disc",
-    "record",
-    "album",
-    "track",
-    "song",
-    "tune",
-    "melody",
-    "harmony",
-    "rhythm",
-    "beat",
-    "tempo",
-    "pulse",
-    "sound",
-    "noise",
-    "tone",
-    "pitch",
-    "volume",
-    "echo",
-    "resonance",
-    "vibration",
-    "wave",
-    "frequency",
-    "signal",
-    "transmission",
-    "broadcast",
-    "airing",
-    "showing",
-    "screening",
-    "display",
-    "exhibition",
-    "presentation",
-    "demonstration",
-    "performance",
-    "act",
-    "play",
-    "drama",
-    "comedy",
-    "tragedy",
-    "opera",
-    "musical",
-    "concert",
-    "recital",
-    "reading",
-    "lecture",
-    "speech",
-    "talk",
-    "address",
-    "sermon",
-    "homily",
-    "lesson",
-    "tutorial",
-    "class",
-    "course",
-    "seminar",
-    "workshop",
-    "training",
-    "session",
-    "meeting",
-    "conference",
-    "convention",
-    "assembly",
-    "gathering",
-    "rally",
-    "protest",
-    "demonstration",
-    "march",
-    "parade",
-    "procession",
-    "caravan",
-    "convoy",
-    "fleet",
-    "squadron",
-    "armada",
-    "navy",
-    "army",
-    "force",
-    "troop",
-    "platoon",
-    "company",
-    "battalion",
-    "regiment",
-    "brigade",
-    "division",
-    "corps",
-    "team",
-    "squad",
-    "crew",
-    "gang",
-    "band",
-    "group",
-    "party",
-    "crowd",
-    "mob",
-    "throng",
-    "horde",
-    "swarm",
-    "flock",
-    "herd",
-    "pack",
-    "litter",
-    "brood",
-    "clutch",
-    "nest",
-    "colony",
-    "hive",
-    "den",
-    "lair",
-    "burrow",
-    "hole",
-    "cave",
-    "cavern",
-    "tunnel",
-    "passage",
-    "channel",
-    "corridor",
-    "hallway",
-    "aisle",
-    "path",
-    "walkway",
-    "sidewalk",
-    "pavement",
-    "road",
-    "street",
-    "avenue",
-    "boulevard",
-    "lane",
-    "alley",
-    "drive",
-    "route",
-    "course",
-    "track",
-    "trail",
-    "way",
-    "highway",
-    "freeway",
-    "turnpike",
-    "tollway",
-    "bridge",
-    "overpass",
-    "underpass",
-    "viaduct",
-    "aqueduct",
-    "canal",
-    "waterway",
-    "river",
-    "stream",
-    "creek",
-    "brook",
-    "tributary",
-    "delta",
-    "estuary",
-    "bay",
-    "gulf",
-    "cove",
-    "inlet",
-    "harbor",
-    "port",
-    "dock",
-    "pier",
-    "wharf",
-    "quay",
-    "jetty",
-    "breakwater",
-    "seawall",
-    "levee",
-    "dam",
-    "dike",
-    "embankment",
-    "rampart",
-    "wall",
-    "fence",
-    "barrier",
-    "gate",
-    "door",
-    "portal",
-    "entrance",
-    "exit",
-    "opening",
-    "threshold",
-    "archway",
-    "gateway",
-    "passageway",
-    "entryway",
-    "hatch",
-    "trapdoor",
-    "skylight",
-    "window",
-    "vent",
-    "chimney",
-    "flue",
-    "stack",
-    "pipe",
-    "tube",
-    "hose",
-    "line",
-    "cable",
-    "wire",
-    "cord",
-    "rope",
-    "chain",
-    "link",
-    "tie",
-    "bond",
-    "strap",
-    "belt",
-    "band",
-    "ribbon",
-    "tape",
-    "strip",
-    "bar",
-    "rod",
-    "pole",
-    "staff",
-    "stick",
-    "stake",
-    "peg",
-    "pin",
-    "nail",
-    "screw",
-    "bolt",
-    "nut",
-    "washer",
-    "rivet",
-    "clamp",
-    "clip",
-    "hook",
-    "latch",
-    "lock",
-    "key",
-    "hinge",
-    "knob",
-    "handle",
-    "grip",
-    "lever",
-    "crank",
-    "wheel",
-    "gear",
-    "pulley",
-    "sprocket",
-    "chain",
-    "belt",
-    "shaft",
-    "axle",
-    "spindle",
-    "pivot",
-    "joint",
-    "hinge",
-    "bearing",
-    "coupling",
-    "connector",
-    "fitting",
-    "adapter",
-    "plug",
-    "socket",
-    "outlet",
-    "jack",
-    "port",
-    "terminal",
-    "switch",
-    "button",
-    "dial",
-    "knob",
-    "lever",
-    "pedal",
-    "treadle",
-    "trigger",
-    "catch",
-    "latch",
-    "bolt",
-    "lock",
-    "bar",
-    "barrier",
-    "gate",
-    "fence",
-    "wall",
-    "rampart",
-    "bulwark",
-    "bastion",
-    "fortress",
-    "castle",
-    "citadel",
-    "stronghold",
-    "fort",
-    "bunker",
-    "shelter",
-    "refuge",
-    "haven",
-    "sanctuary",
-    "retreat",
-    "hideout",
-    "lair",
-    "den",
-    "nest",
-    "roost",
-    "perch",
-    "coop",
-    "cage",
-    "pen",
-    "enclosure",
-    "paddock",
-    "corral",
-    "yard",
-    "court",
-    "garden",
-    "park",
-    "grounds",
-    "estate",
-    "property",
-    "land",
-    "plot",
-    "parcel",
-    "tract",
-    "lot",
-    "field",
-    "meadow",
-    "pasture",
-    "prairie",
-    "plain",
-    "steppe",
-    "savanna",
-    "tundra",
-    "desert",
-    "wilderness",
-    "jungle",
-    "forest",
-    "woods",
-    "grove",
-    "orchard",
-    "vineyard",
-    "plantation",
-    "farm",
-    "ranch",
-    "homestead",
-    "holding",
-    "acreage",
-    "territory",
-    "domain",
-    "realm",
-    "kingdom",
-    "empire",
-    "nation",
-    "state",
-    "province",
-    "county",
-    "city",
-    "town",
-    "village",
-    "hamlet",
-    "settlement",
-    "colony",
-    "outpost",
-    "camp",
-    "base",
-    "station",
-    "post",
-    "depot",
-    "terminal",
-    "hub",
-    "center",
-    "nexus",
-    "core",
-    "heart",
-    "middle",
-    "midst",
-    "interior",
-    "inside",
-    "indoors",
-    "room",
-    "chamber",
-    "hall",
-    "corridor",
-    "passage",
-    "hallway",
-    "lobby",
-    "foyer",
-    "entrance",
-    "entry",
-    "exit",
-    "door",
-    "gate",
-    "portal",
-    "threshold",
-    "opening",
-    "window",
-    "view",
-    "vista",
-    "outlook",
-    "perspective",
-    "angle",
-    "aspect",
-    "side",
-    "facet",
-    "dimension",
-    "element",
-    "component",
-    "part",
-    "piece",
-    "section",
-    "segment",
-    "portion",
-    "share",
-    "division",
-    "split",
-    "cut",
-    "slice",
-    "chunk",
-    "block",
-    "unit",
-    "module",
-    "item",
-    "article",
-    "object",
-    "thing",
-    "entity",
-    "being",
-    "creature",
-    "animal",
-    "pet",
-    "livestock",
-    "cattle",
-    "herd",
-    "flock",
-    "pack",
-    "swarm",
-    "group",
-    "cluster",
-    "bunch",
-    "batch",
-    "lot",
-    "set",
-    "collection",
-    "series",
-    "sequence",
-    "chain",
-    "string",
-    "line",
-    "row",
-    "column",
-    "rank",
-    "file",
-    "stack",
-    "pile",
-    "heap",
-    "mound",
-    "hill",
-    "ridge",
-    "range",
-    "array",
-    "assortment",
-    "variety",
-    "diversity",
-    "mix",
-    "mixture",
-    "blend",
-    "combination",
-    "composite",
-    "compound",
-    "alloy",
-    "amalgam",
-    "fusion",
-    "merger",
-    "union",
-    "unity",
-    "whole",
-    "entirety",
-    "totality",
-    "sum",
-    "total",
-    "aggregate",
-    "gross",
-    "amount",
-    "quantity",
-    "volume",
-    "mass",
-    "bulk",
-    "size",
-    "extent",
-    "magnitude",
-    "scale",
-    "scope",
-    "range",
-    "reach",
-    "span",
-    "stretch",
-    "length",
-    "width",
-    "height",
-    "depth",
-    "breadth",
-    "area",
-    "space",
-    "room",
-    "capacity",
-    "load",
-    "weight",
-    "burden",
-    "pressure",
-    "stress",
-    "strain",
-    "tension",
-    "force",
-    "power",
-    "strength",
-    "might",
-    "energy",
-    "vigor",
-    "vitality",
-    "life",
-    "spirit",
-    "essence",
-    "soul",
-    "heart",
-    "mind",
-    "intellect",
-    "intelligence",
-    "wisdom",
-    "knowledge",
-    "understanding",
-    "comprehension",
-    "grasp",
-    "awareness",
-    "consciousness",
-    "perception",
-    "sensation",
-    "feeling",
-    "emotion",
-    "passion",
-    "sentiment",
-    "mood",
-    "attitude",
-    "disposition",
-    "temperament",
-    "character",
-    "personality",
-    "nature",
-    "quality",
-    "trait",
-    "feature",
-    "attribute",
-    "property",
-    "characteristic",
-    "aspect",
-    "facet",
-    "detail",
-    "particular",
-    "specific",
-    "instance",
-    "example",
-    "case",
-    "illustration",
-    "demonstration",
-    "proof",
-    "evidence",
-    "sign",
-    "signal",
-    "indication",
-    "hint",
-    "clue",
-    "tip",
-    "suggestion",
-    "advice",
-    "counsel",
-    "guidance",
-    "direction",
-    "instruction",
-    "order",
-    "command",
-    "mandate",
-    "directive",
-    "rule",
-    "regulation",
-    "law",
-    "policy",
-    "procedure",
-    "process",
-    "method",
-    "technique",
-    "system",
-    "approach",
-    "strategy",
-    "plan",
-    "scheme",
-    "design",
-    "pattern",
-    "model",
-    "framework",
-    "structure",
-    "organization",
-    "arrangement",
-    "order",
-    "configuration",
-    "composition",
-    "makeup",
-    "constitution",
-    "form",
-    "shape",
-    "figure",
-    "outline",
-    "contour",
-    "profile",
-    "silhouette",
-    "frame",
-    "skeleton",
-    "shell",
-    "body",
-    "mass",
-    "substance",
-    "material",
-    "matter",
-    "stuff",
-    "content",
-    "essence",
-    "core",
-    "gist",
-    "meat",
-    "pith",
-    "marrow",
-    "nucleus",
-    "kernel",
-    "seed",
-    "germ",
-    "root",
-    "base",
-    "foundation",
-    "ground",
-    "bedrock",
-    "basis",
-    "footing",
-    "support",
-    "backing",
-    "brace",
-    "prop",
-    "stay",
-    "buttress",
-    "pillar",
-    "column",
-    "beam",
-    "girder",
-    "truss",
-    "arch",
-    "vault",
-    "dome",
-    "roof",
-    "ceiling",
-    "floor",
-    "wall",
-    "partition",
-    "divider",
-    "screen",
-    "shield",
-    "barrier",
-    "fence",
-    "gate",
-    "door",
-    "window",
-    "opening",
-    "passage",
-    "channel",
-    "conduit",
-    "pipe",
-    "tube",
-    "duct",
-    "vent",
-    "outlet",
-    "inlet",
-    "intake",
-    "exhaust",
-    "drain",
-    "sewer",
-    "gutter",
-    "trough",
-    "basin",
-    "bowl",
-    "sink",
-    "tub",
-    "tank",
-    "reservoir",
-    "container",
-    "vessel",
-    "jar",
-    "jug",
-    "bottle",
-    "flask",
-    "can",
-    "tin",
-    "box",
-    "crate",
-    "case",
-    "carton",
-    "package",
-    "pack",
-    "bundle",
-    "bale",
-    "roll",
-    "coil",
-    "spool",
-    "reel",
-    "drum",
-    "barrel",
-    "keg",
-    "cask",
-    "bucket",
-    "pail",
-    "pot",
-    "pan",
-    "kettle",
-    "cauldron",
-    "vat",
-    "bin",
-    "basket",
-    "hamper",
-    "sack",
-    "bag",
-    "pouch",
-    "purse",
-    "wallet",
-    "pocket",
-    "compartment",
-    "drawer",
-    "shelf",
-    "rack",
-    "stand",
-    "table",
-    "desk",
-    "bench",
-    "chair",
-    "seat",
-    "sofa",
-    "couch",
-    "bed",
-    "cot",
-    "bunk",
-    "hammock",
-    "cradle",
-    "crib",
-    "bassinet",
-    "carrier",
-    "sling",
-    "pack",
-    "backpack",
-    "knapsack",
-    "satchel",
-    "briefcase",
-    "suitcase",
-    "trunk",
-    "chest",
-    "locker",
-    "cabinet",
-    "cupboard",
-    "closet",
-    "wardrobe",
-    "armoire",
-    "bureau",
-    "dresser",
-    "vanity",
-    "mirror",
-    "glass",
-    "window",
-    "pane",
-    "lens",
-    "prism",
-    "crystal",
-    "jewel",
-    "gem",
-    "stone",
-    "rock",
-    "boulder",
-    "pebble",
-    "gravel",
-    "sand",
-    "dust",
-    "dirt",
-    "soil",
-    "earth",
-    "ground",
-    "land",
-    "terrain",
-    "landscape",
-    "scenery",
-    "view",
-    "vista",
-    "panorama",
-    "outlook",
-    "prospect",
-    "scene",
-    "picture",
-    "image",
-    "portrait",
-    "photograph",
-    "snapshot",
-    "shot",
-    "frame",
-    "film",
-    "movie",
-    "video",
-    "clip",
-    "reel",
-    "tape",
-    "disc",
-    "record",
-    "album",
-    "track",
-    "song",
-    "tune",
-    "melody",
-    "harmony",
-    "rhythm",
-    "beat",
-    "tempo",
-    "pulse",
-    "sound",
-    "noise",
-    "tone",
-    "pitch",
-    "volume",
-    "echo",
-    "resonance",
-    "vibration",
-    "wave",
-    "frequency",
-    "signal",
-    "transmission",
-    "broadcast",
-    "airing",
-    "showing",
-    "screening",
-    "display",
-    "exhibition",
-    "presentation",
-    "demonstration",
-    "performance",
-    "act",
-    "play",
-    "drama",
-    "comedy",
-    "tragedy",
-    "opera",
-    "musical",
-    "concert",
-    "recital",
-    "reading",
-    "lecture",
-    "speech",
-    "talk",
-    "address",
-    "sermon",
-    "homily",
-    "lesson",
-    "tutorial",
-    "class",
-    "course",
-    "seminar",
-    "workshop",
-    "training",
-    "session",
-    "meeting",
-    "conference",
-    "convention",
-    "assembly",
-    "gathering",
-    "rally",
-    "protest",
-    "demonstration",
-    "march",
-    "parade",
-    "procession",
-    "caravan",
-    "convoy",
-    "fleet",
-    "squadron",
-    "armada",
-    "navy",
-    "army",
-    "force",
-    "troop",
-    "platoon",
-    "company",
-    "battalion",
-    "regiment",
-    "brigade",
-    "division",
-    "corps",
-    "team",
-    "squad",
-    "crew",
-    "gang",
-    "band",
-    "group",
-    "party",
-    "crowd",
-    "mob",
-    "throng",
-    "horde",
-    "swarm",
-    "flock",
-    "herd",
-    "pack",
-    "litter",
-    "brood",
-    "clutch",
-    "nest",
-    "colony",
-    "hive",
-    "den",
-    "lair",
-    "burrow",
-    "hole",
-    "cave",
-    "cavern",
-    "tunnel",
-    "passage",
-    "channel",
-    "corridor",
-    "hallway",
-    "aisle",
-    "path",
-    "walkway",
-    "sidewalk",
-    "pavement",
-    "road",
-    "street",
-    "avenue",
-    "boulevard",
-    "lane",
-    "alley",
-    "drive",
-    "route",
-    "course",
-    "track",
-    "trail",
-    "way",
-    "highway",
-    "freeway",
-    "turnpike",
-    "tollway",
-    "bridge",
-    "overpass",
-    "underpass",
-    "viaduct",
-    "aqueduct",
-    "canal",
-    "waterway",
-    "river",
-    "stream",
-    "creek",
-    "brook",
-    "tributary",
-    "delta",
-    "estuary",
-    "bay",
-    "gulf",
-    "cove",
-    "inlet",
-    "harbor",
-    "port",
-    "dock",
-    "pier",
-    "wharf",
-    "quay",
-    "jetty",
-    "breakwater",
-    "seawall",
-    "levee",
-    "dam",
-    "dike",
-    "embankment",
-    "rampart",
-    "wall",
-    "fence",
-    "barrier",
-    "gate",
-    "door",
-    "portal",
-    "entrance",
-    "exit",
-    "opening",
-    "threshold",
-    "archway",
-    "gateway",
-    "passageway",
-    "entryway",
-    "hatch",
-    "trapdoor",
-    "skylight",
-    "window",
-    "vent",
-    "chimney",
-    "flue",
-    "stack",
-    "pipe",
-    "tube",
-    "hose",
-    "line",
-    "cable",
-    "wire",
-    "cord",
-    "rope",
-    "chain",
-    "link",
-    "tie",
-    "bond",
-    "strap",
-    "belt",
-    "band",
-    "ribbon",
-    "tape",
-    "strip",
-    "bar",
-    "rod",
-    "pole",
-    "staff",
-    "stick",
-    "stake",
-    "peg",
-    "pin",
-    "nail",
-    "screw",
-    "bolt",
-    "nut",
-    "washer",
-    "rivet",
-    "clamp",
-    "clip",
-    "hook",
-    "latch",
-    "lock",
-    "key",
-    "hinge",
-    "knob",
-    "handle",
-    "grip",
-    "lever",
-    "crank",
-    "wheel",
-    "gear",
-    "pulley",
-    "sprocket",
-    "chain",
-    "belt",
-    "shaft",
-    "axle",
-    "spindle",
-    "pivot",
-    "joint",
-    "hinge",
-    "bearing",
-    "coupling",
-    "connector",
-    "fitting",
-    "adapter",
-    "plug",
-    "socket",
-    "outlet",
-    "jack",
-    "port",
-    "terminal",
-    "switch",
-    "button",
-    "dial",
-    "knob",
-    "lever",
-    "pedal",
-    "treadle",
-    "trigger",
-    "catch",
-    "latch",
-    "bolt",
-    "lock",
-    "bar",
-    "barrier",
-    "gate",
-    "fence",
-    "wall",
-    "rampart",
-    "bulwark",
-    "bastion",
-    "fortress",
-    "castle",
-    "citadel",
-    "stronghold",
-    "fort",
-    "bunker",
-    "shelter",
-    "refuge",
-    "haven",
-    "sanctuary",
-    "retreat",
-    "hideout",
-    "lair",
-    "den",
-    "nest",
-    "roost",
-    "perch",
-    "coop",
-    "cage",
-    "pen",
-    "enclosure",
-    "paddock",
-    "corral",
-    "yard",
-    "court",
-    "garden",
-    "park",
-    "grounds",
-    "estate",
-    "property",
-    "land",
-    "plot",
-    "parcel",
-    "tract",
-    "lot",
-    "field",
-    "meadow",
-    "pasture",
-    "prairie",
-    "plain",
-    "steppe",
-    "savanna",
-    "tundra",
-    "desert",
-    "wilderness",
-    "jungle",
-    "forest",
-    "woods",
-    "grove",
-    "orchard",
-    "vineyard",
-    "plantation",
-    "farm",
-    "ranch",
-    "homestead",
-    "holding",
-    "acreage",
-    "territory",
-    "domain",
-    "realm",
-    "kingdom",
-    "empire",
-    "nation",
-    "state",
-    "province",
-    "county",
-    "city",
-    "town",
-    "village",
-    "hamlet",
-    "settlement",
-    "colony",
-    "outpost",
-    "camp",
-    "base",
-    "station",
-    "post",
-    "depot",
-    "terminal",
-    "hub",
-    "center",
-    "nexus",
-    "core",
-    "heart",
-    "middle",
-    "midst",
-    "interior",
-    "inside",
-    "indoors",
-    "room",
-    "chamber",
-    "hall",
-    "corridor",
-    "passage",
-    "hallway",
-    "lobby",
-    "foyer",
-    "entrance",
-    "entry",
-    "exit",
-    "door",
-    "gate",
-    "portal",
-    "threshold",
-    "opening",
-    "window",
-    "view",
-    "vista",
-    "outlook",
-    "perspective",
-    "angle",
-    "aspect",
-    "side",
-    "facet",
-    "dimension",
-    "element",
-    "component",
-    "part",
-    "piece",
-    "section",
-    "segment",
-    "portion",
-    "share",
-    "division",
-    "split",
-    "cut",
-    "slice",
-    "chunk",
-    "block",
-    "unit",
-    "module",
-    "item",
-    "article",
-    "object",
-    "thing",
-    "entity",
-    "being",
-    "creature",
-    "animal",
-    "pet",
-    "livestock",
-    "cattle",
-    "herd",
-    "flock",
-    "pack",
-    "swarm",
-    "group",
-    "cluster",
-    "bunch",
-    "batch",
-    "lot",
-    "set",
-    "collection",
-    "series",
-    "sequence",
-    "chain",
-    "string",
-    "line",
-    "row",
-    "column",
-    "rank",
-    "file",
-    "stack",
-    "pile",
-    "heap",
-    "mound",
-    "hill",
-    "ridge",
-    "range",
-    "array",
-    "assortment",
-    "variety",
-    "diversity",
-    "mix",
-    "mixture",
-    "blend",
-    "combination",
-    "composite",
-    "compound",
-    "alloy",
-    "amalgam",
-    "fusion",
-    "merger",
-    "union",
-    "unity",
-    "whole",
-    "entirety",
-    "totality",
-    "sum",
-    "total",
-    "aggregate",
-    "gross",
-    "amount",
-    "quantity",
-    "volume",
-    "mass",
-    "bulk",
-    "size",
-    "extent",
-    "magnitude",
-    "scale",
-    "scope",
-    "range",
-    "reach",
-    "span",
-    "stretch",
-    "length",
-    "width",
-    "height",
-    "depth",
-    "breadth",
-    "area",
-    "space",
-    "room",
-    "capacity",
-    "load",
-    "weight",
-    "burden",
-    "pressure",
-    "stress",
-    "strain",
-    "tension",
-    "force",
-    "power",
-    "strength",
-    "might",
-    "energy",
-    "vigor",
-    "vitality",
-    "life",
-    "spirit",
-    "essence",
-    "soul",
-    "heart",
-    "mind",
-    "intellect",
-    "intelligence",
-    "wisdom",
-    "knowledge",
-    "understanding",
-    "comprehension",
-    "grasp",
-    "awareness",
-    "consciousness",
-    "perception",
-    "sensation",
-    "feeling",
-    "emotion",
-    "passion",
-    "sentiment",
-    "mood",
-    "attitude",
-    "disposition",
-    "temperament",
-    "character",
-    "personality",
-    "nature",
-    "quality",
-    "trait",
-    "feature",
-    "attribute",
-    "property",
-    "characteristic",
-    "aspect",
-    "facet",
-    "detail",
-    "particular",
-    "specific",
-    "instance",
-    "example",
-    "case",
-    "illustration",
-    "demonstration",
-    "proof",
-    "evidence",
-    "sign",
-    "signal",
-    "indication",
-    "hint",
-    "clue",
-    "tip",
-    "suggestion",
-    "advice",
-    "counsel",
-    "guidance",
-    "direction",
-    "instruction",
-    "order",
-    "command",
-    "mandate",
-    "directive",
-    "rule",
-    "regulation",
-    "law",
-    "policy",
-    "procedure",
-    "process",
-    "method",
-    "technique",
-    "system",
-    "approach",
-    "strategy",
-    "plan",
-    "scheme",
-    "design",
-    "pattern",
-    "model",
-    "framework",
-    "structure",
-    "organization",
-    "arrangement",
-    "order",
-    "configuration",
-    "composition",
-    "makeup",
-    "constitution",
-    "form",
-    "shape",
-    "figure",
-    "outline",
-    "contour",
-    "profile",
-    "silhouette",
-    "frame",
-    "skeleton",
-    "shell",
-    "body",
-    "mass",
-    "substance",
-    "material",
-    "matter",
-    "stuff",
-    "content",
-    "essence",
-    "core",
-    "gist",
-    "meat",
-    "pith",
-    "marrow",
-    "nucleus",
-    "kernel",
-    "seed",
-    "germ",
-    "root",
-    "base",
-    "foundation",
-    "ground",
-    "bedrock",
-    "basis",
-    "footing",
-    "support",
-    "backing",
-    "brace",
-    "prop",
-    "stay",
-    "buttress",
-    "pillar",
-    "column",
-    "beam",
-    "girder",
-    "truss",
-    "arch",
-    "vault",
-    "dome",
-    "roof",
-    "ceiling",
-    "floor",
-    "wall",
-    "partition",
-    "divider",
-    "screen",
-    "shield",
-    "barrier",
-    "fence",
-    "gate",
-    "door",
-    "window",
-    "opening",
-    "passage",
-    "channel",
-    "conduit",
-    "pipe",
-    "tube",
-    "duct",
-    "vent",
-    "outlet",
-    "inlet",
-    "intake",
-    "exhaust",
-    "drain",
-    "sewer",
-    "gutter",
-    "trough",
-    "basin",
-    "bowl",
-    "sink",
-    "tub",
-    "tank",
-    "reservoir",
-    "container",
-    "vessel",
-    "jar",
-    "jug",
-    "bottle",
-    "flask",
-    "can",
-    "tin",
-    "box",
-    "crate",
-    "case",
-    "carton",
-    "package",
-    "pack",
-    "bundle",
-    "bale",
-    "roll",
-    "coil",
-    "spool",
-    "reel",
-    "drum",
-    "barrel",
-    "keg",
-    "cask",
-    "bucket",
-    "pail",
-    "pot",
-    "pan",
-    "kettle",
-    "cauldron",
-    "vat",
-    "bin",
-    "basket",
-    "hamper",
-    "sack",
-    "bag",
-    "pouch",
-    "purse",
-    "wallet",
-    "pocket",
-    "compartment",
-    "drawer",
-    "shelf",
-    "rack",
-    "stand",
-    "table",
-    "desk",
-    "bench",
-    "chair",
-    "seat",
-    "sofa",
-    "couch",
-    "bed",
-    "cot",
-    "bunk",
-    "hammock",
-    "cradle",
-    "crib",
-    "bassinet",
-    "carrier",
-    "sling",
-    "pack",
-    "backpack",
-    "knapsack",
-    "satchel",
-    "briefcase",
-    "suitcase",
-    "trunk",
-    "chest",
-    "locker",
-    "cabinet",
-    "cupboard",
-    "closet",
-    "wardrobe",
-    "armoire",
-    "bureau",
-    "dresser",
-    "vanity",
-    "mirror",
-    "glass",
-    "window",
-    "pane",
-    "lens",
-    "prism",
-    "crystal",
-    "jewel",
-    "gem",
-    "stone",
-    "rock",
-    "boulder",
-    "pebble",
-    "gravel",
-    "sand",
-    "dust",
-    "dirt",
-    "soil",
-    "earth",
-    "ground",
-    "land",
-    "terrain",
-    "landscape",
-    "scenery",
-    "view",
-    "vista",
-    "panorama",
-    "outlook",
-    "prospect",
-    "scene",
-    "picture",
-    "image",
-    "portrait",
-    "photograph",
-    "snapshot",
-    "shot",
-    "frame",
-    "film",
-    "movie",
-    "video",
-    "clip",
-    "reel",
-    "tape",
-    "disc",
-    "record",
-    "album",
-    "track",
-    "song",
-    "tune",
-    "melody",
-    "harmony",
-    "rhythm",
-    "beat",
-    "tempo",
-    "pulse",
-    "sound",
-    "noise",
-    "tone",
-    "pitch",
-    "volume",
-    "echo",
-    "resonance",
-    "vibration",
-    "wave",
-    "frequency",
-    "signal",
-    "transmission",
-    "broadcast",
-    "airing",
-    "showing",
-    "screening",
-    "display",
-    "exhibition",
-    "presentation",
-    "demonstration",
-    "performance",
-    "act",
-    "play",
-    "drama",
-    "comedy",
-    "tragedy",
-    "opera",
-    "musical",
-    "concert",
-    "recital",
-    "reading",
-    "lecture",
-    "speech",
-    "talk",
-    "address",
-    "sermon",
-    "homily",
-    "lesson",
-    "tutorial",
-    "class",
-    "course",
-    "seminar",
-    "workshop",
-    "training",
-    "session",
-    "meeting",
-    "conference",
-    "convention",
-    "assembly",
-    "gathering",
-    "rally",
-    "protest",
-    "demonstration",
-    "march",
-    "parade",
-    "procession",
-    "caravan",
-    "convoy",
-    "fleet",
-    "squadron",
-    "armada",
-    "navy",
-    "army",
-    "force",
-    "troop",
-    "platoon",
-    "company",
-    "battalion",
-    "regiment",
-    "brigade",
-    "division",
-    "corps",
-    "team",
-    "squad",
-    "crew",
-    "gang",
-    "band",
-    "group",
-    "party",
-    "crowd",
-    "mob",
-    "throng",
-    "horde",
-    "swarm",
-    "flock",
-    "herd",
-    "pack",
-    "litter",
-    "brood",
-    "clutch",
-    "nest",
-    "colony",
-    "hive",
-    "den",
-    "lair",
-    "burrow",
-    "hole",
-    "cave",
-    "cavern",
-    "tunnel",
-    "passage",
-    "channel",
-    "corridor",
-    "hallway",
-    "aisle",
-    "path",
-    "walkway",
-    "sidewalk",
-    "pavement",
-    "road",
-    "street",
-    "avenue",
-    "boulevard",
-    "lane",
-    "alley",
-    "drive",
-    "route",
-    "course",
-    "track",
-    "trail",
-    "way",
-    "highway",
-    "freeway",
-    "turnpike",
-    "tollway",
-    "bridge",
-    "overpass",
-    "underpass",
-    "viaduct",
-    "aqueduct",
-    "canal",
-    "waterway",
-    "river",
-    "stream",
-    "creek",
-    "brook",
-    "tributary",
-    "delta",
-    "estuary",
-    "bay",
-    "gulf",
-    "cove",
-    "inlet",
-    "harbor",
-    "port",
-    "dock",
-    "pier",
-    "wharf",
-    "quay",
-    "jetty",
-    "breakwater",
-    "seawall",
-    "levee",
-    "dam",
-    "dike",
-    "embankment",
-    "rampart",
-    "wall",
-    "fence",
-    "barrier",
-    "gate",
-    "door",
-    "portal",
-    "entrance",
-    "exit",
-    "opening",
-    "threshold",
-    "archway",
-    "gateway",
-    "passageway",
-    "entryway",
-    "hatch",
-    "trapdoor",
-    "skylight",
-    "window",
-    "vent",
-    "chimney",
-    "flue",
-    "stack",
-    "pipe",
-    "tube",
-    "hose",
-    "line",
-    "cable",
-    "wire",
-    "cord",
-    "rope",
-    "chain",
-    "link",
-    "tie",
-    "bond",
-    "strap",
-    "belt",
-    "band",
-    "ribbon",
-    "tape",
-    "strip",
-    "bar",
-    "rod",
-    "pole",
-    "staff",
-    "stick",
-    "stake",
-    "peg",
-    "pin",
-    "nail",
-    "screw",
-    "bolt",
-    "nut",
-    "washer",
-    "rivet",
-    "clamp",
-    "clip",
-    "hook",
-    "latch",
-    "lock",
-    "key",
-    "hinge",
-    "knob",
-    "handle",
-    "grip",
-    "lever",
-    "crank",
-    "wheel",
-    "gear",
-    "pulley",
-    "sprocket",
-    "chain",
-    "belt",
-    "shaft",
-    "axle",
-    "spindle",
-    "pivot",
-    "joint",
-    "hinge",
-    "bearing",
-    "coupling",
-    "connector",
-    "fitting",
-    "adapter",
-    "plug",
-    "socket",
-    "outlet",
-    "jack",
-    "port",
-    "terminal",
-    "switch",
-    "button",
-    "dial",
-    "knob",
-    "lever",
-    "pedal",
-    "treadle",
-    "trigger",
-    "catch",
-    "latch",
-    "bolt",
-    "lock",
-    "bar",
-    "barrier",
-    "gate",
-    "fence",
-    "wall",
-    "rampart",
-    "bulwark",
-    "bastion",
-    "fortress",
-    "castle",
-    "citadel",
-    "stronghold",
-    "fort",
-    "bunker",
-    "shelter",
-    "refuge",
-    "haven",
-    "sanctuary",
-    "retreat",
-    "hideout",
-    "lair",
-    "den",
-    "nest",
-    "roost",
-    "perch",
-    "coop",
-    "cage",
-    "pen",
-    "enclosure",
-    "paddock",
-    "corral",
-    "yard",
-    "court",
-    "garden",
-    "park",
-    "grounds",
-    "estate",
-    "property",
-    "land",
-    "plot",
-    "parcel",
-    "tract",
-    "lot",
-    "field",
-    "meadow",
-    "pasture",
-    "prairie",
-    "plain",
-    "steppe",
-    "savanna",
-    "tundra",
-    "desert",
-    "wilderness",
-    "jungle",
-    "forest",
-    "woods",
-    "grove",
-    "orchard",
-    "vineyard",
-    "plantation",
-    "farm",
-    "ranch",
-    "homestead",
-    "holding",
-    "acreage",
-    "territory",
-    "domain",
-    "realm",
-    "kingdom",
-    "empire",
-    "nation",
-    "state",
-    "province",
-    "county",
-    "city",
-    "town",
-    "village",
-    "hamlet",
-    "settlement",
-    "colony",
-    "outpost",
-    "camp",
-    "base",
-    "station",
-    "post",
-    "depot",
-    "terminal",
-    "hub",
-    "center",
-    "nexus",
-    "core",
-    "heart",
-    "middle",
-    "midst",
-    "interior",
-    "inside",
-    "indoors",
-    "room",
-    "chamber",
-    "hall",
-    "corridor",
-    "passage",
-    "hallway",
-    "lobby",
-    "foyer",
-    "entrance",
-    "entry",
-    "exit",
-    "door",
-    "gate",
-    "portal",
-    "threshold",
-    "opening",
-    "window",
-    "view",
-    "vista",
-    "outlook",
-    "perspective",
-    "angle",
-    "aspect",
-    "side",
-    "facet",
-    "dimension",
-    "element",
-    "component",
-    "part",
-    "piece",
-    "section",
-    "segment",
-    "portion",
-    "share",
-    "division",
-    "split",
-    "cut",
-    "slice",
-    "chunk",
-    "block",
-    "unit",
-    "module",
-    "item",
-    "article",
-    "object",
-    "thing",
-    "entity",
-    "being",
-    "creature",
-    "animal",
-    "pet",
-    "livestock",
-    "cattle",
-    "herd",
-    "flock",
-    "pack",
-    "swarm",
-    "group",
-    "cluster",
-    "bunch",
-    "batch",
-    "lot",
-    "set",
-    "collection",
-    "series",
-    "sequence",
-    "chain",
-    "string",
-    "line",
-    "row",
-    "column",
-    "rank",
-    "file",
-    "stack",
-    "pile",
-    "heap",
-    "mound",
-    "hill",
-    "ridge",
-    "range",
-    "array",
-    "assortment",
-    "variety",
-    "diversity",
-    "mix",
-    "mixture",
-    "blend",
-    "combination",
-    "composite",
-    "compound",
-    "alloy",
-    "amalgam",
-    "fusion",
-    "merger",
-    "union",
-    "unity",
-    "whole",
-    "entirety",
-    "totality",
-    "sum",
-    "total",
-    "aggregate",
-    "gross",
-    "amount",
-    "quantity",
-    "volume",
-    "mass",
-    "bulk",
-    "size",
-    "extent",
-    "magnitude",
-    "scale",
-    "scope",
-    "range",
-    "reach",
-    "span",
-    "stretch",
-    "length",
-    "width",
-    "height",
-    "depth",
-    "breadth",
-    "area",
-    "space",
-    "room",
-    "capacity",
-    "load",
-    "weight",
-    "burden",
-    "pressure",
-    "stress",
-    "strain",
-    "tension",
-    "force",
-    "power",
-    "strength",
-    "might",
-    "energy",
-    "vigor",
-    "vitality",
-    "life",
-    "spirit",
-    "essence",
-    "soul",
-    "heart",
-    "mind",
-    "intellect",
-    "intelligence",
-    "wisdom",
-    "knowledge",
-    "understanding",
-    "comprehension",
-    "grasp",
-    "awareness",
-    "consciousness",
-    "perception",
-    "sensation",
-    "feeling",
-    "emotion",
-    "passion",
-    "sentiment",
-    "mood",
-    "attitude",
-    "disposition",
-    "temperament",
-    "character",
-    "personality",
-    "nature",
-    "quality",
-    "trait",
-    "feature",
-    "attribute",
-    "property",
-    "characteristic",
-    "aspect",
-    "facet",
-    "detail",
-    "particular",
-    "specific",
-    "instance",
-    "example",
-    "case",
-    "illustration",
-    "demonstration",
-    "proof",
-    "evidence",
-    "sign",
-    "signal",
-    "indication",
-    "hint",
-    "clue",
-    "tip",
-    "suggestion",
-    "advice",
-    "counsel",
-    "guidance",
-    "direction",
-    "instruction",
-    "order",
-    "command",
-    "mandate",
-    "directive",
-    "rule",
-    "regulation",
-    "law",
-    "policy",
-    "procedure",
-    "process",
-    "method",
-    "technique",
-    "system",
-    "approach",
-    "strategy",
-    "plan",
-    "scheme",
-    "design",
-    "pattern",
-    "model",
-    "framework",
-    "structure",
-    "organization",
-    "arrangement",
-    "order",
-    "configuration",
-    "composition",
-    "makeup",
-    "constitution",
-    "form",
-    "shape",
-    "figure",
-    "outline",
-    "contour",
-    "profile",
-    "silhouette",
-    "frame",
-    "skeleton",
-    "shell",
-    "body",
-    "mass",
-    "substance",
-    "material",
-    "matter",
-    "stuff",
-    "content",
-    "essence",
-    "core",
-    "gist",
-    "meat",
-    "pith",
-    "marrow",
-    "nucleus",
-    "kernel",
-    "seed",
-    "germ",
-    "root",
-    "base",
-    "foundation",
-    "ground",
-    "bedrock",
-    "basis",
-    "footing",
-    "support",
-    "backing",
-    "brace",
-    "prop",
-    "stay",
-    "buttress",
-    "pillar",
-    "column",
-    "beam",
-    "girder",
-    "truss",
-    "arch",
-    "vault",
-    "dome",
-    "roof",
-    "ceiling",
-    "floor",
-    "wall",
-    "partition",
-    "divider",
-    "screen",
-    "shield",
-    "barrier",
-    "fence",
-    "gate",
-    "door",
-    "window",
-    "opening",
-    "passage",
-    "channel",
-    "conduit",
-    "pipe",
-    "tube",
-    "duct",
-    "vent",
-    "outlet",
-    "inlet",
-    "intake",
-    "exhaust",
-    "drain",
-    "sewer",
-    "gutter",
-    "trough",
-    "basin",
-    "bowl",
-    "sink",
-    "tub",
-    "tank",
-    "reservoir",
-    "container",
-    "vessel",
-    "jar",
-    "jug",
-    "bottle",
-    "flask",
-    "can",
-    "tin",
-    "box",
-    "crate",
-    "case",
-    "carton",
-    "package",
-    "pack",
-    "bundle",
-    "bale",
-    "roll",
-    "coil",
-    "spool",
-    "reel",
-    "drum",
-    "barrel",
-    "keg",
-    "cask",
-    "bucket",
-    "pail",
-    "pot",
-    "pan",
-    "kettle",
-    "cauldron",
-    "vat",
-    "bin",
-    "basket",
-    "hamper",
-    "sack",
-    "bag",
-    "pouch",
-    "purse",
-    "wallet",
-    "pocket",
-    "compartment",
-    "drawer",
-    "shelf",
-    "rack",
-    "stand",
-    "table",
-    "desk",
-    "bench",
-    "chair",
-    "seat",
-    "sofa",
-    "couch",
-    "bed",
-    "cot",
-    "bunk",
-    "hammock",
-    "cradle",
-    "crib",
-    "bassinet",
-    "carrier",
-    "sling",
-    "pack",
-    "backpack",
-    "knapsack",
-    "satchel",
-    "briefcase",
-    "suitcase",
-    "trunk",
-    "chest",
-    "locker",
-    "cabinet",
-    "cupboard",
-    "closet",
-    "wardrobe",
-    "armoire",
-    "bureau",
-    "dresser",
-    "vanity",
-    "mirror",
-    "glass",
-    "window",
-    "pane",
-    "lens",
-    "prism",
-    "crystal",
-    "jewel",
-    "gem",
-    "stone",
-    "rock",
-    "boulder",
-    "pebble",
-    "gravel",
-    "sand",
-    "dust",
-    "dirt",
-    "soil",
-    "earth",
-    "ground",
-    "land",
-    "terrain",
-    "landscape",
-    "scenery",
-    "view",
-    "vista",
-    "panorama",
-    "outlook",
-    "prospect",
-    "scene",
-    "picture",
-    "image",
-    "portrait",
-    "photograph",
-    "snapshot",
-    "shot",
-    "frame",
-    "film",
-    "movie",
-    "video",
-    "clip",
-    "reel",
-    "tape",
-    "disc",
-    "record",
-    "album",
-    "track",
-    "song",
-    "tune",
-    "melody",
-    "harmony",
-    "rhythm",
-    "beat",
-    "tempo",
-    "pulse",
-    "sound",
-    "noise",
-    "tone",
-    "pitch",
-    "volume",
-    "echo",
-    "resonance",
-    "vibration",
-    "wave",
-    "frequency",
-    "signal",
-    "transmission",
-    "broadcast",
-    "airing",
-    "showing",
-    "screening",
-    "display",
-    "exhibition",
-    "presentation",
-    "demonstration",
-    "performance",
-    "act",
-    "play",
-    "drama",
-    "comedy",
-    "tragedy",
-    "opera",
-    "musical",
-    "concert",
-    "recital",
-    "reading",
-    "lecture",
-    "speech",
-    "talk",
-    "address",
-    "sermon",
-    "homily",
-    "lesson",
-    "tutorial",
-    "class",
-    "course",
-    "seminar",
-    "workshop",
-    "training",
-    "session",
-    "meeting",
-    "conference",
-    "convention",
-    "assembly",
-    "gathering",
-    "rally",
-    "protest",
-    "demonstration",
-    "march",
-    "parade",
-    "procession",
-    "caravan",
-    "convoy",
-    "fleet",
-    "squadron",
-    "armada",
-    "navy",
-    "army",
-    "force",
-    "troop",
-    "platoon",
-    "company",
-    "battalion",
-    "regiment",
-    "brigade",
-    "division",
-    "corps",
-    "team",
-    "squad",
-    "crew",
-    "gang",
-    "band",
-    "group",
-    "party",
-    "crowd",
-    "mob",
-    "throng",
-    "horde",
-    "swarm",
-    "flock",
-    "herd",
-    "pack",
-    "litter",
-    "brood",
-    "clutch",
-    "nest",
-    "colony",
-    "hive",
-    "den",
-    "lair",
-    "burrow",
-    "hole",
-    "cave",
-    "cavern",
-    "tunnel",
-    "passage",
-    "channel",
-    "corridor",
-    "hallway",
-    "aisle",
-    "path",
-    "walkway",
-    "sidewalk",
-    "pavement",
-    "road",
-    "street",
-    "avenue",
-    "boulevard",
-    "lane",
-    "alley",
-    "drive",
-    "route",
-    "course",
-    "track",
-    "trail",
-    "way",
-    "highway",
-    "freeway",
-    "turnpike",
-    "tollway",
-    "bridge",
-    "overpass",
-    "underpass",
-    "viaduct",
-    "aqueduct",
-    "canal",
-    "waterway",
-    "river",
-    "stream",
-    "creek",
-    "brook",
-    "tributary",
-    "delta",
-    "estuary",
-    "bay",
-    "gulf",
-    "cove",
-    "inlet",
-    "harbor",
-    "port",
-    "dock",
-    "pier",
-    "wharf",
-    "quay",
-    "jetty",
-    "breakwater",
-    "seawall",
-    "levee",
-    "dam",
-    "dike",
-    "embankment",
-    "rampart",
-    "wall",
-    "fence",
-    "barrier",
-    "gate",
-    "door",
-    "portal",
-    "entrance",
-    "exit",
-    "opening",
-    "threshold",
-    "archway",
-    "gateway",
-    "passageway",
-    "entryway",
-    "hatch",
-    "trapdoor",
-    "skylight",
-    "window",
-    "vent",
-    "chimney",
-    "flue",
-    "stack",
-    "pipe",
-    "tube",
-    "hose",
-    "line",
-    "cable",
-    "wire",
-    "cord",
-    "rope",
-    "chain",
-    "link",
-    "tie",
-    "bond",
-    "strap",
-    "belt",
-    "band",
-    "ribbon",
-    "tape",
-    "strip",
-    "bar",
-    "rod",
-    "pole",
-    "staff",
-    "stick",
-    "stake",
-    "peg",
-    "pin",
-    "nail",
-    "screw",
-    "bolt",
-    "nut",
-    "washer",
-    "rivet",
-    "clamp",
-    "clip",
-    "hook",
-    "latch",
-    "lock",
-    "key",
-    "hinge",
-    "knob",
-    "handle",
-    "grip",
-    "lever",
-    "crank",
-    "wheel",
-    "gear",
-    "pulley",
-    "sprocket",
-    "chain",
-    "belt",
-    "shaft",
-    "axle",
-    "spindle",
-    "pivot",
-    "joint",
-    "hinge",
-    "bearing",
-    "coupling",
-    "connector",
-    "fitting",
-    "adapter",
-    "plug",
-    "socket",
-    "outlet",
-    "jack",
-    "port",
-    "terminal",
-    "switch",
-    "button",
-    "dial",
-    "knob",
-    "lever",
-    "pedal",
-    "treadle",
-    "trigger",
-    "catch",
-    "latch",
-    "bolt",
-    "lock",
-    "bar",
-    "barrier",
-    "gate",
-    "fence",
-    "wall",
-    "rampart",
-    "bulwark",
-    "bastion",
-    "fortress",
-    "castle",
-    "citadel",
-    "stronghold",
-    "fort",
-    "bunker",
-    "shelter",
-    "refuge",
-    "haven",
-    "sanctuary",
-    "retreat",
-    "hideout",
-    "lair",
-    "den",
-    "nest",
-    "roost",
-    "perch",
-    "coop",
-    "cage",
-    "pen",
-    "enclosure",
-    "paddock",
-    "corral",
-    "yard",
-    "court",
-    "garden",
-    "park",
-    "grounds",
-    "estate",
-    "property",
-    "land",
-    "plot",
-    "parcel",
-    "tract",
-    "lot",
-    "field",
-    "meadow",
-    "pasture",
-    "prairie",
-    "plain",
-    "steppe",
-    "savanna",
-    "tundra",
-    "desert",
-    "wilderness",
-    "jungle",
-    "forest",
-    "woods",
-    "grove",
-    "orchard",
-    "vineyard",
-    "plantation",
-    "farm",
-    "ranch",
-    "homestead",
-    "holding",
-    "acreage",
-    "territory",
-    "domain",
-    "realm",
-    "kingdom",
-    "empire",
-    "nation",
-    "state",
-    "province",
-    "county",
-    "city",
-    "town",
-    "village",
-    "hamlet",
-    "settlement",
-    "colony",
-    "outpost",
-    "camp",
-    "base",
-    "station",
-    "post",
-    "depot",
-    "terminal",
-    "hub",
-    "center",
-    "nexus",
-    "core",
-    "heart",
-    "middle",
-    "midst",
-    "interior",
-    "inside",
-    "indoors",
-    "room",
-    "chamber",
-    "hall",
-    "corridor",
-    "passage",
-    "hallway",
-    "lobby",
-    "foyer",
-    "entrance",
-    "entry",
-    "exit",
-    "door",
-    "gate",
-    "portal",
-    "threshold",
-    "opening",
-    "window",
-    "view",
-    "vista",
-    "outlook",
-    "perspective",
-    "angle",
-    "aspect",
-    "side",
-    "facet",
-    "dimension",
-    "element",
-    "component",
-    "part",
-    "piece",
-    "section",
-    "segment",
-    "portion",
-    "share",
-    "division",
-    "split",
-    "cut",
-    "slice",
-    "chunk",
-    "block",
-    "unit",
-    "module",
-    "item",
-    "article",
-    "object",
-    "thing",
-    "entity",
-    "being",
-    "creature",
-    "animal",
-    "pet",
-    "livestock",
-    "cattle",
-    "herd",
-    "flock",
-    "pack",
-    "swarm",
-    "group",
-    "cluster",
-    "bunch",
-    "batch",
-    "lot",
-    "set",
-    "collection",
-    "series",
-    "sequence",
-    "chain",
-    "string",
-    "line",
-    "row",
-    "column",
-    "rank",
-    "file",
-    "stack",
-    "pile",
-    "heap",
-    "mound",
-    "hill",
-    "ridge",
-    "range",
-    "array",
-    "assortment",
-    "variety",
-    "diversity",
-    "mix",
-    "mixture",
-    "blend",
-    "combination",
-    "composite",
-    "compound",
-    "alloy",
-    "amalgam",
-    "fusion",
-    "merger",
-    "union",
-    "unity",
-    "whole",
-    "entirety",
-    "totality",
-    "sum",
-    "total",
-    "aggregate",
-    "gross",
-    "amount",
-    "quantity",
-    "volume",
-    "mass",
-    "bulk",
-    "size",
-    "extent",
-    "magnitude",
-    "scale",
-    "scope",
-    "range",
-    "reach",
-    "span",
-    "stretch",
-    "length",
-    "width",
-    "height",
-    "depth",
-    "breadth",
-    "area",
-    "space",
-    "room",
-    "capacity",
-    "load",
-    "weight",
-    "burden",
-    "pressure",
-    "stress",
-    "strain",
-    "tension",
-    "force",
-    "power",
-    "strength",
-    "might",
-    "energy",
-    "vigor",
-    "vitality",
-    "life",
-    "spirit",
-    "essence",
-    "soul",
-    "heart",
-    "mind",
-    "intellect",
-    "intelligence",
-    "wisdom",
-    "knowledge",
-    "understanding",
-    "comprehension",
-    "grasp",
-    "awareness",
-    "consciousness",
-    "perception",
-    "sensation",
-    "feeling",
-    "emotion",
-    "passion",
-    "sentiment",
-    "mood",
-    "attitude",
-    "disposition",
-    "temperament",
-    "character",
-    "personality",
-    "nature",
-    "quality",
-    "trait",
-    "feature",
-    "attribute",
-    "property",
-    "characteristic",
-    "aspect",
-    "facet",
-    "detail",
-    "particular",
-    "specific",
-    "instance",
-    "example",
-    "case",
-    "illustration",
-    "demonstration",
-    "proof",
-    "evidence",
-    "sign",
-    "signal",
-    "indication",
-    "hint",
-    "clue",
-    "tip",
-    "suggestion",
-    "advice",
-    "counsel",
-    "guidance",
-    "direction",
-    "instruction",
-    "order",
-    "command",
-    "mandate",
-    "directive",
-    "rule",
-    "regulation",
-    "law",
-    "policy",
-    "procedure",
-    "process",
-    "method",
-    "technique",
-    "system",
-    "approach",
-    "strategy",
-    "plan",
-    "scheme",
-    "design",
-    "pattern",
-    "model",
-    "framework",
-    "structure",
-    "organization",
-    "arrangement",
-    "order",
-    "configuration",
-    "composition",
-    "makeup",
-    "constitution",
-    "form",
-    "shape",
-    "figure",
-    "outline",
-    "contour",
-    "profile",
-    "silhouette",
-    "frame",
-    "skeleton",
-    "shell",
-    "body",
-    "mass",
-    "substance",
-    "material",
-    "matter",
-    "stuff",
-    "content",
-    "essence",
-    "core",
-    "gist",
-    "meat",
-    "pith",
-    "marrow",
-    "nucleus",
-    "kernel",
-    "seed",
-    "germ",
-    "root",
-    "base",
-    "foundation",
-    "ground",
-    "bedrock",
-    "basis",
-    "footing",
-    "support",
-    "backing",
-    "brace",
-    "prop",
-    "stay",
-    "buttress",
-    "pillar",
-    "column",
-    "beam",
-    "girder",
-    "truss",
-    "arch",
-    "vault",
-    "dome",
-    "roof",
-    "ceiling",
-    "floor",
-    "wall",
-    "partition",
-    "divider",
-    "screen",
-    "shield",
-    "barrier",
-    "fence",
-    "gate",
-    "door",
-    "window",
-    "opening",
-    "passage",
-    "channel",
-    "conduit",
-    "pipe",
-    "tube",
-    "duct",
-    "vent",
-    "outlet",
-    "inlet",
-    "intake",
-    "exhaust",
-    "drain",
-    "sewer",
-    "gutter",
-    "trough",
-    "basin",
-    "bowl",
-    "sink",
-    "tub",
-    "tank",
-    "reservoir",
-    "container",
-    "vessel",
-    "jar",
-    "jug",
-    "bottle",
-    "flask",
-    "can",
-    "tin",
-    "box",
-    "crate",
-    "case",
-    "carton",
-    "package",
-    "pack",
-    "bundle",
-    "bale",
-    "roll",
-    "coil",
-    "spool",
-    "reel",
-    "drum",
-    "barrel",
-    "keg",
-    "cask",
-    "bucket",
-    "pail",
-    "pot",
-    "pan",
-    "kettle",
-    "cauldron",
-    "vat",
-    "bin",
-    "basket",
-    "hamper",
-    "sack",
-    "bag",
-    "pouch",
-    "purse",
-    "wallet",
-    "pocket",
-    "compartment",
-    "drawer",
-    "shelf",
-    "rack",
-    "stand",
-    "table",
-    "desk",
-    "bench",
-    "chair",
-    "seat",
-    "sofa",
-    "couch",
-    "bed",
-    "cot",
-    "bunk",
-    "hammock",
-    "cradle",
-    "crib",
-    "bassinet",
-    "carrier",
-    "sling",
-    "pack",
-    "backpack",
-    "knapsack",
-    "satchel",
-    "briefcase",
-    "suitcase",
-    "trunk",
-    "chest",
-    "locker",
-    "cabinet",
-    "cupboard",
-    "closet",
-    "wardrobe",
-    "armoire",
-    "bureau",
-    "dresser",
-    "vanity",
-    "mirror",
-    "glass",
-    "window",
-    "pane",
-    "lens",
-    "prism",
-    "crystal",
-    "jewel",
-    "gem",
-    "stone",
-    "rock",
-    "boulder",
-    "pebble",
-    "gravel",
-    "sand",
-    "dust",
-    "dirt",
-    "soil",
-    "earth",
-    "ground",
-    "land",
-    "terrain",
-    "landscape",
-    "scenery",
-    "view",
-    "vista",
-    "panorama",
-    "outlook",
-    "prospect",
-    "scene",
-    "picture",
-    "image",
-    "portrait",
-    "photograph",
-    "snapshot",
-    "shot",
-    "frame",
-    "film",
-    "movie",
-    "video",
-    "clip",
-    "reel",
-    "tape",
-    "disc",
-    "record",
-    "album",
-    "track",
-    "song",
-    "tune",
-    "melody",
-    "harmony",
-    "rhythm",
-    "beat",
-    "tempo",
-    "pulse",
-    "sound",
-    "noise",
-    "tone",
-    "pitch",
-    "volume",
-    "echo",
-    "resonance",
-    "vibration",
-    "wave",
-    "frequency",
-    "signal",
-    "transmission",
-    "broadcast",
-    "airing",
-    "showing",
-    "screening",
-    "display",
-    "exhibition",
-    "presentation",
-    "demonstration",
-    "performance",
-    "act",
-    "play",
-    "drama",
-    "comedy",
-    "tragedy",
-    "opera",
-    "musical",
-    "concert",
-    "recital",
-    "reading",
-    "lecture",
-    "speech",
-    "talk",
-    "address",
-    "sermon",
-    "homily",
-    "lesson",
-    "tutorial",
-    "class",
-    "course",
-    "seminar",
-    "workshop",
-    "training",
-    "session",
-    "meeting",
-    "conference",
-    "convention",
-    "assembly",
-    "gathering",
-    "rally",
-    "protest",
-    "demonstration",
-    "march",
-    "parade",
-    "procession",
-    "caravan",
-    "convoy",
-    "fleet",
-    "squadron",
-    "armada",
-    "navy",
-    "army",
-    "force",
-    "troop",
-    "platoon",
-    "company",
-    "battalion",
-    "regiment",
-    "brigade",
-    "division",
-    "corps",
-    "team",
-    "squad",
-    "crew",
-    "gang",
-    "band",
-    "group",
-    "party",
-    "crowd",
-    "mob",
-    "throng",
-    "horde",
-    "swarm",
-    "flock",
-    "herd",
-    "pack",
-    "litter",
-    "brood",
-    "clutch",
-    "nest",
-    "colony",
-    "hive",
-    "den",
-    "lair",
-    "burrow",
-    "hole",
-    "cave",
-    "cavern",
-    "tunnel",
-    "passage",
-    "channel",
-    "corridor",
-    "hallway",
-    "aisle",
-    "path",
-    "walkway",
-    "sidewalk",
-    "pavement",
-    "road",
-    "street",
-    "avenue",
-    "boulevard",
-    "lane",
-    "alley",
-    "drive",
-    "route",
-    "course",
-    "track",
-    "trail",
-    "way",
-    "highway",
-    "freeway",
-    "turnpike",
-    "tollway",
-    "bridge",
-    "overpass",
-    "underpass",
-    "viaduct",
-    "aqueduct",
-    "canal",
-    "waterway",
-    "river",
-    "stream",
-    "creek",
-    "brook",
-    "tributary",
-    "delta",
-    "estuary",
-    "bay",
-    "gulf",
-    "cove",
-    "inlet",
-    "harbor",
-    "port",
-    "dock",
-    "pier",
-    "wharf",
-    "quay",
-    "jetty",
-    "breakwater",
-    "seawall",
-    "levee",
-    "dam",
-    "dike",
-    "embankment",
-    "rampart",
-    "wall",
-    "fence",
-    "barrier",
-    "gate",
-    "door",
-    "portal",
-    "entrance",
-    "exit",
-    "opening",
-    "threshold",
-    "archway",
-    "gateway",
-    "passageway",
-    "entryway",
-    "hatch",
-    "trapdoor",
-    "skylight",
-    "window",
-    "vent",
-    "chimney",
-    "flue",
-    "stack",
-    "pipe",
-    "tube",
-    "hose",
-    "line",
-    "cable",
-    "wire",
-    "cord",
-    "rope",
-    "chain",
-    "link",
-    "tie",
-    "bond",
-    "strap",
-    "belt",
-    "band",
-    "ribbon",
-    "tape",
-    "strip",
-    "bar",
-    "rod",
-    "pole",
-    "staff",
-    "stick",
-    "stake",
-    "peg",
-    "pin",
-    "nail",
-    "screw",
-    "bolt",
-    "nut",
-    "washer",
-    "rivet",
-    "clamp",
-    "clip",
-    "hook",
-    "latch",
-    "lock",
-    "key",
-    "hinge",
-    "knob",
-    "handle",
-    "grip",
-    "lever",
-    "crank",
-    "wheel",
-    "gear",
-    "pulley",
-    "sprocket",
-    "chain",
-    "belt",
-    "shaft",
-    "axle",
-    "spindle",
-    "pivot",
-    "joint",
-    "hinge",
-    "bearing",
-    "coupling",
-    "connector",
-    "fitting",
-    "adapter",
-    "plug",
-    "socket",
-    "outlet",
-    "jack",
-    "port",
-    "terminal",
-    "switch",
-    "button",
-    "dial",
-    "knob",
-    "lever",
-    "pedal",
-    "treadle",
-    "trigger",
-    "catch",
-    "latch",
-    "bolt",
-    "lock",
-    "bar",
-    "barrier",
-    "gate",
-    "fence",
-    "wall",
-    "rampart",
-    "bulwark",
-    "bastion",
-    "fortress",
-    "castle",
-    "citadel",
-    "stronghold",
-    "fort",
-    "bunker",
-    "shelter",
-    "refuge",
-    "haven",
-    "sanctuary",
-    "retreat",
-    "hideout",
-    "lair",
-    "den",
-    "nest",
-    "roost",
-    "perch",
-    "coop",
-    "cage",
-    "pen",
-    "enclosure",
-    "paddock",
-    "corral",
-    "yard",
-    "court",
-    "garden",
-    "park",
-    "grounds",
-    "estate",
-    "property",
-    "land",
-    "plot",
-    "parcel",
-    "tract",
-    "lot",
-    "field",
-    "meadow",
-    "pasture",
-    "prairie",
-    "plain",
-    "steppe",
-    "savanna",
-    "tundra",
-    "desert",
-    "wilderness",
-    "jungle",
-    "forest",
-    "woods",
-    "grove",
-    "orchard",
-    "vineyard",
-    "plantation",
-    "farm",
-    "ranch",
-    "homestead",
-    "holding",
-    "acreage",
-    "territory",
-    "domain",
-    "realm",
-    "kingdom",
-    "empire",
-    "nation",
-    "state",
-    "province",
-    "county",
-    "city",
-    "town",
-    "village",
-    "hamlet",
-    "settlement",
-    "colony",
-    "outpost",
-    "camp",
-    "base",
-    "station",
-    "post",
-    "depot",
-    "terminal",
-    "hub",
-    "center",
-    "nexus",
-    "core",
-    "heart",
-    "middle",
-    "midst",
-    "interior",
-    "inside",
-    "indoors",
-    "room",
-    "chamber",
-    "hall",
-    "corridor",
-    "passage",
-    "hallway",
-    "lobby",
-    "foyer",
-    "entrance",
-    "entry",
-    "exit",
-    "door",
-    "gate",
-    "portal",
-    "threshold",
-    "opening",
-    "window",
-    "view",
-    "vista",
-    "outlook",
-    "perspective",
-    "angle",
-    "aspect",
-    "side",
-    "facet",
-    "dimension",
-    "element",
-    "component",
-    "part",
-    "piece",
-    "section",
-    "segment",
-    "portion",
-    "share",
-    "division",
-    "split",
-    "cut",
-    "slice",
-    "chunk",
-    "block",
-    "unit",
-    "module",
-    "item",
-    "article",
-    "object",
-    "thing",
-    "entity",
-    "being",
-    "creature",
-    "animal",
-    "pet",
-    "livestock",
-    "cattle",
-    "herd",
-    "flock",
-    "pack",
-    "swarm",
-    "group",
-    "cluster",
-    "bunch",
-    "batch",
-    "lot",
-    "set",
-    "collection",
-    "series",
-    "sequence",
-    "chain",
-    "string",
-    "line",
-    "row",
-    "column",
-    "rank",
-    "file",
-    "stack",
-    "pile",
-    "heap",
-    "mound",
-    "hill",
-    "ridge",
-    "range",
-    "array",
-    "assortment",
-    "variety",
-    "diversity",
-    "mix",
-    "mixture",
-    "blend",
-    "combination",
-    "composite",
-    "compound",
-    "alloy",
-    "amalgam",
-    "fusion",
-    "merger",
-    "union",
-    "unity",
-    "whole",
-    "entirety",
-    "totality",
-    "sum",
-    "total",
-    "aggregate",
-    "gross",
-    "amount",
-    "quantity",
-    "volume",
-    "mass",
-    "bulk",
-    "size",
-    "extent",
-    "magnitude",
-    "scale",
-    "scope",
-    "range",
-    "reach",
-    "span",
-    "stretch",
-    "length",
-    "width",
-    "height",
-    "depth",
-    "breadth",
-    "area",
-    "space",
-    "room",
-    "capacity",
-    "load",
-    "weight",
-    "burden",
-    "pressure",
-    "stress",
-    "strain",
-    "tension",
-    "force",
-    "power",
-    "strength",
-    "might",
-    "energy",
-    "vigor",
-    "vitality",
-    "life",
-    "spirit",
-    "essence",
-    "soul",
-    "heart",
-    "mind",
-    "intellect",
-    "intelligence",
-    "wisdom",
-    "knowledge",
-    "understanding",
-    "comprehension",
-    "grasp",
-    "awareness",
-    "consciousness",
-    "perception",
-    "sensation",
-    "feeling",
-    "emotion",
-    "passion",
-    "sentiment",
-    "mood",
-    "attitude",
-    "disposition",
-    "temperament",
-    "character",
-    "personality",
-    "nature",
-    "quality",
-    "trait",
-    "feature",
-    "attribute",
-    "property",
-    "characteristic",
-    "aspect",
-    "facet",
-    "detail",
-    "particular",
-    "specific",
-    "instance",
-    "example",
-    "case",
-    "illustration",
-    "demonstration",
-    "proof",
-    "evidence",
-    "sign",
-    "signal",
-    "indication",
-    "hint",
-    "clue",
-    "tip",
-    "suggestion",
-    "advice",
-    "counsel",
-    "guidance",
-    "direction",
-    "instruction",
-    "order",
-    "command",
-    "mandate",
-    "directive",
-    "rule",
-    "regulation",
-    "law",
-    "policy",
-    "procedure",
-    "process",
-    "method",
-    "technique",
-    "system",
-    "approach",
-    "strategy",
-    "plan",
-    "scheme",
-    "design",
-    "pattern",
-    "model",
-    "framework",
-    "structure",
-    "organization",
-    "arrangement",
-    "order",
-    "configuration",
-    "composition",
-    "makeup",
-    "constitution",
-    "form",
-    "shape",
-    "figure",
-    "outline",
-    "contour",
-    "profile",
-    "silhouette",
-    "frame",
-    "skeleton",
-    "shell",
-    "body",
-    "mass",
-    "substance",
-    "material",
-    "matter",
-    "stuff",
-    "content",
-    "essence",
-    "core",
-    "gist",
-    "meat",
-    "pith",
-    "marrow",
-    "nucleus",
-    "kernel",
-    "seed",
-    "germ",
-    "root",
-    "base",
-    "foundation",
-    "ground",
-    "bedrock",
-    "basis",
-    "footing",
-    "support",
-    "backing",
-    "brace",
-    "prop",
-    "stay",
-    "buttress",
-    "pillar",
-    "column",
-    "beam",
-    "girder",
-    "truss",
-    "arch",
-    "vault",
-    "dome",
-    "roof",
-    "ceiling",
-    "floor",
-    "wall",
-    "partition",
-    "divider",
-    "screen",
-    "shield",
-    "barrier",
-    "fence",
-    "gate",
-    "door",
-    "window",
-    "opening",
-    "passage",
-    "channel",
-    "conduit",
-    "pipe",
-    "tube",
-    "duct",
-    "vent",
-    "outlet",
-    "inlet",
-    "intake",
-    "exhaust",
-    "drain",
-    "sewer",
-    "gutter",
-    "trough",
-    "basin",
-    "bowl",
-    "sink",
-    "tub",
-    "tank",
-    "reservoir",
-    "container",
-    "vessel",
-    "jar",
-    "jug",
-    "bottle",
-    "flask",
-    "can",
-    "tin",
-    "box",
-    "crate",
-    "case",
-    "carton",
-    "package",
-    "pack",
-    "bundle",
-    "bale",
-    "roll",
-    "coil",
-    "spool",
-    "reel",
-    "drum",
-    "barrel",
-    "keg",
-    "cask",
-    "bucket",
-    "pail",
-    "pot",
-    "pan",
-    "kettle",
-    "cauldron",
-    "vat",
-    "bin",
-    "basket",
-    "hamper",
-    "sack",
-    "bag",
-    "pouch",
-    "purse",
-    "wallet",
-    "pocket",
-    "compartment",
-    "drawer",
-    "shelf",
-    "rack",
-    "stand",
-    "table",
-    "desk",
-    "bench",
-    "chair",
-    "seat",
-    "sofa",
-    "couch",
-    "bed",
-    "cot",
-    "bunk",
-    "hammock",
-    "cradle",
-    "crib",
-    "bassinet",
-    "carrier",
-    "sling",
-    "pack",
-    "backpack",
-    "knapsack",
-    "satchel",
-    "briefcase",
-    "suitcase",
-    "trunk",
-    "chest",
-    "locker",
-    "cabinet",
-    "cupboard",
-    "closet",
-    "wardrobe",
-    "armoire",
-    "bureau",
-    "dresser",
-    "vanity",
-    "mirror",
-    "glass",
-    "window",
-    "pane",
-    "lens",
-    "prism",
-    "crystal",
-]
@@ -0,0 +1,98 @@
+"""Benchmarks the latency per exported image, with and without reusing the
+renderer of the export process.
+
+Without reuse, every write_image call starts its own renderer, like the export
+did before ExportSession. With reuse, the process starts its renderer once,
+in start_renderer, and streams every figure through it. Both runs render in a
+fresh process, such that neither starts with a running renderer. Needs Kaleido
+and, for Kaleido 1.x, Chrome (see plotly_get_chrome).
+
+    python test/benchmark_export_latency.py --nr-of-images 10
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+import plotly.graph_objects as go
+
+from hledger_plot.create_plots.export_figures import (
+    start_renderer,
+    write_figure_image,
+)
+
+
+def create_figure_dict(*, index: int) -> Dict[str, Any]:
+    figure = go.Figure(
+        go.Sankey(
+            node={"label": ["income", "BALANCE-LINE", "expenses", "rent"]},
+            link={
+                "source": [0, 1, 2],
+                "target": [1, 2, 3],
+                "value": [1000 + index, 1000 + index, 800],
+            },
+        )
+    )
+    figure_dict: Dict[str, Any] = figure.to_dict()
+    return figure_dict
+
+
+def measure_seconds_per_image(
+    *,
+    nr_of_images: int,
+    image_format: str,
+    initializer: Optional[Callable[[], None]],
+) -> float:
+    """Returns the mean latency of exporting nr_of_images figures one after
+    another, in a fresh process."""
+    figure_dicts: List[Dict[str, Any]] = [
+        create_figure_dict(index=index) for index in range(nr_of_images)
+    ]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filepaths: List[str] = [
+            os.path.join(tmp_dir, f"figure{index}.{image_format}")
+            for index in range(nr_of_images)
+        ]
+        with ProcessPoolExecutor(
+            max_workers=1, initializer=initializer
+        ) as executor:
+            start: float = time.perf_counter()
+            list(
+                executor.map(
+                    write_figure_image,
+                    figure_dicts,
+                    filepaths,
+                    [image_format] * nr_of_images,
+                )
+            )
+            # Includes the start of the process, and of the renderer.
+            seconds: float = time.perf_counter() - start
+    return seconds / nr_of_images
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nr-of-images", type=int, default=10)
+    parser.add_argument("--image-format", type=str, default="png")
+    args = parser.parse_args()
+
+    without_reuse: float = measure_seconds_per_image(
+        nr_of_images=args.nr_of_images,
+        image_format=args.image_format,
+        initializer=None,
+    )
+    with_reuse: float = measure_seconds_per_image(
+        nr_of_images=args.nr_of_images,
+        image_format=args.image_format,
+        initializer=start_renderer,
+    )
+    print(f"Seconds per image, mean over {args.nr_of_images} images:")
+    print(f"  without renderer reuse: {without_reuse:.3f}")
+    print(f"  with renderer reuse:    {with_reuse:.3f}")
+
+
+if __name__ == "__main__":
+    main()
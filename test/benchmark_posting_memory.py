@@ -0,0 +1,83 @@
+"""Measures the memory that parsed journal postings take, with tracemalloc.
+
+Parses a synthetic journal into Transaction objects and reports the traced
+bytes that the parsed transactions keep alive, per posting. To compare with
+another version of the parser, e.g. the one before the __slots__ classes,
+check it out in a worktree and pass its src directory:
+
+    git worktree add /tmp/before <commit>
+    python test/benchmark_posting_memory.py --src /tmp/before/src
+    python test/benchmark_posting_memory.py
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import tracemalloc
+from typing import Any, List
+
+
+def write_synthetic_journal(*, filepath: str, nr_of_transactions: int) -> int:
+    """Writes a journal with two postings per transaction, and returns the
+    number of postings."""
+    with open(filepath, "w", encoding="utf-8") as journal_file:
+        for i in range(nr_of_transactions):
+            journal_file.write(
+                f"2024-01-{i % 28 + 1:02d} transaction {i} ; a:b,\n"
+                f"    expenses:category{i % 100}:sub{i % 7}"
+                f"    {i % 1000}.{i % 100:02d} EUR\n"
+                "    assets:bank:checking\n\n"
+            )
+    return 2 * nr_of_transactions
+
+
+def measure_bytes_per_posting(*, nr_of_transactions: int) -> float:
+    from hledger_plot.journal_parsing.get_top_level_domains import (
+        get_all_transactions_from_journal,
+    )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        journal_filepath: str = os.path.join(tmp_dir, "synthetic.journal")
+        nr_of_postings: int = write_synthetic_journal(
+            filepath=journal_filepath, nr_of_transactions=nr_of_transactions
+        )
+        gc.collect()
+        tracemalloc.start()
+        before: int = tracemalloc.get_traced_memory()[0]
+        transactions: List[Any] = get_all_transactions_from_journal(
+            journal_filepath=journal_filepath
+        )
+        gc.collect()
+        after: int = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+    assert sum(len(t.postings) for t in transactions) == nr_of_postings
+    return (after - before) / nr_of_postings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--src",
+        type=str,
+        default=os.path.join(os.path.dirname(__file__), "..", "src"),
+        help="The src directory of the hledger_plot version to measure.",
+    )
+    parser.add_argument("--nr-of-transactions", type=int, default=100_000)
+    args = parser.parse_args()
+    sys.path.insert(0, os.path.abspath(args.src))
+
+    bytes_per_posting: float = measure_bytes_per_posting(
+        nr_of_transactions=args.nr_of_transactions
+    )
+    import hledger_plot
+
+    print(
+        f"{os.path.dirname(hledger_plot.__file__)}: {bytes_per_posting:.0f}"
+        f" bytes per posting ({2 * args.nr_of_transactions} postings)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Benchmarks the encoding of Sankey nodes as integers.
+
+Compares the former lookup of every link source and target with
+list(nodes).index, against encode_sankey_nodes, on synthetic account trees of
+1k, 10k and 100k links, in which every node links to a random earlier node.
+The list.index lookup is quadratic, so it is skipped above --max-list-links.
+
+    python test/benchmark_sankey_nodes.py
+"""
+
+import argparse
+import random
+import time
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.core.frame import DataFrame
+
+from hledger_plot.create_plots.create_sankey_plot import encode_sankey_nodes
+
+
+def create_synthetic_sankey_df(*, nr_of_links: int, seed: int) -> DataFrame:
+    rng = random.Random(seed)  # nosec
+    nodes: List[str] = ["BALANCE-LINE"]
+    sources: List[str] = []
+    targets: List[str] = []
+    for i in range(nr_of_links):
+        parent: str = nodes[rng.randrange(len(nodes))]
+        child: str = f"{parent}:node{i}"
+        nodes.append(child)
+        sources.append(parent)
+        targets.append(child)
+    return DataFrame(
+        {
+            "source": sources,
+            "target": targets,
+            "value": [rng.random() for _ in range(nr_of_links)],
+        }
+    )
+
+
+def encode_with_list_index(
+    *, sankey_df: DataFrame
+) -> Tuple[np.ndarray, List[int], List[int]]:
+    """The node encoding before pd.factorize."""
+    nodes = pd.concat([sankey_df["source"], sankey_df["target"]]).unique()
+    sources: List[int] = []
+    targets: List[int] = []
+    for x in sankey_df["source"]:
+        sources.append(list(nodes).index(x))
+    for x in sankey_df["target"]:
+        targets.append(list(nodes).index(x))
+    return nodes, sources, targets
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--nr-of-links", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    parser.add_argument("--max-list-links", type=int, default=10_000)
+    args = parser.parse_args()
+
+    print(f"{'links':>8} {'list.index':>12} {'factorize':>12}")
+    for nr_of_links in args.nr_of_links:
+        sankey_df: DataFrame = create_synthetic_sankey_df(
+            nr_of_links=nr_of_links, seed=0
+        )
+
+        start: float = time.perf_counter()
+        nodes, sources, targets = encode_sankey_nodes(sankey_df=sankey_df)
+        factorize_seconds: float = time.perf_counter() - start
+
+        list_index_duration: str = "skipped"
+        if nr_of_links <= args.max_list_links:
+            start = time.perf_counter()
+            old_nodes, old_sources, old_targets = encode_with_list_index(
+                sankey_df=sankey_df
+            )
+            list_index_duration = f"{time.perf_counter() - start:.4f}s"
+            assert nodes.tolist() == old_nodes.tolist()
+            assert sources.tolist() == old_sources
+            assert targets.tolist() == old_targets
+
+        print(
+            f"{nr_of_links:>8} {list_index_duration:>12}"
+            f" {factorize_seconds:>11.4f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Tests whether verify_args rejects invalid options."""
+
+import sys
+
+import pytest
+
+from hledger_plot.arg_parser import create_arg_parser, verify_args
+
+
+@pytest.mark.parametrize("top_n", ["0", "-1"])
+def test_sankey_top_n_below_one_is_rejected(
+    top_n: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["hledger_plot", "-j", "main.journal", "--sankey-top-n", top_n],
+    )
+
+    with pytest.raises(ValueError, match="--sankey-top-n"):
+        verify_args(parser=create_arg_parser())
+
+
+def test_sankey_top_n_of_one_is_accepted(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["hledger_plot", "-j", "main.journal", "--sankey-top-n", "1"],
+    )
+
+    assert verify_args(parser=create_arg_parser()).sankey_top_n == 1
+
+
+def test_map_file_without_randomize_key_is_rejected(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "hledger_plot",
+            "-j",
+            "main.journal",
+            "--randomize",
+            "--random-seed",
+            "7",
+            "--randomize-map-filepath",
+            "pseudonyms.json",
+        ],
+    )
+
+    with pytest.raises(ValueError, match="--randomize-key"):
+        verify_args(parser=create_arg_parser())
@@ -0,0 +1,200 @@
+"""Tests whether the hledger output cache is keyed on the whole include tree,
+evicts old and least recently used entries, and never stops a run."""
+
+import os
+import time
+from argparse import Namespace
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from hledger_plot import parse_journal
+from hledger_plot.balance_cache import (
+    evict_cache_entries,
+    get_cache_filepath,
+    get_cache_key,
+    load_cached_output,
+    store_cached_output,
+)
+from hledger_plot.parse_journal import get_hledger_output
+
+
+def write_journal(*, journal_dir: Path) -> str:
+    journal_dir.mkdir(parents=True, exist_ok=True)
+    (journal_dir / "main.journal").write_text(
+        "include 2024.journal\n", encoding="utf-8"
+    )
+    (journal_dir / "2024.journal").write_text(
+        "2024-01-05 Rent\n    expenses:rent    800 EUR\n    assets:bank\n",
+        encoding="utf-8",
+    )
+    return str(journal_dir / "main.journal")
+
+
+def create_args(*, cache_dir: str, no_cache: bool = False) -> Namespace:
+    return Namespace(
+        no_cache=no_cache,
+        cache_dir=cache_dir,
+        cache_max_age_days=1.0,
+        cache_max_size_mb=1.0,
+        hledger_output_format="json",
+        verbose=False,
+    )
+
+
+def test_changed_included_file_changes_cache_key(tmp_path: Path) -> None:
+    journal_filepath: str = write_journal(journal_dir=tmp_path)
+    command: List[str] = ["hledger", "-f", journal_filepath, "balance"]
+    cache_key: str = get_cache_key(
+        command=command, journal_filepath=journal_filepath
+    )
+    assert (
+        get_cache_key(command=command, journal_filepath=journal_filepath)
+        == cache_key
+    )
+
+    with open(tmp_path / "2024.journal", "a", encoding="utf-8") as journal:
+        journal.write("\n2024-01-06 Gift\n    expenses:gifts  20 EUR\n")
+
+    assert (
+        get_cache_key(command=command, journal_filepath=journal_filepath)
+        != cache_key
+    )
+    assert (
+        get_cache_key(
+            command=[*command, "--no-total"], journal_filepath=journal_filepath
+        )
+        != cache_key
+    )
+
+
+def test_entries_older_than_the_max_age_are_evicted(tmp_path: Path) -> None:
+    for cache_key in ["old", "new"]:
+        store_cached_output(
+            cache_dir=str(tmp_path),
+            cache_key=cache_key,
+            output_format="json",
+            output=cache_key,
+            max_size_bytes=1024,
+            max_age_seconds=3600,
+        )
+    old_filepath: str = get_cache_filepath(
+        cache_dir=str(tmp_path), cache_key="old", output_format="json"
+    )
+    two_hours_ago: float = time.time() - 2 * 3600
+    os.utime(old_filepath, (two_hours_ago, two_hours_ago))
+
+    assert (
+        load_cached_output(
+            cache_dir=str(tmp_path),
+            cache_key="old",
+            output_format="json",
+            max_age_seconds=3600,
+        )
+        is None
+    )
+    assert not os.path.exists(old_filepath)
+    assert (
+        load_cached_output(
+            cache_dir=str(tmp_path),
+            cache_key="new",
+            output_format="json",
+            max_age_seconds=3600,
+        )
+        == "new"
+    )
+
+
+def test_least_recently_used_entries_are_evicted_first(tmp_path: Path) -> None:
+    now: float = time.time()
+    for age, cache_key in enumerate(["c", "b", "a"], start=1):
+        store_cached_output(
+            cache_dir=str(tmp_path),
+            cache_key=cache_key,
+            output_format="json",
+            output=10 * cache_key,
+            max_size_bytes=1024,
+            max_age_seconds=3600,
+        )
+        os.utime(
+            get_cache_filepath(
+                cache_dir=str(tmp_path),
+                cache_key=cache_key,
+                output_format="json",
+            ),
+            (now - age, now - age),
+        )
+    # Reading the oldest entry makes it the most recently used one.
+    load_cached_output(
+        cache_dir=str(tmp_path),
+        cache_key="a",
+        output_format="json",
+        max_age_seconds=3600,
+    )
+
+    evict_cache_entries(
+        cache_dir=str(tmp_path), max_size_bytes=20, max_age_seconds=3600
+    )
+
+    assert sorted(os.listdir(tmp_path)) == ["a.json", "c.json"]
+
+
+def test_no_cache_bypasses_the_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    journal_filepath: str = write_journal(journal_dir=tmp_path / "journal")
+    cache_dir: Path = tmp_path / "cache"
+    command: List[str] = ["hledger", "-f", journal_filepath, "balance"]
+    hledger_outputs: List[str] = ["first", "second", "third"]
+    monkeypatch.setattr(
+        parse_journal,
+        "run_hledger_command",
+        lambda *, command: hledger_outputs.pop(0),
+    )
+
+    assert (
+        get_hledger_output(
+            args=create_args(cache_dir=str(cache_dir)),
+            command=command,
+            journal_filepath=journal_filepath,
+        )
+        == "first"
+    )
+    assert (
+        get_hledger_output(
+            args=create_args(cache_dir=str(cache_dir), no_cache=True),
+            command=command,
+            journal_filepath=journal_filepath,
+        )
+        == "second"
+    )
+    assert (
+        get_hledger_output(
+            args=create_args(cache_dir=str(cache_dir)),
+            command=command,
+            journal_filepath=journal_filepath,
+        )
+        == "first"
+    )
+
+
+def test_unusable_cache_dir_falls_back_to_hledger(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    journal_filepath: str = write_journal(journal_dir=tmp_path)
+    # A regular file where the cache directory should be.
+    cache_file: Path = tmp_path / "cache"
+    cache_file.write_text("", encoding="utf-8")
+    monkeypatch.setattr(
+        parse_journal, "run_hledger_command", lambda *, command: "output"
+    )
+
+    assert (
+        get_hledger_output(
+            args=create_args(cache_dir=str(cache_file / "hledger_plot")),
+            command=["hledger", "-f", journal_filepath, "balance"],
+            journal_filepath=journal_filepath,
+        )
+        == "output"
+    )
@@ -0,0 +1,92 @@
+"""Tests whether a batch finds its journal files, and whether a journal that
+fails, or crashes its worker process, does not fail the other journals."""
+
+import multiprocessing
+import os
+from argparse import Namespace
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from hledger_plot import batch
+from hledger_plot.batch import (
+    get_batch_journal_filepaths,
+    print_batch_summary,
+    process_journal_batch,
+)
+from hledger_plot.HledgerCategories import HledgerCategories
+
+
+def test_glob_and_manifest_journals_without_duplicates(tmp_path: Path) -> None:
+    for name in ["a.journal", "b.journal", "notes.txt"]:
+        (tmp_path / name).write_text("", encoding="utf-8")
+    manifest_filepath: Path = tmp_path / "manifest.txt"
+    manifest_filepath.write_text(
+        "# households\nb.journal\n\nc.journal\n", encoding="utf-8"
+    )
+
+    assert get_batch_journal_filepaths(
+        journal_glob=str(tmp_path / "*.journal"),
+        journal_manifest=str(manifest_filepath),
+    ) == [
+        str(tmp_path / "a.journal"),
+        str(tmp_path / "b.journal"),
+        str(tmp_path / "c.journal"),
+    ]
+
+
+def test_empty_batch_raises_error(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Found no journal files"):
+        get_batch_journal_filepaths(
+            journal_glob=str(tmp_path / "*.jornal"), journal_manifest=None
+        )
+
+
+def fake_process_journal(*, journal_filepath: str, **kwargs: Any) -> None:
+    if journal_filepath == "crash.journal":
+        # Like a segfault in a native library, which kills the worker.
+        os._exit(1)
+    if journal_filepath == "fail.journal":
+        raise ValueError("Invalid journal.")
+
+
+@pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork",
+    reason="The workers only inherit the fake process_journal when forked.",
+)
+def test_crashed_worker_only_fails_its_own_journal(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setattr(batch, "process_journal", fake_process_journal)
+    journal_filepaths: List[str] = [
+        "a.journal",
+        "crash.journal",
+        "b.journal",
+        "fail.journal",
+        "c.journal",
+    ]
+
+    journal_errors: Dict[str, Optional[str]] = process_journal_batch(
+        args=Namespace(
+            batch_workers=2,
+            export_sankey=False,
+            export_treemap=False,
+            verbose=False,
+        ),
+        journal_filepaths=journal_filepaths,
+        hledgerCategories=HledgerCategories(),
+        pseudonymizer=None,
+        separator="BALANCE-LINE",
+    )
+
+    assert list(journal_errors) == journal_filepaths
+    assert journal_errors["a.journal"] is None
+    assert journal_errors["b.journal"] is None
+    assert journal_errors["c.journal"] is None
+    assert journal_errors["fail.journal"] == "ValueError: Invalid journal."
+    assert (journal_errors["crash.journal"] or "").startswith(
+        "BrokenProcessPool:"
+    )
+    print_batch_summary(journal_errors=journal_errors)
+    assert "3 succeeded, 2 failed." in capsys.readouterr().out
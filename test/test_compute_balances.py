@@ -0,0 +1,184 @@
+"""Tests whether compute_balance_report computes the same inclusive balances
+as hledger balance --tree --no-elide --cost would."""
+
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+from pandas.core.frame import DataFrame
+
+from hledger_plot.journal_parsing.compute_balances import (
+    compute_balance_report,
+)
+from hledger_plot.journal_parsing.posting_table import (
+    get_posting_table_from_journal,
+)
+
+top_level_account_categories: List[str] = [
+    "assets",
+    "equity",
+    "expenses",
+    "income",
+]
+
+
+def get_balances(
+    *,
+    tmp_path: Path,
+    journal: str,
+    exclude_opening_balances: bool = False,
+) -> Dict[str, float]:
+    journal_filepath: Path = tmp_path / "main.journal"
+    journal_filepath.write_text(journal, encoding="utf-8")
+    balances_df: DataFrame = compute_balance_report(
+        postings=get_posting_table_from_journal(
+            journal_filepath=str(journal_filepath)
+        ),
+        disp_currency="EUR",
+        account_categories=" ".join(top_level_account_categories),
+        top_level_account_categories=top_level_account_categories,
+        exclude_opening_balances=exclude_opening_balances,
+    )
+    return dict(zip(balances_df[0], balances_df[1]))
+
+
+def test_postings_are_valued_at_their_unit_and_total_cost(
+    tmp_path: Path,
+) -> None:
+    balances: Dict[str, float] = get_balances(
+        tmp_path=tmp_path,
+        journal="""2024-01-15 Buy stocks
+    assets:broker    10 ACME @ 12.5 EUR
+    assets:bank     -125 EUR
+
+2024-02-01 Sell stocks
+    assets:broker    -4 ACME @@ 60 EUR
+    assets:bank       60 EUR
+""",
+    )
+
+    assert balances == {
+        "assets": 0.0,
+        "assets:bank": -65.0,
+        "assets:broker": 65.0,
+    }
+
+
+def test_elided_amount_balances_its_transaction(tmp_path: Path) -> None:
+    balances: Dict[str, float] = get_balances(
+        tmp_path=tmp_path,
+        journal="""2024-01-10 Salary
+    assets:bank      2500,00 EUR
+    income:salary
+
+2024-02-01 Groceries
+    expenses:food     45.20 EUR
+    expenses:fees      0.80 EUR
+    assets:bank
+""",
+    )
+
+    assert balances == {
+        "assets": 2454.0,
+        "assets:bank": 2454.0,
+        "expenses": 46.0,
+        "expenses:fees": 0.8,
+        "expenses:food": 45.2,
+        "income": -2500.0,
+        "income:salary": -2500.0,
+    }
+
+
+def test_opening_balances_can_be_excluded(tmp_path: Path) -> None:
+    journal: str = """2024-01-01 Opening balances
+    assets:bank      1000 EUR
+    equity:opening
+
+2024-01-05 Rent
+    expenses:rent     800 EUR
+    assets:bank
+"""
+
+    assert get_balances(tmp_path=tmp_path, journal=journal) == {
+        "assets": 200.0,
+        "assets:bank": 200.0,
+        "equity": -1000.0,
+        "equity:opening": -1000.0,
+        "expenses": 800.0,
+        "expenses:rent": 800.0,
+    }
+    assert get_balances(
+        tmp_path=tmp_path, journal=journal, exclude_opening_balances=True
+    ) == {
+        "assets": -800.0,
+        "assets:bank": -800.0,
+        "expenses": 800.0,
+        "expenses:rent": 800.0,
+    }
+
+
+def test_balances_roll_up_the_account_tree(tmp_path: Path) -> None:
+    balances: Dict[str, float] = get_balances(
+        tmp_path=tmp_path,
+        journal="""2024-02-01 Groceries
+    expenses:food:groceries     40 EUR
+    expenses:food:restaurant    20 EUR
+    expenses:gifts              10 EUR
+    assets:bank:checking       -70 EUR
+
+2024-02-02 Transfer
+    assets:bank:savings        100 EUR
+    assets:bank:checking      -100 EUR
+
+2024-02-03 Refund
+    assets:cash                  5 EUR
+    assets:wallet               -5 EUR
+""",
+    )
+
+    # The parent of accounts that cancel out is shown with a zero balance,
+    # while accounts without any balance in their subtree are left out.
+    assert balances == {
+        "assets": -70.0,
+        "assets:bank": -70.0,
+        "assets:bank:checking": -170.0,
+        "assets:bank:savings": 100.0,
+        "assets:cash": 5.0,
+        "assets:wallet": -5.0,
+        "expenses": 70.0,
+        "expenses:food": 60.0,
+        "expenses:food:groceries": 40.0,
+        "expenses:food:restaurant": 20.0,
+        "expenses:gifts": 10.0,
+    }
+
+
+def test_accounts_whose_subtree_has_no_balance_are_dropped(
+    tmp_path: Path,
+) -> None:
+    balances: Dict[str, float] = get_balances(
+        tmp_path=tmp_path,
+        journal="""2024-02-01 Deposit
+    assets:bank:savings        100 EUR
+    income:interest
+
+2024-02-02 Withdraw
+    assets:bank:savings       -100 EUR
+    income:interest
+""",
+    )
+
+    assert balances == {}
+
+
+def test_amount_without_price_in_other_commodity_raises_error(
+    tmp_path: Path,
+) -> None:
+    with pytest.raises(ValueError, match="'USD'"):
+        get_balances(
+            tmp_path=tmp_path,
+            journal="""2023-03-01 Rent
+    expenses:rent    800 USD
+    assets:bank
+""",
+        )
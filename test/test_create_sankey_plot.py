@@ -0,0 +1,165 @@
+"""Tests whether prune_sankey_flows collapses the small Sankey flows into
+<parent>:other accounts without changing the totals of the parents."""
+
+from typing import Dict, List, Tuple
+
+import pandas as pd
+from pandas.core.frame import DataFrame
+
+from hledger_plot.create_plots.create_sankey_plot import prune_sankey_flows
+
+separator: str = "BALANCE-LINE"
+
+
+def create_sankey_df(*, flows: List[Tuple[str, str, float]]) -> DataFrame:
+    return DataFrame(flows, columns=["source", "target", "value"])
+
+
+def get_flows(*, sankey_df: DataFrame) -> Dict[Tuple[str, str], float]:
+    return {
+        (source, target): value
+        for source, target, value in sankey_df.itertuples(index=False)
+    }
+
+
+def get_node_totals(*, sankey_df: DataFrame) -> Dict[str, Tuple[float, float]]:
+    """Returns the total incoming and outgoing value of every node."""
+    incoming: pd.Series = sankey_df.groupby("target")["value"].sum()
+    outgoing: pd.Series = sankey_df.groupby("source")["value"].sum()
+    return {
+        node: (float(incoming.get(node, 0.0)), float(outgoing.get(node, 0.0)))
+        for node in incoming.index.union(outgoing.index)
+    }
+
+
+# Expenses flow from the separator down to their subaccounts, income flows
+# from its subaccounts up to the separator.
+sankey_df: DataFrame = create_sankey_df(
+    flows=[
+        (separator, "expenses", 1000.0),
+        ("expenses", "expenses:rent", 800.0),
+        ("expenses", "expenses:food", 150.0),
+        ("expenses:food", "expenses:food:groceries", 100.0),
+        ("expenses:food", "expenses:food:restaurant", 50.0),
+        ("expenses", "expenses:gifts", 30.0),
+        ("expenses", "expenses:fees", 20.0),
+        ("income", separator, 1000.0),
+        ("income:salary", "income", 990.0),
+        ("income:interest", "income", 10.0),
+    ]
+)
+
+
+def test_without_thresholds_nothing_changes() -> None:
+    pruned_df: DataFrame = prune_sankey_flows(
+        sankey_df=sankey_df, separator=separator
+    )
+    pd.testing.assert_frame_equal(pruned_df, sankey_df)
+
+
+def test_collapsed_flows_keep_the_totals_of_their_parents() -> None:
+    pruned_df: DataFrame = prune_sankey_flows(
+        sankey_df=sankey_df, separator=separator, min_percentage=10
+    )
+
+    # Collapsing the single small income flow would only rename it.
+    assert get_flows(sankey_df=pruned_df) == {
+        (separator, "expenses"): 1000.0,
+        ("expenses", "expenses:rent"): 800.0,
+        ("expenses", "expenses:food"): 150.0,
+        ("expenses:food", "expenses:food:groceries"): 100.0,
+        ("expenses:food", "expenses:food:restaurant"): 50.0,
+        ("expenses", "expenses:other"): 50.0,
+        ("income", separator): 1000.0,
+        ("income:salary", "income"): 990.0,
+        ("income:interest", "income"): 10.0,
+    }
+    totals: Dict[str, Tuple[float, float]] = get_node_totals(
+        sankey_df=pruned_df
+    )
+    original_totals: Dict[str, Tuple[float, float]] = get_node_totals(
+        sankey_df=sankey_df
+    )
+    for account in ["expenses", "expenses:food", "income", separator]:
+        assert totals[account] == original_totals[account]
+
+
+def test_collapsed_accounts_lose_their_subtree() -> None:
+    pruned_df: DataFrame = prune_sankey_flows(
+        sankey_df=sankey_df, separator=separator, top_n=1
+    )
+
+    assert get_flows(sankey_df=pruned_df) == {
+        (separator, "expenses"): 1000.0,
+        ("expenses", "expenses:rent"): 800.0,
+        ("expenses", "expenses:other"): 200.0,
+        ("income", separator): 1000.0,
+        ("income:salary", "income"): 990.0,
+        ("income:interest", "income"): 10.0,
+    }
+
+
+def test_parent_with_collapsed_flows_in_both_directions() -> None:
+    # The cash and loan accounts have a negative balance, so they flow into
+    # their parent.
+    both_directions_df: DataFrame = create_sankey_df(
+        flows=[
+            (separator, "assets", 1000.0),
+            ("assets", "assets:bank", 1000.0),
+            ("assets", "assets:broker", 15.0),
+            ("assets", "assets:crypto", 5.0),
+            ("assets:cash", "assets", 10.0),
+            ("assets:loan", "assets", 10.0),
+        ]
+    )
+
+    pruned_df: DataFrame = prune_sankey_flows(
+        sankey_df=both_directions_df, separator=separator, min_value=20
+    )
+
+    assert get_flows(sankey_df=pruned_df) == {
+        (separator, "assets"): 1000.0,
+        ("assets", "assets:bank"): 1000.0,
+        ("assets", "assets:other"): 20.0,
+        ("assets:other-in", "assets"): 20.0,
+    }
+
+
+def test_separator_flows_are_never_collapsed() -> None:
+    separator_df: DataFrame = create_sankey_df(
+        flows=[
+            (separator, "expenses", 1000.0),
+            (separator, "assets", 1.0),
+            (separator, "equity", 1.0),
+            ("income", separator, 1002.0),
+        ]
+    )
+
+    pruned_df: DataFrame = prune_sankey_flows(
+        sankey_df=separator_df, separator=separator, min_value=100, top_n=1
+    )
+
+    pd.testing.assert_frame_equal(pruned_df, separator_df)
+
+
+def test_other_account_does_not_merge_with_a_real_account() -> None:
+    real_other_df: DataFrame = create_sankey_df(
+        flows=[
+            (separator, "expenses", 1000.0),
+            ("expenses", "expenses:rent", 900.0),
+            ("expenses", "expenses:other", 60.0),
+            ("expenses", "expenses:gifts", 30.0),
+            ("expenses", "expenses:fees", 10.0),
+        ]
+    )
+
+    pruned_df: DataFrame = prune_sankey_flows(
+        sankey_df=real_other_df, separator=separator, min_value=50
+    )
+
+    assert get_flows(sankey_df=pruned_df) == {
+        (separator, "expenses"): 1000.0,
+        ("expenses", "expenses:rent"): 900.0,
+        ("expenses", "expenses:other"): 60.0,
+        ("expenses", "expenses:other-2"): 40.0,
+    }
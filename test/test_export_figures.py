@@ -0,0 +1,148 @@
+"""Tests whether export_figures names the images per format, uses at most one
+render process per image, and stops the renderers it started.
+
+Kaleido is replaced by a fake module, and pio.write_image by a stub, that log
+the process in which they run. The workers inherit them by forking."""
+
+import multiprocessing
+import os
+import sys
+import types
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import plotly.graph_objects as go
+import pytest
+from plotly.graph_objs._figure import Figure
+
+from hledger_plot.create_plots import export_figures as export_module
+from hledger_plot.create_plots.export_figures import (
+    ExportSession,
+    export_figures,
+)
+
+requires_fork = pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork",
+    reason="The workers only inherit the stubs when they are forked.",
+)
+
+
+@pytest.fixture
+def render_log(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Returns the log of the fake renderer and stub image writer, in which
+    every line is an event and the process id."""
+    log_filepath: Path = tmp_path / "render.log"
+
+    def log_event(event: str) -> None:
+        with open(log_filepath, "a", encoding="utf-8") as log_file:
+            log_file.write(f"{event} {os.getpid()}\n")
+
+    fake_kaleido = types.ModuleType("kaleido")
+    setattr(
+        fake_kaleido,
+        "start_sync_server",
+        lambda **kwargs: log_event("start"),
+    )
+    setattr(
+        fake_kaleido,
+        "stop_sync_server",
+        lambda **kwargs: log_event("stop"),
+    )
+
+    def write_image(
+        figure_dict: Dict[str, object], filepath: str, format: str
+    ) -> None:
+        log_event("write")
+        Path(filepath).write_text(format, encoding="utf-8")
+
+    monkeypatch.setitem(sys.modules, "kaleido", fake_kaleido)
+    monkeypatch.setattr(export_module.pio, "write_image", write_image)
+    monkeypatch.setattr(export_module, "renderer_is_started", False)
+    return log_filepath
+
+
+def get_pids(*, render_log: Path, event: str) -> List[int]:
+    return [
+        int(line.split()[1])
+        for line in render_log.read_text(encoding="utf-8").splitlines()
+        if line.split()[0] == event
+    ]
+
+
+def create_figures(*, tmp_path: Path, nr_of_figures: int) -> Dict[str, Figure]:
+    return {
+        str(tmp_path / f"figure{index}"): go.Figure(
+            go.Bar(x=["a", "b"], y=[index, 1])
+        )
+        for index in range(nr_of_figures)
+    }
+
+
+def test_images_are_named_per_format(tmp_path: Path, render_log: Path) -> None:
+    filepaths: List[str] = export_figures(
+        figures=create_figures(tmp_path=tmp_path, nr_of_figures=2),
+        image_formats=["png", "svg"],
+        max_workers=1,
+    )
+
+    assert filepaths == [
+        str(tmp_path / "figure0.png"),
+        str(tmp_path / "figure0.svg"),
+        str(tmp_path / "figure1.png"),
+        str(tmp_path / "figure1.svg"),
+    ]
+    for filepath in filepaths:
+        assert Path(filepath).read_text() == filepath.rsplit(".", 1)[1]
+    # A single worker renders in this process, and stops its renderer.
+    assert get_pids(render_log=render_log, event="write") == [os.getpid()] * 4
+    assert get_pids(render_log=render_log, event="start") == [os.getpid()]
+    assert get_pids(render_log=render_log, event="stop") == [os.getpid()]
+    assert not export_module.renderer_is_started
+
+
+@requires_fork
+@pytest.mark.parametrize(
+    "max_workers,nr_of_figures", [(2, 6), (8, 3), (None, 12)]
+)
+def test_at_most_one_worker_per_image(
+    tmp_path: Path,
+    render_log: Path,
+    max_workers: Optional[int],
+    nr_of_figures: int,
+) -> None:
+    filepaths: List[str] = export_figures(
+        figures=create_figures(tmp_path=tmp_path, nr_of_figures=nr_of_figures),
+        image_formats=["png"],
+        max_workers=max_workers,
+    )
+
+    assert len(filepaths) == nr_of_figures
+    assert all(os.path.isfile(filepath) for filepath in filepaths)
+    write_pids: List[int] = get_pids(render_log=render_log, event="write")
+    assert len(write_pids) == nr_of_figures
+    assert len(set(write_pids)) <= min(
+        max_workers or os.cpu_count() or 1, nr_of_figures
+    )
+    # Every process that started a renderer stopped it when it exited.
+    start_pids: List[int] = get_pids(render_log=render_log, event="start")
+    assert set(write_pids) <= set(start_pids)
+    assert sorted(get_pids(render_log=render_log, event="stop")) == sorted(
+        start_pids
+    )
+
+
+def test_session_keeps_a_renderer_it_did_not_start(
+    tmp_path: Path, render_log: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Like a batch worker, which starts its renderer for all its journals.
+    monkeypatch.setattr(export_module, "renderer_is_started", True)
+
+    with ExportSession(max_workers=1) as export_session:
+        export_session.export(
+            figures=create_figures(tmp_path=tmp_path, nr_of_figures=1),
+            image_formats=["png"],
+        )
+
+    assert get_pids(render_log=render_log, event="start") == []
+    assert get_pids(render_log=render_log, event="stop") == []
+    assert export_module.renderer_is_started
@@ -0,0 +1,36 @@
+"""Tests whether starting the CLI imports no heavy dependencies, such that
+hledger-plot --help returns quickly."""
+
+import subprocess  # nosec
+import sys
+from typing import Set
+
+heavy_packages: Set[str] = {"pandas", "numpy", "plotly"}
+
+
+def test_main_does_not_import_heavy_packages() -> None:
+    result = subprocess.run(  # nosec
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "import hledger_plot.__main__",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # -X importtime writes one line per imported module to stderr, like:
+    # import time:       115 |      39024 |     hledger_plot.__main__
+    imported_modules: Set[str] = {
+        line.rsplit("|", 1)[1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    }
+    assert "hledger_plot.__main__" in imported_modules
+    imported_packages: Set[str] = {
+        module.split(".")[0] for module in imported_modules
+    }
+    assert not imported_packages & heavy_packages
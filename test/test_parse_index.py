@@ -0,0 +1,205 @@
+"""Tests whether the parse index resumes append-only journal files at the
+end of the previous parse, and parses a file again if an earlier byte
+changed."""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+import pytest
+from pandas.core.frame import DataFrame
+
+from hledger_plot.journal_parsing.posting_table import (
+    PostingTableBuilder,
+    TransactionState,
+    get_posting_table_from_journal,
+)
+
+journal_files: Dict[str, str] = {
+    "main.journal": """2024-01-05 Opening balances
+    assets:bank:checking      1000.00 EUR
+    equity:opening
+
+include 2024/all.journal
+    expenses:fees    1 EUR
+
+2024-01-15 Stocks
+    assets:broker:stocks   10 ACME @ 12.5 EUR
+    assets:bank:checking  -125 EUR
+""",
+    "2024/all.journal": """include cash.journal
+2024-01-10 Salary
+    assets:bank:checking      2500,00 EUR
+    income:salary
+""",
+    "2024/cash.journal": """2024-02-01 Groceries
+    expenses:food:groceries     45.20 EUR
+    assets:cash
+""",
+}
+
+appended_transaction: str = """
+2024-03-01 Rent
+    expenses:rent    800 EUR
+    assets:bank:checking
+"""
+
+
+def write_journal(*, journal_dir: Path) -> str:
+    for filename, content in journal_files.items():
+        filepath: Path = journal_dir / filename
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        filepath.write_text(content, encoding="utf-8")
+    return str(journal_dir / "main.journal")
+
+
+def append_text(*, filepath: Path, text: str) -> None:
+    with open(filepath, "a", encoding="utf-8") as journal_file:
+        journal_file.write(text)
+
+
+def parse_counting_lines(
+    *,
+    monkeypatch: pytest.MonkeyPatch,
+    journal_filepath: str,
+    parse_index_dir: str,
+) -> Tuple[DataFrame, List[str]]:
+    """Returns the posting table of the journal, parsed with the parse index,
+    and the lines that were parsed."""
+    parsed_lines: List[str] = []
+    add_journal_line = PostingTableBuilder.add_journal_line
+
+    def counting_add_journal_line(
+        self: PostingTableBuilder, *, line: str, **kwargs: Any
+    ) -> Tuple[bool, Optional[TransactionState]]:
+        parsed_lines.append(line)
+        state: Tuple[bool, Optional[TransactionState]] = add_journal_line(
+            self, line=line, **kwargs
+        )
+        return state
+
+    with monkeypatch.context() as patch:
+        patch.setattr(
+            PostingTableBuilder, "add_journal_line", counting_add_journal_line
+        )
+        posting_table: DataFrame = get_posting_table_from_journal(
+            journal_filepath=journal_filepath, parse_index_dir=parse_index_dir
+        )
+    return posting_table, parsed_lines
+
+
+def test_only_the_appended_tail_is_parsed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    journal_filepath: Path = tmp_path / "2024.journal"
+    journal_filepath.write_text(journal_files["2024/cash.journal"])
+    parse_index_dir: str = str(tmp_path / "index")
+    _, parsed_lines = parse_counting_lines(
+        monkeypatch=monkeypatch,
+        journal_filepath=str(journal_filepath),
+        parse_index_dir=parse_index_dir,
+    )
+    assert len(parsed_lines) == 3
+
+    append_text(filepath=journal_filepath, text=appended_transaction)
+    posting_table, parsed_lines = parse_counting_lines(
+        monkeypatch=monkeypatch,
+        journal_filepath=str(journal_filepath),
+        parse_index_dir=parse_index_dir,
+    )
+
+    assert parsed_lines == appended_transaction.splitlines(keepends=True)
+    pd.testing.assert_frame_equal(
+        posting_table,
+        get_posting_table_from_journal(journal_filepath=str(journal_filepath)),
+    )
+
+
+def test_changed_earlier_byte_parses_the_file_again(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    journal_filepath: Path = tmp_path / "2024.journal"
+    journal_filepath.write_text(journal_files["2024/cash.journal"])
+    parse_index_dir: str = str(tmp_path / "index")
+    parse_counting_lines(
+        monkeypatch=monkeypatch,
+        journal_filepath=str(journal_filepath),
+        parse_index_dir=parse_index_dir,
+    )
+
+    # Change an amount without changing the size of the file.
+    journal_filepath.write_text(
+        journal_files["2024/cash.journal"].replace("45.20", "54.20")
+        + appended_transaction
+    )
+    posting_table, parsed_lines = parse_counting_lines(
+        monkeypatch=monkeypatch,
+        journal_filepath=str(journal_filepath),
+        parse_index_dir=parse_index_dir,
+    )
+
+    assert len(parsed_lines) == 3 + len(appended_transaction.splitlines())
+    assert posting_table["quantity"].iloc[0] == 54.2
+    pd.testing.assert_frame_equal(
+        posting_table,
+        get_posting_table_from_journal(journal_filepath=str(journal_filepath)),
+    )
+
+
+def test_unterminated_last_line_is_parsed_again(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    journal_filepath: Path = tmp_path / "2024.journal"
+    journal_filepath.write_text("2024-02-01 Groceries\n    expenses:food  4")
+    parse_index_dir: str = str(tmp_path / "index")
+    parse_counting_lines(
+        monkeypatch=monkeypatch,
+        journal_filepath=str(journal_filepath),
+        parse_index_dir=parse_index_dir,
+    )
+
+    append_text(filepath=journal_filepath, text="5 EUR\n    assets:cash\n")
+    posting_table, parsed_lines = parse_counting_lines(
+        monkeypatch=monkeypatch,
+        journal_filepath=str(journal_filepath),
+        parse_index_dir=parse_index_dir,
+    )
+
+    assert parsed_lines == ["    expenses:food  45 EUR\n", "    assets:cash\n"]
+    assert posting_table["quantity"].iloc[0] == 45.0
+    pd.testing.assert_frame_equal(
+        posting_table,
+        get_posting_table_from_journal(journal_filepath=str(journal_filepath)),
+    )
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_append_to_included_file_equals_full_parse(
+    tmp_path: Path, max_workers: int
+) -> None:
+    journal_filepath: str = write_journal(journal_dir=tmp_path / "journal")
+    parse_index_dir: str = str(tmp_path / "index")
+    get_posting_table_from_journal(
+        journal_filepath=journal_filepath,
+        max_workers=max_workers,
+        parse_index_dir=parse_index_dir,
+    )
+
+    # The posting after the include of all.journal belongs to the appended
+    # transaction, once it is the last transaction of all.journal.
+    append_text(
+        filepath=tmp_path / "journal" / "2024" / "all.journal",
+        text=appended_transaction,
+    )
+    posting_table: DataFrame = get_posting_table_from_journal(
+        journal_filepath=journal_filepath,
+        max_workers=max_workers,
+        parse_index_dir=parse_index_dir,
+    )
+
+    pd.testing.assert_frame_equal(
+        posting_table,
+        get_posting_table_from_journal(journal_filepath=journal_filepath),
+    )
+    fee = posting_table[posting_table["account"] == "expenses:fees"].iloc[0]
+    assert fee["description"] == "Rent"
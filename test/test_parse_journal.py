@@ -0,0 +1,221 @@
+"""Tests whether parse_balance_json reads the balances of a hledger balance
+report in JSON format exactly, and whether read_balance_reports runs its
+hledger queries concurrently."""
+
+import json
+import os
+import stat
+import sys
+from argparse import Namespace
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from pandas.core.frame import DataFrame
+
+from hledger_plot.parse_journal import parse_balance_json, read_balance_reports
+
+# Reports the account query as its only account. It marks itself as running
+# in a directory while it sleeps, and logs how many hledger calls run, itself
+# included.
+fake_hledger: str = """#!{python}
+import json
+import os
+import sys
+import time
+
+account = sys.argv[sys.argv.index("balance") + 1]
+running_dir = os.environ["FAKE_HLEDGER_RUNNING_DIR"]
+marker = os.path.join(running_dir, str(os.getpid()))
+open(marker, "w").close()
+with open(os.environ["FAKE_HLEDGER_LOG"], "a") as log:
+    log.write(f"{{len(os.listdir(running_dir))}}\\n")
+time.sleep(json.loads(os.environ["FAKE_HLEDGER_SLEEP"])[account])
+os.remove(marker)
+amount = {{
+    "acommodity": "EUR",
+    "aquantity": {{"decimalMantissa": len(account), "decimalPlaces": 0}},
+}}
+print(json.dumps([[[account, account, 0, [amount]]], []]))
+"""
+
+
+def create_amount(
+    *, commodity: str, mantissa: int, places: int
+) -> Dict[str, Any]:
+    return {
+        "acommodity": commodity,
+        "aquantity": {
+            "decimalMantissa": mantissa,
+            "decimalPlaces": places,
+            "floatingPoint": mantissa / 10**places,
+        },
+    }
+
+
+def create_balance_output(*, report_items: List[List[Any]]) -> str:
+    """Returns the hledger balance -O json output of the report items, i.e.
+    the items and the (here empty) total."""
+    return json.dumps([report_items, []])
+
+
+def test_balances_are_read_from_mantissa_and_places() -> None:
+    process_output: str = create_balance_output(
+        report_items=[
+            [
+                "assets",
+                "assets",
+                0,
+                [create_amount(commodity="EUR", mantissa=123456, places=2)],
+            ],
+            ["assets:cash", "cash", 1, []],
+            [
+                "equity",
+                "equity",
+                0,
+                [create_amount(commodity="EUR", mantissa=-5, places=0)],
+            ],
+        ]
+    )
+
+    df: DataFrame = parse_balance_json(
+        process_output=process_output,
+        disp_currency="EUR",
+        top_level_account_categories=["assets"],
+    )
+
+    assert df[0].tolist() == ["assets", "assets:cash"]
+    assert df[1].tolist() == [1234.56, 0.0]
+    assert df["mantissa"].tolist() == [123456, 0]
+    assert df["places"].tolist() == [2, 0]
+
+
+def test_mantissa_larger_than_int64_stays_exact() -> None:
+    mantissa: int = 10**40 + 1
+    process_output: str = create_balance_output(
+        report_items=[
+            [
+                "assets",
+                "assets",
+                0,
+                [create_amount(commodity="EUR", mantissa=mantissa, places=40)],
+            ],
+            [
+                "liabilities",
+                "liabilities",
+                0,
+                [create_amount(commodity="EUR", mantissa=-mantissa, places=2)],
+            ],
+        ]
+    )
+
+    df: DataFrame = parse_balance_json(
+        process_output=process_output,
+        disp_currency="EUR",
+        top_level_account_categories=["assets", "liabilities"],
+    )
+
+    assert df["mantissa"].tolist() == [mantissa, -mantissa]
+    assert df[1].tolist() == [1.0, -1e38]
+
+
+def test_unconverted_commodity_raises_error() -> None:
+    process_output: str = create_balance_output(
+        report_items=[
+            [
+                "assets",
+                "assets",
+                0,
+                [create_amount(commodity="ACME", mantissa=10, places=0)],
+            ],
+        ]
+    )
+
+    with pytest.raises(ValueError, match="ACME"):
+        parse_balance_json(
+            process_output=process_output,
+            disp_currency="EUR",
+            top_level_account_categories=["assets"],
+        )
+
+
+def test_amount_without_commodity_is_in_display_currency() -> None:
+    process_output: str = create_balance_output(
+        report_items=[
+            [
+                "assets",
+                "assets",
+                0,
+                [
+                    create_amount(commodity="", mantissa=250, places=1),
+                    create_amount(commodity="EUR", mantissa=0, places=0),
+                ],
+            ],
+        ]
+    )
+
+    df: DataFrame = parse_balance_json(
+        process_output=process_output,
+        disp_currency="EUR",
+        top_level_account_categories=["assets"],
+    )
+
+    assert df[1].tolist() == [25.0]
+
+
+def test_hledger_queries_run_concurrently_in_query_order(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    hledger_filepath: Path = tmp_path / "bin" / "hledger"
+    hledger_filepath.parent.mkdir()
+    hledger_filepath.write_text(
+        fake_hledger.format(python=sys.executable), encoding="utf-8"
+    )
+    hledger_filepath.chmod(hledger_filepath.stat().st_mode | stat.S_IEXEC)
+    running_dir: Path = tmp_path / "running"
+    running_dir.mkdir()
+    log_filepath: Path = tmp_path / "calls.log"
+    # The first queries take longest, such that they finish last.
+    account_queries: List[str] = ["assets", "expenses", "income", "equity"]
+    monkeypatch.setenv(
+        "PATH", f"{hledger_filepath.parent}{os.pathsep}{os.environ['PATH']}"
+    )
+    monkeypatch.setenv("FAKE_HLEDGER_RUNNING_DIR", str(running_dir))
+    monkeypatch.setenv("FAKE_HLEDGER_LOG", str(log_filepath))
+    monkeypatch.setenv(
+        "FAKE_HLEDGER_SLEEP",
+        json.dumps(
+            {
+                account: 0.1 * (len(account_queries) - index)
+                for index, account in enumerate(account_queries)
+            }
+        ),
+    )
+    args: Namespace = Namespace(
+        balance_backend="hledger",
+        display_currency="EUR",
+        exclude_opening_balances=False,
+        hledger_output_format="json",
+        no_cache=True,
+        verbose=False,
+    )
+
+    balances_dfs: List[DataFrame] = read_balance_reports(
+        args=args,
+        filename=str(tmp_path / "main.journal"),
+        account_categories_list=account_queries,
+        top_level_account_categories=account_queries,
+        max_workers=2,
+    )
+
+    assert [df[0].tolist() for df in balances_dfs] == [
+        [account] for account in account_queries
+    ]
+    assert [df[1].tolist() for df in balances_dfs] == [
+        [len(account)] for account in account_queries
+    ]
+    nr_running: List[int] = [
+        int(line) for line in log_filepath.read_text().split()
+    ]
+    assert len(nr_running) == len(account_queries)
+    assert max(nr_running) == 2
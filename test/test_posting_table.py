@@ -0,0 +1,89 @@
+"""Tests whether the posting table of a journal with included files is the
+same when the leaf files are parsed in a process pool."""
+
+from pathlib import Path
+from typing import Dict
+
+import pandas as pd
+
+from hledger_plot.journal_parsing.posting_table import (
+    get_posting_table_from_journal,
+)
+
+journal_files: Dict[str, str] = {
+    "main.journal": """; main journal
+include 2023/bank.journal
+
+2024-01-05 Opening balances
+    assets:bank:checking      1000.00 EUR
+    equity:opening
+
+include 2024/all.journal
+    expenses:fees    1 EUR
+
+2024-01-15 Stocks
+    assets:broker:stocks   10 ACME @ 12.5 EUR
+    assets:bank:checking  -125 EUR
+include 2023/bank.journal
+""",
+    "2023/bank.journal": """2023-03-01 Rent
+    expenses:housing:rent    800 USD
+    liabilities:creditcard
+
+comment
+include missing.journal
+end comment
+2023-03-05 Gift
+    expenses:gifts    20 EUR  ; tag:x
+    assets:cash
+""",
+    "2024/all.journal": """include cash.journal
+2024-01-10 Salary
+    assets:bank:checking      2500,00 EUR
+    income:salary
+""",
+    "2024/cash.journal": """2024-02-01 Groceries
+    expenses:food:groceries     45.20 EUR @@ 50 USD
+    assets:cash
+""",
+}
+
+
+def write_journal(*, journal_dir: Path) -> str:
+    for filename, content in journal_files.items():
+        filepath: Path = journal_dir / filename
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        filepath.write_text(content, encoding="utf-8")
+    return str(journal_dir / "main.journal")
+
+
+def test_parallel_posting_table_equals_serial(tmp_path: Path) -> None:
+    journal_filepath: str = write_journal(journal_dir=tmp_path)
+
+    serial_table = get_posting_table_from_journal(
+        journal_filepath=journal_filepath, max_workers=1
+    )
+    parallel_table = get_posting_table_from_journal(
+        journal_filepath=journal_filepath, max_workers=2
+    )
+
+    pd.testing.assert_frame_equal(parallel_table, serial_table)
+    # The leaf bank.journal is included twice.
+    assert (serial_table["description"] == "Rent").sum() == 4
+
+
+def test_posting_after_include_belongs_to_included_transaction(
+    tmp_path: Path,
+) -> None:
+    journal_filepath: str = write_journal(journal_dir=tmp_path)
+
+    table = get_posting_table_from_journal(
+        journal_filepath=journal_filepath, max_workers=2
+    )
+
+    fee = table[table["account"] == "expenses:fees"].iloc[0]
+    assert fee["description"] == "Salary"
+    assert (
+        fee["transaction"]
+        == table.loc[table["account"] == "income:salary", "transaction"].iloc[0]
+    )
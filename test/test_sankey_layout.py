@@ -0,0 +1,113 @@
+"""Tests whether the layered Sankey layout places the nodes in longest-path
+columns, and stacks the nodes of a column without overlap."""
+
+from typing import List
+
+import numpy as np
+
+from hledger_plot.create_plots.sankey_layout import (
+    NodePositions,
+    get_node_columns,
+    layered_layout,
+    max_coordinate,
+    min_coordinate,
+    node_padding_fraction,
+    stack_nodes,
+)
+
+
+def test_nodes_are_in_the_column_of_their_longest_path() -> None:
+    # 0 -> 1 -> 2 -> 3, with the shortcut 0 -> 2 and a second root 4 -> 3.
+    columns: np.ndarray = get_node_columns(
+        nr_of_nodes=5,
+        sources=np.array([0, 1, 0, 2, 4]),
+        targets=np.array([1, 2, 2, 3, 3]),
+    )
+
+    assert columns.tolist() == [0, 1, 2, 3, 0]
+
+
+def test_cycle_does_not_loop() -> None:
+    # 1 and 2 link to each other, so neither is ever without incoming links.
+    columns: np.ndarray = get_node_columns(
+        nr_of_nodes=4,
+        sources=np.array([0, 1, 2, 2]),
+        targets=np.array([1, 2, 1, 3]),
+    )
+
+    assert columns.tolist() == [0, 1, 0, 0]
+    positions: NodePositions = layered_layout(
+        nr_of_nodes=4,
+        sources=np.array([0, 1, 2, 2]),
+        targets=np.array([1, 2, 1, 3]),
+        values=np.array([1.0, 1.0, 1.0, 1.0]),
+    )
+    assert positions is not None
+    assert len(positions[0]) == len(positions[1]) == 4
+
+
+def test_stacked_nodes_do_not_overlap() -> None:
+    node_values: np.ndarray = np.array([3.0, 1.0, 0.5, 2.0])
+
+    centres: np.ndarray = stack_nodes(node_values=node_values)
+
+    total_height: float = node_values.sum() * (
+        1 + node_padding_fraction * (len(node_values) - 1)
+    )
+    half_heights: np.ndarray = node_values / total_height / 2
+    tops: np.ndarray = centres - half_heights
+    bottoms: np.ndarray = centres + half_heights
+    assert tops[0] >= 0
+    assert bottoms[-1] <= 1
+    assert (bottoms[:-1] < tops[1:]).all()
+
+
+def test_nodes_without_value_are_spread_evenly() -> None:
+    centres: np.ndarray = stack_nodes(node_values=np.zeros(4))
+
+    assert centres.tolist() == [0.125, 0.375, 0.625, 0.875]
+
+
+def test_coordinates_are_in_node_order() -> None:
+    # Node 4 is the root, nodes 0 and 1 are its children, and nodes 3 and 2
+    # are their respective children.
+    sources: np.ndarray = np.array([4, 4, 1, 0])
+    targets: np.ndarray = np.array([0, 1, 2, 3])
+
+    positions: NodePositions = layered_layout(
+        nr_of_nodes=5,
+        sources=sources,
+        targets=targets,
+        values=np.array([3.0, 1.0, 1.0, 3.0]),
+    )
+
+    assert positions is not None
+    x_coords: List[float] = positions[0]
+    y_coords: List[float] = positions[1]
+    assert x_coords == [
+        0.5,
+        0.5,
+        max_coordinate,
+        max_coordinate,
+        min_coordinate,
+    ]
+    assert y_coords[4] == 0.5
+    # The children are stacked in the order of their parents.
+    assert y_coords[0] < y_coords[1]
+    assert y_coords[3] < y_coords[2]
+
+
+def test_nodes_follow_the_parent_of_their_first_incoming_link() -> None:
+    # Node 2 is first linked from root 1, below root 0, so it is placed below
+    # node 3, although root 0 also links to it.
+    positions: NodePositions = layered_layout(
+        nr_of_nodes=4,
+        sources=np.array([0, 1, 0]),
+        targets=np.array([3, 2, 2]),
+        values=np.array([1.0, 1.0, 1.0]),
+    )
+
+    assert positions is not None
+    y_coords: List[float] = positions[1]
+    assert y_coords[0] < y_coords[1]
+    assert y_coords[3] < y_coords[2]
@@ -0,0 +1,103 @@
+"""Tests whether an account gets the same pseudonym in every plot of a run,
+and across runs through the map file."""
+
+import hashlib
+import hmac
+from pathlib import Path
+from typing import Dict, List
+
+import pandas as pd
+
+from hledger_plot.create_plots.scrambler import (
+    Pseudonymizer,
+    scramble_sankey_data,
+)
+
+random_words: List[str] = [f"word{index}" for index in range(50)]
+
+
+def scramble_accounts(
+    *, pseudonymizer: Pseudonymizer, accounts: List[str]
+) -> Dict[str, str]:
+    sankey_df: pd.DataFrame = pd.DataFrame(
+        {"source": accounts, "value": [1.0] * len(accounts)}
+    )
+    scrambled_df, _ = scramble_sankey_data(
+        sankey_df=sankey_df,
+        pseudonymizer=pseudonymizer,
+        top_level_categories=["expenses", "income"],
+        separator="BALANCE-LINE",
+        text_column_headers=["source"],
+        numeric_column_headers=["value"],
+    )
+    return dict(zip(accounts, scrambled_df["source"]))
+
+
+def test_account_has_the_same_pseudonym_in_every_plot() -> None:
+    pseudonymizer: Pseudonymizer = Pseudonymizer(
+        random_words=random_words, key=b"secret"
+    )
+
+    sankey_accounts: Dict[str, str] = scramble_accounts(
+        pseudonymizer=pseudonymizer,
+        accounts=["expenses:food:groceries", "income:salary"],
+    )
+    treemap_accounts: Dict[str, str] = scramble_accounts(
+        pseudonymizer=pseudonymizer,
+        accounts=["expenses:rent", "expenses:food", "income:salary"],
+    )
+
+    food: str = sankey_accounts["expenses:food:groceries"].split(":")[1]
+    assert food != "food"
+    assert treemap_accounts["expenses:food"] == f"expenses:{food}"
+    assert treemap_accounts["income:salary"] == sankey_accounts["income:salary"]
+    assert treemap_accounts["expenses:rent"] != "expenses:rent"
+
+
+def test_account_keeps_its_pseudonym_across_runs(tmp_path: Path) -> None:
+    map_filepath: str = str(tmp_path / "pseudonyms.json")
+    first_run: Pseudonymizer = Pseudonymizer(
+        random_words=random_words, key=b"secret", map_filepath=map_filepath
+    )
+    first_pseudonyms: Dict[str, str] = first_run.get_scrambler_map(
+        categories=["salary", "groceries"]
+    )
+    first_run.store()
+
+    # Another key and a new account taking the words first would give other
+    # pseudonyms, if they were not read from the map file.
+    second_run: Pseudonymizer = Pseudonymizer(
+        random_words=list(reversed(random_words)),
+        key=b"other secret",
+        map_filepath=map_filepath,
+    )
+    second_pseudonyms: Dict[str, str] = second_run.get_scrambler_map(
+        categories=["groceries", "rent", "salary"]
+    )
+
+    assert second_pseudonyms["salary"] == first_pseudonyms["salary"]
+    assert second_pseudonyms["groceries"] == first_pseudonyms["groceries"]
+    assert second_pseudonyms["rent"] not in first_pseudonyms.values()
+
+
+def test_taken_words_are_skipped_like_linear_probing() -> None:
+    categories: List[str] = [f"category{index}" for index in range(50)]
+    pseudonymizer: Pseudonymizer = Pseudonymizer(
+        random_words=random_words, key=b"secret"
+    )
+
+    pseudonyms: Dict[str, str] = pseudonymizer.get_scrambler_map(
+        categories=categories
+    )
+
+    # New categories are added in sorted order.
+    used_words: set[str] = set()
+    for category in sorted(categories):
+        digest: bytes = hmac.new(
+            b"secret", category.encode("utf-8"), hashlib.sha256
+        ).digest()
+        index: int = int.from_bytes(digest[:8], "big") % len(random_words)
+        while random_words[index] in used_words:
+            index = (index + 1) % len(random_words)
+        used_words.add(random_words[index])
+        assert pseudonyms[category] == random_words[index]